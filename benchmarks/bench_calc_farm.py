@@ -0,0 +1,67 @@
+from .common import create_algo
+
+
+class CalcFarmSizes:
+    """
+    Benchmarks calc_farm for growing numbers
+    of turbines and states.
+    """
+
+    params = ([10, 100, 1000], [1, 100, 10000, 100000])
+    param_names = ["n_turbines", "n_states"]
+    timeout = 3600
+
+    def setup(self, n_turbines, n_states):
+        if n_turbines * n_states > 1e7:
+            raise NotImplementedError("Case too large")
+        self.algo = create_algo(n_turbines, n_states)
+
+    def time_calc_farm(self, n_turbines, n_states):
+        self.algo.calc_farm()
+
+    def peakmem_calc_farm(self, n_turbines, n_states):
+        self.algo.calc_farm()
+
+
+class CalcFarmModels:
+    """
+    Benchmarks calc_farm for combinations of
+    rotor, partial wakes and wake frame models.
+
+    The wake models are chosen to fit the partial
+    wakes models, and invalid combinations are skipped,
+    as well as streamlines for rotor points based partial
+    wakes on grid rotors, which exceed the memory.
+    """
+
+    params = (
+        ["centre", "grid16", "grid100"],
+        ["rotor_points", "top_hat", "axiwake6", "distsliced"],
+        ["rotor_wd", "streamlines_100", "yawed"],
+    )
+    param_names = ["rotor", "pwakes", "frame"]
+    timeout = 1800
+
+    n_turbines = 100
+    n_states = 100
+
+    def setup(self, rotor, pwakes, frame):
+        if pwakes == "distsliced" and rotor == "centre":
+            raise NotImplementedError("Partial wakes require a grid rotor")
+        if frame == "yawed" and pwakes in ["top_hat", "axiwake6"]:
+            raise NotImplementedError("Yawed wakes are not axisymmetric")
+        if (
+            frame.startswith("streamlines")
+            and rotor != "centre"
+            and pwakes in ["rotor_points", "distsliced"]
+        ):
+            raise NotImplementedError("Case too large")
+        self.algo = create_algo(
+            self.n_turbines, self.n_states, rotor=rotor, pwakes=pwakes, frame=frame
+        )
+
+    def time_calc_farm(self, rotor, pwakes, frame):
+        self.algo.calc_farm()
+
+    def peakmem_calc_farm(self, rotor, pwakes, frame):
+        self.algo.calc_farm()
@@ -0,0 +1,61 @@
+from .common import create_algo, create_points
+
+
+class CalcPointsSizes:
+    """
+    Benchmarks calc_points for growing numbers
+    of turbines, states and points.
+    """
+
+    params = ([10, 100, 1000], [1, 100, 10000], [1000, 100000])
+    param_names = ["n_turbines", "n_states", "n_points"]
+    timeout = 3600
+
+    def setup(self, n_turbines, n_states, n_points):
+        if n_states * n_points > 1e8 or n_turbines * n_states > 1e7:
+            raise NotImplementedError("Case too large")
+        self.algo = create_algo(n_turbines, n_states)
+        self.farm_results = self.algo.calc_farm()
+        self.points = create_points(self.algo, n_points)
+
+    def time_calc_points(self, n_turbines, n_states, n_points):
+        self.algo.calc_points(self.farm_results, self.points)
+
+    def peakmem_calc_points(self, n_turbines, n_states, n_points):
+        self.algo.calc_points(self.farm_results, self.points)
+
+
+class CalcPointsModels:
+    """
+    Benchmarks calc_points for combinations of
+    rotor and wake frame models.
+
+    Streamlines are only combined with the centre
+    rotor, since grid rotors exceed the memory.
+    """
+
+    params = (
+        ["centre", "grid16", "grid100"],
+        ["rotor_wd", "streamlines_100", "yawed"],
+    )
+    param_names = ["rotor", "frame"]
+    timeout = 1800
+
+    n_turbines = 100
+    n_states = 100
+    n_points = 1000
+
+    def setup(self, rotor, frame):
+        if frame.startswith("streamlines") and rotor != "centre":
+            raise NotImplementedError("Case too large")
+        self.algo = create_algo(
+            self.n_turbines, self.n_states, rotor=rotor, frame=frame
+        )
+        self.farm_results = self.algo.calc_farm()
+        self.points = create_points(self.algo, self.n_points)
+
+    def time_calc_points(self, rotor, frame):
+        self.algo.calc_points(self.farm_results, self.points)
+
+    def peakmem_calc_points(self, rotor, frame):
+        self.algo.calc_points(self.farm_results, self.points)
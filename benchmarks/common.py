@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+TURBINE_FILE = "NREL-5MW-D126-H90.csv"
+D = 126.0
+H = 90.0
+
+# compatible wake models of the partial wakes models:
+PWAKES_WAKES = {
+    "rotor_points": "Bastankhah_linear_k002",
+    "top_hat": "Jensen_linear_k007",
+    "axiwake6": "Bastankhah_linear_k002",
+    "distsliced": "Bastankhah_linear_k002",
+}
+
+
+def create_states(n_states, seed=42):
+    """
+    Creates reproducible random states.
+
+    Parameters
+    ----------
+    n_states: int
+        The number of states
+    seed: int
+        The random seed
+
+    Returns
+    -------
+    states: foxes.input.states.StatesTable
+        The states
+
+    """
+    rng = np.random.default_rng(seed)
+    sdata = pd.DataFrame(
+        {
+            "ws": rng.uniform(4.0, 20.0, n_states),
+            "wd": rng.uniform(0.0, 360.0, n_states),
+            "ti": rng.uniform(0.04, 0.12, n_states),
+        }
+    )
+    sdata.index.name = FC.STATE
+
+    return foxes.input.states.StatesTable(
+        data_source=sdata,
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "ws", FV.WD: "wd", FV.TI: "ti"},
+        fixed_vars={FV.RHO: 1.225},
+    )
+
+
+def create_farm(n_turbines, tmodels):
+    """
+    Creates a square grid farm with 5D spacing.
+
+    Parameters
+    ----------
+    n_turbines: int
+        The number of turbines
+    tmodels: list of str
+        The turbine models
+
+    Returns
+    -------
+    farm: foxes.WindFarm
+        The wind farm
+
+    """
+    nx = int(np.ceil(np.sqrt(n_turbines)))
+    ny = int(np.ceil(n_turbines / nx))
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([0.0, 0.0]),
+        step_vectors=np.array([[5 * D, 0.0], [0.0, 5 * D]]),
+        steps=[nx, ny],
+        turbine_models=tmodels,
+        verbosity=0,
+    )
+    farm.turbines = farm.turbines[:n_turbines]
+
+    return farm
+
+
+def create_algo(
+    n_turbines,
+    n_states,
+    rotor="centre",
+    pwakes="rotor_points",
+    frame="rotor_wd",
+    wakes=None,
+    chunks={FC.STATE: 1000},
+):
+    """
+    Creates a Downwind algorithm for benchmarks.
+
+    Parameters
+    ----------
+    n_turbines: int
+        The number of turbines
+    n_states: int
+        The number of states
+    rotor: str
+        The rotor model
+    pwakes: str
+        The partial wakes model
+    frame: str
+        The wake frame
+    wakes: list of str, optional
+        The wake models, or None for a wake
+        model that fits the partial wakes model
+    chunks: dict
+        The chunks choice
+
+    Returns
+    -------
+    algo: foxes.algorithms.Downwind
+        The algorithm
+
+    """
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(TURBINE_FILE)
+    mbook.turbine_types[ttype.name] = ttype
+
+    if wakes is None:
+        wakes = [PWAKES_WAKES[pwakes]]
+
+    # yawed wakes require yaw misalignment and TI dependent k:
+    tmodels = [ttype.name]
+    if "yawed" in frame:
+        rng = np.random.default_rng(42)
+        yawm = rng.uniform(-20.0, 20.0, (n_states, n_turbines))
+        mbook.turbine_models["set_yawm"] = foxes.models.turbine_models.SetFarmVars()
+        mbook.turbine_models["set_yawm"].add_var(FV.YAWM, yawm)
+        tmodels = ["set_yawm", "yawm2yaw", "kTI_02"] + tmodels
+        wakes = ["PorteAgel_linear"]
+
+    return foxes.algorithms.Downwind(
+        mbook,
+        create_farm(n_turbines, tmodels),
+        states=create_states(n_states),
+        rotor_model=rotor,
+        wake_models=wakes,
+        wake_frame=frame,
+        partial_wakes_model=pwakes,
+        chunks=chunks,
+        verbosity=0,
+    )
+
+
+def create_points(algo, n_points, seed=42):
+    """
+    Creates random points within the farm region.
+
+    Parameters
+    ----------
+    algo: foxes.core.Algorithm
+        The algorithm, with initialized states
+    n_points: int
+        The number of points
+    seed: int
+        The random seed
+
+    Returns
+    -------
+    points: numpy.ndarray
+        The points, shape: (n_states, n_points, 3)
+
+    """
+    xy = np.array([t.xy for t in algo.farm.turbines])
+    pmin = np.min(xy, axis=0) - 5 * D
+    pmax = np.max(xy, axis=0) + 10 * D
+
+    rng = np.random.default_rng(seed)
+    points = np.zeros((n_points, 3), dtype=FC.DTYPE)
+    points[:, :2] = pmin[None, :] + rng.uniform(0, 1, (n_points, 2)) * (pmax - pmin)
+    points[:, 2] = H
+
+    return np.broadcast_to(points[None], (algo.n_states, n_points, 3)).copy()
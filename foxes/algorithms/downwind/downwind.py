@@ -1,3 +1,6 @@
+import warnings
+import numpy as np
+
 from foxes.core import Algorithm, FarmDataModelList
 from foxes.core import PointDataModel, PointDataModelList
 import foxes.algorithms.downwind.models as dm
@@ -36,15 +39,42 @@ class Downwind(Algorithm):
     farm_controller : str
         The farm controller. Will be
         looked up in the model book
-    chunks : dict
+    chunks : dict or str
         The chunks choice for running in parallel with dask,
-        e.g. `{"state": 1000}` for chunks of 1000 states
+        e.g. `{"state": 1000}` for chunks of 1000 states.
+        Point calculations can also be chunked along points,
+        e.g. `{"state": 100, "point": 5000}`. Choose "auto" for
+        chunks that fit the memory budget
     dbook : foxes.DataBook, optional
         The data book, or None for default
     keep_models : list of str
         Keep these models data in memory and do not finalize them
     verbosity : int
         The verbosity level, 0 means silent
+    mem_budget : int or str
+        The memory budget per chunk, in bytes or as
+        string with units, e.g. "500MB". Only used
+        for `chunks="auto"`
+    cache : foxes.utils.ResultsCache or str, optional
+        The results cache, or the path to its
+        directory
+    engine : str
+        The calculation engine: "dask" for chunked
+        calculations, "numpy" for in-memory
+        calculations without dask overhead,
+        "process" for state chunks in a process pool,
+        or "thread" for state chunks in a thread pool
+    n_workers : int, optional
+        The number of workers of the process and thread
+        engines, None for the number of CPUs
+    profiler : foxes.utils.Profiler, optional
+        The profiler of model calculations. Memory
+        measurements are not supported by the
+        thread engine
+    precision : str
+        The precision of working arrays and results,
+        "float64" or "float32". Input data, point
+        coordinates and accumulations always use float64
 
     Attributes
     ----------
@@ -62,9 +92,14 @@ class Downwind(Algorithm):
         The farm controller
     n_states : int
         The number of states
+    MEM_FACTOR : float
+        Safety factor for temporary arrays in the
+        memory estimate for automatic chunks
 
     """
 
+    MEM_FACTOR = 3
+
     FarmWakesCalculation = dm.FarmWakesCalculation
     PointWakesCalculation = dm.point_wakes_calc.PointWakesCalculation
     SetAmbPointResults = dm.set_amb_point_results.SetAmbPointResults
@@ -83,8 +118,27 @@ class Downwind(Algorithm):
         dbook=None,
         keep_models=[],
         verbosity=1,
+        mem_budget="1GB",
+        cache=None,
+        engine="dask",
+        n_workers=None,
+        profiler=None,
+        precision="float64",
     ):
-        super().__init__(mbook, farm, chunks, verbosity, dbook, keep_models)
+        super().__init__(
+            mbook,
+            farm,
+            chunks,
+            verbosity,
+            dbook,
+            keep_models,
+            mem_budget,
+            cache,
+            engine,
+            n_workers,
+            profiler,
+            precision,
+        )
 
         self.states = states
         self.n_states = None
@@ -167,6 +221,154 @@ class Downwind(Algorithm):
 
         self.update_idata(mdls)
 
+    def uses_state_indices(self, algo=None):
+        """
+        Flag for algorithms whose models depend on the
+        state index, beyond the state variables.
+
+        Algorithms that cannot confirm that none of
+        their models do return True.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm, optional
+            The calculation algorithm, defaults to self
+
+        Returns
+        -------
+        flag: bool
+            True if the models depend on the state indices
+
+        """
+        algo = self if algo is None else algo
+
+        mdls = [
+            self.rotor_model,
+            self.farm_controller,
+            self.wake_frame,
+            self.partial_wakes_model,
+        ] + self.wake_models
+
+        for t in self.farm.turbines:
+            if any([ssel is not None for ssel in t.mstates_sel]):
+                return True
+            for mname in t.models:
+                if mname in self.mbook.turbine_types:
+                    mdls.append(self.mbook.turbine_types[mname])
+                elif mname in self.mbook.turbine_models:
+                    mdls.append(self.mbook.turbine_models[mname])
+                else:
+                    return True
+
+        return any([m.uses_state_indices(algo) for m in mdls])
+
+    def set_auto_chunks(self, n_points=None, point_vars=None):
+        """
+        Updates the chunk sizes, in case of
+        automatic chunks.
+
+        Automatic states chunk sizes are rounded down to
+        a multiple of the storage chunk size of the states
+        data, if any, such that each chunk reads whole
+        storage chunks. Explicit states chunk sizes that
+        are not aligned raise a warning.
+
+        Parameters
+        ----------
+        n_points : int, optional
+            The number of evaluation points, for point
+            calculations
+        point_vars : list of str, optional
+            The point variables, for point calculations
+
+        """
+        super().set_auto_chunks(n_points, point_vars)
+
+        n_c = self.states.storage_chunk_size()
+        if (
+            n_c is not None
+            and self.chunks is not None
+            and self.chunks.get(FC.STATE, None) is not None
+            and self.states.dedup_data() is None
+        ):
+            n_s = self.chunks[FC.STATE]
+            n_a = max(n_s // n_c, 1) * n_c
+            if n_a == n_s or (self.n_states is not None and n_s >= self.n_states):
+                pass
+            elif self.auto_chunks:
+                self.chunks = dict(self.chunks)
+                self.chunks[FC.STATE] = n_a
+                self.print(
+                    f"Algorithm '{self.name}': Aligned states chunks with storage chunks of size {n_c}, chunks = {self.chunks}"
+                )
+            else:
+                warnings.warn(
+                    f"Algorithm '{self.name}': States chunk size {n_s} is not a multiple of the storage chunk size {n_c} of states '{self.states.name}', storage chunks will be read repeatedly. Consider chunks={{'{FC.STATE}': {n_a}}}"
+                )
+
+    def estimate_state_bytes(self, n_points=None, point_vars=None):
+        """
+        Estimates the memory requirement of a single state
+        during calculations.
+
+        Parameters
+        ----------
+        n_points : int, optional
+            The number of evaluation points, for point
+            calculations
+        point_vars : list of str, optional
+            The point variables, for point calculations
+
+        Returns
+        -------
+        n_bytes : int
+            The estimated memory per state in bytes
+
+        """
+        n_svars = len(self.states.output_point_vars(self))
+        n_fvars = len(self.farm_vars)
+
+        # farm data, including ambient results:
+        n = 2 * n_fvars * self.n_turbines
+
+        if n_points is None:
+            n_rpoints = self.rotor_model.n_rotor_points()
+            n_wpoints = self.partial_wakes_model.n_wake_points(self)
+
+            # rotor points, their data and the rotor results:
+            n += (3 + n_svars) * n_rpoints * self.n_turbines + n_fvars
+
+            # wake evaluation points, wake coordinates and wake deltas:
+            n += (6 + n_svars) * n_wpoints * self.n_turbines
+
+        else:
+            # evaluation points, their data and wake deltas:
+            n_pvars = n_svars if point_vars is None else len(point_vars)
+            n += (6 + 3 * n_pvars) * n_points
+
+        return int(self.MEM_FACTOR * n * self.dtype.itemsize)
+
+    def _cache_key(self, *objs):
+        """
+        Helper function that creates the results cache key
+        """
+        mdls = [
+            self.states,
+            self.rotor_model,
+            self.farm_controller,
+            self.wake_frame,
+            self.partial_wakes_model,
+        ] + self.wake_models
+
+        return self.cache.key(
+            type(self).__name__,
+            self.farm.turbine_names,
+            [t.mstates_sel for t in self.farm.turbines],
+            self.farm,
+            mdls,
+            *objs,
+        )
+
     def _collect_farm_models(
         self,
         vars_to_amb,
@@ -240,6 +442,7 @@ class Downwind(Algorithm):
         persist=True,
         finalize=True,
         ambient=False,
+        out_file=None,
     ):
         """
         Calculate farm data.
@@ -259,6 +462,10 @@ class Downwind(Algorithm):
             Flag for finalization after calculation
         ambient : bool
             Flag for ambient instead of waked calculation
+        out_file : str, optional
+            Path to a '.nc' or '.zarr' file. If given, the
+            results are written to it state chunk by state
+            chunk, and the lazily opened file is returned
 
         Returns
         -------
@@ -281,6 +488,7 @@ class Downwind(Algorithm):
 
         # initialize models and get input model data:
         self.update_idata(mlist)
+        self.set_auto_chunks()
         models_data = self.get_models_data()
         if persist:
             models_data = models_data.persist()
@@ -288,28 +496,54 @@ class Downwind(Algorithm):
         self.print(f"\nOutput farm variables:", ", ".join(self.farm_vars))
         self.print(f"\nChunks: {self.chunks}\n")
 
+        # look up cached results:
+        ckey = None
+        farm_results = None
+        if self.cache is not None and out_file is None:
+            ckey = self._cache_key(
+                "calc_farm", mlist, calc_pars, vars_to_amb, ambient, models_data
+            )
+            farm_results = self.cache.load(ckey)
+            if farm_results is not None:
+                self.print(f"\nLoaded cached results '{ckey}'")
+
         # run main calculation:
-        self.print(
-            f"\nCalculating {self.n_states} states for {self.n_turbines} turbines"
-        )
-        farm_results = mlist.run_calculation(
-            self, models_data, out_vars=self.farm_vars, parameters=calc_pars
-        )
-        farm_results[FC.TNAME] = ((FC.TURBINE,), self.farm.turbine_names)
-        if FV.ORDER in farm_results:
-            farm_results[FV.ORDER] = farm_results[FV.ORDER].astype(FC.ITYPE)
+        if farm_results is None:
+            self.print(
+                f"\nCalculating {self.n_states} states for {self.n_turbines} turbines"
+            )
+            farm_results = mlist.run_calculation(
+                self,
+                models_data,
+                out_vars=self.farm_vars,
+                parameters=calc_pars,
+                compute=out_file is None,
+            )
+            farm_results[FC.TNAME] = ((FC.TURBINE,), self.farm.turbine_names)
+            if FV.ORDER in farm_results:
+                farm_results[FV.ORDER] = farm_results[FV.ORDER].astype(FC.ITYPE)
+
+            # map back to original states, in case of deduplication:
+            farm_results = self.states.expand_results(farm_results)
+
+            if ambient:
+                dvars = [v for v in farm_results.data_vars.keys() if v in FV.var2amb]
+                farm_results = farm_results.drop_vars(dvars)
+
+            if ckey is not None:
+                self.cache.store(ckey, farm_results)
         del models_data
 
+        # stream results to file, before models are finalized:
+        if out_file is not None:
+            farm_results = self.write_results(farm_results, out_file)
+
         # finalize models:
         if finalize:
             self.print("\n")
             self.finalize_model(mlist)
             self.finalize()
 
-        if ambient:
-            dvars = [v for v in farm_results.data_vars.keys() if v in FV.var2amb]
-            farm_results = farm_results.drop_vars(dvars)
-
         return farm_results
 
     def _collect_point_models(
@@ -391,7 +625,12 @@ class Downwind(Algorithm):
             The farm results. The calculated variables have
             dimensions (state, turbine)
         points : numpy.ndarray
-            The points of interest, shape: (n_states, n_points, 3)
+            The points of interest, shape: (n_states, n_points, 3),
+            or (n_points, 3) for state-invariant points, which
+            are broadcast lazily. For deduplicated states, also
+            points for the original states are accepted if
+            identical for merged states, and the results are
+            mapped back
         vars : list of str, optional
             The variables that should be kept in the output,
             or `None` for all
@@ -430,15 +669,25 @@ class Downwind(Algorithm):
             )
 
         # welcome:
-        self._print_deco("calc_points", n_points=points.shape[1])
+        n_points = points.shape[-2]
+        self._print_deco("calc_points", n_points=n_points)
 
         # collect models:
         mlist, calc_pars = self._collect_point_models(
             vars, vars_to_amb, calc_parameters, point_models, ambient
         )
 
+        # extend the states data region to the points, if required:
+        if self.states.update_region(self, points):
+            self.finalize_model(self.states)
+            self.init_states()
+
         # initialize models and get input model data:
         self.update_idata(mlist)
+        self.set_auto_chunks(
+            n_points=n_points,
+            point_vars=mlist.output_point_vars(self) if vars is None else vars,
+        )
         models_data = self.get_models_data()
         if persist_mdata:
             models_data = models_data.persist()
@@ -446,8 +695,34 @@ class Downwind(Algorithm):
         self.print(f"\nOutput farm variables:", ", ".join(self.farm_vars))
         self.print(f"\nChunks: {self.chunks}\n")
 
-        # chunk farm results:
-        if self.chunks is not None:
+        # select deduplicated states, if applicable:
+        if farm_results is not None:
+            farm_results = self.states.reduce_results(farm_results)
+        dedup = self.states.dedup_data()
+        invariant = len(points.shape) == 2
+        expand = dedup is not None and (
+            invariant
+            or (
+                points.shape[0] != self.n_states
+                and points.shape[0] == len(dedup["inverse"])
+            )
+        )
+        if expand and not invariant:
+            points0 = points
+            points = points0[dedup["sel"]]
+            if not np.all(points[dedup["inverse"]] == points0):
+                raise ValueError(
+                    f"Algorithm '{self.name}': Points differ between states that have been merged by deduplication, please provide points of shape {(self.n_states,) + points.shape[1:]}"
+                )
+            del points0
+
+        # chunk farm results, point chunks will
+        # receive the full turbine data of their states:
+        if (
+            self.chunks is not None
+            and self.engine == "dask"
+            and FC.STATE in self.chunks
+        ):
             farm_results = farm_results.chunk(chunks={FC.STATE: self.chunks[FC.STATE]})
         self.print("\nInput farm data:\n\n", farm_results, "\n")
 
@@ -473,18 +748,50 @@ class Downwind(Algorithm):
         self.print(f"\nOutput point variables:", ", ".join(vars))
         self.print(f"\nChunks: {self.chunks}\n")
 
+        # look up cached results:
+        ckey = None
+        point_results = None
+        if self.cache is not None:
+            ckey = self._cache_key(
+                "calc_points",
+                mlist,
+                calc_pars,
+                vars,
+                vars_to_amb,
+                ambient,
+                expand,
+                models_data,
+                farm_results,
+                points,
+            )
+            point_results = self.cache.load(ckey)
+            if point_results is not None:
+                self.print(f"Loaded cached results '{ckey}'")
+
         # calculate:
-        self.print(
-            f"Calculating {len(vars)} variables at {points.shape[1]} points in {self.n_states} states"
-        )
-        point_results = mlist.run_calculation(
-            self,
-            models_data,
-            farm_results,
-            point_data,
-            out_vars=vars,
-            parameters=calc_pars,
-        )
+        if point_results is None:
+            self.print(
+                f"Calculating {len(vars)} variables at {n_points} points in {self.n_states} states"
+            )
+            point_results = mlist.run_calculation(
+                self,
+                models_data,
+                farm_results,
+                point_data,
+                out_vars=vars,
+                parameters=calc_pars,
+            )
+
+            # map back to original states, in case of deduplication:
+            if expand:
+                point_results = self.states.expand_results(point_results)
+
+            if ambient:
+                dvars = [v for v in point_results.data_vars.keys() if v in FV.var2amb]
+                point_results = point_results.drop_vars(dvars)
+
+            if ckey is not None:
+                self.cache.store(ckey, point_results)
         del models_data, farm_results, point_data
 
         # finalize models:
@@ -493,10 +800,6 @@ class Downwind(Algorithm):
             mlist.finalize(self, self.verbosity)
             self.finalize()
 
-        if ambient:
-            dvars = [v for v in point_results.data_vars.keys() if v in FV.var2amb]
-            point_results = point_results.drop_vars(dvars)
-
         return point_results
 
     def finalize(self, clear_mem=False):
@@ -128,7 +128,9 @@ class PointWakesCalculation(PointDataModel):
             wcoos = algo.wake_frame.get_wake_coos(algo, mdata, fdata, o, points)
 
             for w in wmodels:
-                w.contribute_to_wake_deltas(algo, mdata, fdata, o, wcoos, wdeltas)
+                w.contribute_to_wake_deltas_in_reach(
+                    algo, mdata, fdata, o, wcoos, wdeltas
+                )
 
         amb_res = {v: pdata[FV.var2amb[v]] for v in wdeltas}
         for w in wmodels:
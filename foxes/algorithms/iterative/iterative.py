@@ -1,4 +1,5 @@
 from foxes.algorithms.downwind.downwind import Downwind
+import foxes.variables as FV
 from .models import DefaultConv, LoopRunner, FarmWakesCalculation
 
 
@@ -12,37 +13,57 @@ class Iterative(Downwind):
     ----------
     args : tuple, optional
         Arguments for the Downwind algorithm
-    conv : foxes.algorithm.iterative.models.ConvCrit
+    conv : foxes.algorithms.iterative.models.ConvCrit
         The convergence criteria
     max_its : int, optional
         Set the maximal number of iterations, None means
         number of turbines + 1
     conv_error : bool
         Throw error if not converging
+    state_masking : bool
+        Only iterate states that have not yet converged
+    accel : foxes.algorithms.iterative.models.ConvAccel, optional
+        The convergence accelerator, e.g. `Relaxation`,
+        `Aitken` or `Anderson`
     kwargs : dict, optional
         Keyword arguments for the Downwind algorithm
 
     Attributes
     ----------
-    conv : foxes.algorithm.iterative.convergence.ConvCrit
+    conv : foxes.algorithms.iterative.convergence.ConvCrit
         The convergence criteria
     max_its : int
         Set the maximal number of iterations, None means
         number of turbines + 1
     conv_error : bool
         Throw error if not converging
+    state_masking : bool
+        Only iterate states that have not yet converged
+    accel : foxes.algorithms.iterative.models.ConvAccel
+        The convergence accelerator, or None
 
     """
 
     FarmWakesCalculation = FarmWakesCalculation
 
     def __init__(
-        self, *args, conv=DefaultConv(), max_its=None, conv_error=True, **kwargs
+        self,
+        *args,
+        conv=DefaultConv(),
+        max_its=None,
+        conv_error=True,
+        state_masking=True,
+        accel=None,
+        **kwargs,
     ):
         super().__init__(*args, **kwargs)
         self.conv = conv
         self.max_its = max_its
         self.conv_error = conv_error
+        self.state_masking = state_masking
+        self.accel = accel
+
+        self._init_results = None
 
     def _collect_farm_models(
         self,
@@ -64,6 +85,10 @@ class Iterative(Downwind):
             mlist.models,
             max_its=self.max_its,
             conv_error=self.conv_error,
+            state_masking=self.state_masking,
+            accel=self.accel,
+            init_results=None if ambient else self._init_results,
+            init_vars=[FV.REWS, FV.TI] if self.accel is None else self.accel.vars,
             verbosity=self.verbosity - 1,
         )
 
@@ -71,3 +96,32 @@ class Iterative(Downwind):
         mlist.model_wflag[-1] = True
 
         return mlist, calc_pars
+
+    def calc_farm(self, *args, init_results=None, **kwargs):
+        """
+        Calculate farm data.
+
+        Parameters
+        ----------
+        args : tuple, optional
+            Arguments for the Downwind calc_farm function
+        init_results : xarray.Dataset, optional
+            Farm results of a previous run, e.g. with slightly
+            different settings. After a first sweep with the
+            current settings, the fed-back variables of the
+            waked turbines are seeded from these results
+        kwargs : dict, optional
+            Keyword arguments for the Downwind calc_farm function
+
+        Returns
+        -------
+        farm_results : xarray.Dataset
+            The farm results. The calculated variables have
+            dimensions (state, turbine)
+
+        """
+        self._init_results = init_results
+        try:
+            return super().calc_farm(*args, **kwargs)
+        finally:
+            self._init_results = None
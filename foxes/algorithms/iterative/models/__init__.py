@@ -1,3 +1,4 @@
 from .loop_runner import LoopRunner
 from .convergence import ConvCrit, ConvCritList, ConvVarDelta, DefaultConv
+from .acceleration import ConvAccel, Relaxation, Aitken, Anderson
 from .farm_wakes_calc import FarmWakesCalculation
@@ -0,0 +1,308 @@
+import numpy as np
+from abc import ABCMeta, abstractmethod
+
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+class ConvAccel(metaclass=ABCMeta):
+    """
+    Abstract base class for convergence accelerators
+    of the fixed-point iteration.
+
+    Accelerators replace the result of a sweep by an
+    improved next iterate, for each state separately.
+    History data is stored in the model data, such that
+    it is reset whenever the iterated states change.
+
+    Parameters
+    ----------
+    vars : list of str
+        The accelerated farm variables
+    name : str, optional
+        The accelerator name
+
+    Attributes
+    ----------
+    vars : list of str
+        The accelerated farm variables
+    name : str
+        The accelerator name
+
+    """
+
+    def __init__(self, vars=[FV.REWS, FV.TI], name=None):
+        self.vars = vars
+        self.name = name if name is not None else type(self).__name__
+
+    def get_vector(self, fdata):
+        """
+        Collect the accelerated variables into
+        one vector per state.
+
+        Parameters
+        ----------
+        fdata : foxes.core.Data
+            The farm data
+
+        Returns
+        -------
+        x : numpy.ndarray
+            The state vectors, shape: (n_states, n_turbines * n_vars)
+
+        """
+        x = np.stack([fdata[v] for v in self.vars], axis=-1)
+        return x.reshape(fdata.n_states, -1)
+
+    def set_vector(self, fdata, x):
+        """
+        Write state vectors into the accelerated variables.
+
+        Non-finite values are ignored, and all values
+        are limited to be non-negative.
+
+        Parameters
+        ----------
+        fdata : foxes.core.Data
+            The farm data, modified in-place
+        x : numpy.ndarray
+            The state vectors, shape: (n_states, n_turbines * n_vars)
+
+        """
+        x = x.reshape(fdata.n_states, fdata.n_turbines, len(self.vars))
+        for vi, v in enumerate(self.vars):
+            hx = x[:, :, vi]
+            sel = np.isfinite(hx)
+            fdata[v][sel] = np.maximum(hx[sel], 0.0)
+
+    @abstractmethod
+    def accelerate(self, algo, mdata, fdata0, fdata1, verbosity=0):
+        """
+        Computes the next iterate.
+
+        Parameters
+        ----------
+        algo : foxes.core.Algorithm
+            The calculation algorithm
+        mdata : foxes.core.Data
+            The model data
+        fdata0 : foxes.core.Data
+            The farm data of the previous iterate
+        fdata1 : foxes.core.Data
+            The farm data as obtained by the sweep
+            from the previous iterate, will be
+            overwritten by the next iterate
+        verbosity : int
+            The verbosity level, 0 = silent
+
+        """
+        pass
+
+
+class Relaxation(ConvAccel):
+    """
+    Constant under-relaxation of the iteration.
+
+    Parameters
+    ----------
+    omega : float
+        The relaxation factor, 1 means no relaxation
+    kwargs : dict, optional
+        Additional parameters for the base class
+
+    Attributes
+    ----------
+    omega : float
+        The relaxation factor, 1 means no relaxation
+
+    """
+
+    def __init__(self, omega=0.5, **kwargs):
+        super().__init__(**kwargs)
+        self.omega = omega
+
+    def accelerate(self, algo, mdata, fdata0, fdata1, verbosity=0):
+        """
+        Computes the next iterate.
+
+        Parameters
+        ----------
+        algo : foxes.core.Algorithm
+            The calculation algorithm
+        mdata : foxes.core.Data
+            The model data
+        fdata0 : foxes.core.Data
+            The farm data of the previous iterate
+        fdata1 : foxes.core.Data
+            The farm data as obtained by the sweep
+            from the previous iterate, will be
+            overwritten by the next iterate
+        verbosity : int
+            The verbosity level, 0 = silent
+
+        """
+        x0 = self.get_vector(fdata0)
+        g0 = self.get_vector(fdata1)
+        self.set_vector(fdata1, x0 + self.omega * (g0 - x0))
+
+
+class Aitken(ConvAccel):
+    """
+    Aitken's dynamic relaxation, with one relaxation
+    factor per state.
+
+    Parameters
+    ----------
+    omega0 : float
+        The initial relaxation factor
+    omega_min : float
+        The minimal relaxation factor
+    omega_max : float
+        The maximal relaxation factor
+    kwargs : dict, optional
+        Additional parameters for the base class
+
+    Attributes
+    ----------
+    omega0 : float
+        The initial relaxation factor
+    omega_min : float
+        The minimal relaxation factor
+    omega_max : float
+        The maximal relaxation factor
+
+    """
+
+    def __init__(self, omega0=0.5, omega_min=0.05, omega_max=1.5, **kwargs):
+        super().__init__(**kwargs)
+        self.omega0 = omega0
+        self.omega_min = omega_min
+        self.omega_max = omega_max
+
+    def accelerate(self, algo, mdata, fdata0, fdata1, verbosity=0):
+        """
+        Computes the next iterate.
+
+        Parameters
+        ----------
+        algo : foxes.core.Algorithm
+            The calculation algorithm
+        mdata : foxes.core.Data
+            The model data
+        fdata0 : foxes.core.Data
+            The farm data of the previous iterate
+        fdata1 : foxes.core.Data
+            The farm data as obtained by the sweep
+            from the previous iterate, will be
+            overwritten by the next iterate
+        verbosity : int
+            The verbosity level, 0 = silent
+
+        """
+        x0 = self.get_vector(fdata0)
+        r0 = self.get_vector(fdata1) - x0
+
+        key = f"{self.name}_hist"
+        if key in mdata:
+            rp, omega = mdata[key]
+            dr = r0 - rp
+            nom = np.einsum("sn,sn->s", rp, dr)
+            den = np.einsum("sn,sn->s", dr, dr)
+            sel = den > 0
+            omega = omega.copy()
+            omega[sel] = -omega[sel] * nom[sel] / den[sel]
+            omega = np.minimum(np.maximum(omega, self.omega_min), self.omega_max)
+        else:
+            omega = np.full(fdata1.n_states, self.omega0, dtype=FC.DTYPE)
+
+        if verbosity > 0:
+            print(f"{self.name}: omega min/max = {np.min(omega)}, {np.max(omega)}")
+
+        mdata[key] = (r0, omega)
+        self.set_vector(fdata1, x0 + omega[:, None] * r0)
+
+
+class Anderson(ConvAccel):
+    """
+    Anderson mixing, separately for each state.
+
+    Parameters
+    ----------
+    m : int
+        The maximal number of previous iterates
+    beta : float
+        The mixing parameter, 1 means no damping
+    reg : float
+        Relative Tikhonov regularization of the
+        least squares problem
+    kwargs : dict, optional
+        Additional parameters for the base class
+
+    Attributes
+    ----------
+    m : int
+        The maximal number of previous iterates
+    beta : float
+        The mixing parameter, 1 means no damping
+    reg : float
+        Relative Tikhonov regularization of the
+        least squares problem
+
+    """
+
+    def __init__(self, m=5, beta=1.0, reg=1e-10, **kwargs):
+        super().__init__(**kwargs)
+        self.m = m
+        self.beta = beta
+        self.reg = reg
+
+    def accelerate(self, algo, mdata, fdata0, fdata1, verbosity=0):
+        """
+        Computes the next iterate.
+
+        Parameters
+        ----------
+        algo : foxes.core.Algorithm
+            The calculation algorithm
+        mdata : foxes.core.Data
+            The model data
+        fdata0 : foxes.core.Data
+            The farm data of the previous iterate
+        fdata1 : foxes.core.Data
+            The farm data as obtained by the sweep
+            from the previous iterate, will be
+            overwritten by the next iterate
+        verbosity : int
+            The verbosity level, 0 = silent
+
+        """
+        x0 = self.get_vector(fdata0)
+        f0 = self.get_vector(fdata1) - x0
+
+        key = f"{self.name}_hist"
+        if key not in mdata:
+            mdata[key] = ([], [])
+        xhist, fhist = mdata[key]
+        xhist.append(x0)
+        fhist.append(f0)
+        if len(xhist) > self.m + 1:
+            del xhist[0], fhist[0]
+
+        xnew = x0 + self.beta * f0
+        if len(xhist) > 1:
+            dx = np.stack([xhist[i + 1] - xhist[i] for i in range(len(xhist) - 1)], -1)
+            df = np.stack([fhist[i + 1] - fhist[i] for i in range(len(fhist) - 1)], -1)
+
+            # solve least squares problem min |f0 - df * gamma|:
+            A = np.einsum("snk,snl->skl", df, df)
+            b = np.einsum("snk,sn->sk", df, f0)
+            lam = self.reg * np.maximum(np.trace(A, axis1=1, axis2=2), 1e-30)
+            A += lam[:, None, None] * np.eye(A.shape[1])[None]
+            gamma = np.linalg.solve(A, b[:, :, None])[:, :, 0]
+
+            xnew -= np.einsum("snk,sk->sn", dx + self.beta * df, gamma)
+
+            if verbosity > 0:
+                print(f"{self.name}: Mixing {dx.shape[-1]} previous iterates")
+
+        self.set_vector(fdata1, xnew)
@@ -2,6 +2,7 @@ import numpy as np
 from abc import ABCMeta, abstractmethod
 
 import foxes.variables as FV
+import foxes.constants as FC
 from foxes.utils import delta_wd
 
 
@@ -50,6 +51,35 @@ class ConvCrit(metaclass=ABCMeta):
         """
         pass
 
+    def check_converged_states(self, algo, fdata0, fdata1, verbosity=0):
+        """
+        Check convergence criteria for each state.
+
+        The default applies the global check to all states.
+
+        Parameters
+        ----------
+        algo : foxes.core.Algorithm
+            The calculation algorithm
+        fdata0 : foxes.core.Data
+            The farm data results of previous
+            iteration, or None if first
+        fdata1 : foxes.core.Data
+            The farm data results of current
+            iteration, or None if first
+        verbosity : int
+            The verbosity level, 0 = silent
+
+        Returns
+        -------
+        convergence : numpy.ndarray of bool
+            Convergence flags, true if converged,
+            shape: (n_states,)
+
+        """
+        ok = self.check_converged(algo, fdata0, fdata1, verbosity)
+        return np.full(fdata1.n_states, ok, dtype=bool)
+
 
 class ConvCritList(ConvCrit):
     """
@@ -114,6 +144,38 @@ class ConvCritList(ConvCrit):
 
         return True
 
+    def check_converged_states(self, algo, fdata0, fdata1, verbosity=0):
+        """
+        Check convergence criteria for each state.
+
+        Parameters
+        ----------
+        algo : foxes.core.Algorithm
+            The calculation algorithm
+        fdata0 : foxes.core.Data
+            The farm data results of previous
+            iteration, or None if first
+        fdata1 : foxes.core.Data
+            The farm data results of current
+            iteration, or None if first
+        verbosity : int
+            The verbosity level, 0 = silent
+
+        Returns
+        -------
+        convergence : numpy.ndarray of bool
+            Convergence flags, true if converged,
+            shape: (n_states,)
+
+        """
+        ok = np.ones(fdata1.n_states, dtype=bool)
+        for c in self.crits:
+            ok &= c.check_converged_states(algo, fdata0, fdata1, verbosity)
+            if not np.any(ok):
+                break
+
+        return ok
+
 
 class ConvVarDelta(ConvCrit):
     """
@@ -179,9 +241,11 @@ class ConvVarDelta(ConvCrit):
         ok = True
         for v, lim in self.limits.items():
             if v in self.wd_vars:
-                check = np.max(np.abs(delta_wd(fdata0[v], fdata1[v])))
+                check = np.max(
+                    np.abs(delta_wd(fdata0[v].astype(FC.DTYPE), fdata1[v]))
+                )
             else:
-                check = np.max(np.abs(fdata1[v] - fdata0[v]))
+                check = np.max(np.abs(fdata1[v].astype(FC.DTYPE) - fdata0[v]))
             ok = ok and (check <= lim)
 
             if verbosity > 0:
@@ -192,6 +256,57 @@ class ConvVarDelta(ConvCrit):
 
         return ok
 
+    def check_converged_states(self, algo, fdata0, fdata1, verbosity=0):
+        """
+        Check convergence criteria for each state.
+
+        Parameters
+        ----------
+        algo : foxes.core.Algorithm
+            The calculation algorithm
+        fdata0 : foxes.core.Data
+            The farm data results of previous
+            iteration, or None if first
+        fdata1 : foxes.core.Data
+            The farm data results of current
+            iteration, or None if first
+        verbosity : int
+            The verbosity level, 0 = silent
+
+        Returns
+        -------
+        convergence : numpy.ndarray of bool
+            Convergence flags, true if converged,
+            shape: (n_states,)
+
+        """
+        ok = np.zeros(fdata1.n_states, dtype=bool)
+        if fdata0 is None:
+            return ok
+
+        if verbosity > 0:
+            print(f"\n{self.name}: Convergence check")
+
+        ok[:] = True
+        for v, lim in self.limits.items():
+            if v in self.wd_vars:
+                check = np.max(
+                    np.abs(delta_wd(fdata0[v].astype(FC.DTYPE), fdata1[v])), axis=1
+                )
+            else:
+                check = np.max(
+                    np.abs(fdata1[v].astype(FC.DTYPE) - fdata0[v]), axis=1
+                )
+            ok &= check <= lim
+
+            if verbosity > 0:
+                n_ok = np.sum(check <= lim)
+                print(
+                    f"  {v}: max delta = {np.max(check)}, lim = {lim}  --  {n_ok} of {len(ok)} states OK"
+                )
+
+        return ok
+
 
 class DefaultConv(ConvVarDelta):
     """
@@ -88,22 +88,29 @@ class FarmWakesCalculation(FarmDataModel):
         torder = fdata[FV.ORDER]
         n_order = torder.shape[1]
         n_states = mdata.n_states
-        wdeltas = self.pwakes.new_wake_deltas(algo, mdata, fdata)
+        pname = self.pwakes.name
+        with algo.measure(f"{pname}.new_wake_deltas", mdata):
+            wdeltas = self.pwakes.new_wake_deltas(algo, mdata, fdata)
 
         for oi in range(n_order):
             o = torder[:, oi]
-            self.pwakes.contribute_to_wake_deltas(algo, mdata, fdata, o, wdeltas)
+            with algo.measure(f"{pname}.contribute_to_wake_deltas", mdata):
+                self.pwakes.contribute_to_wake_deltas(algo, mdata, fdata, o, wdeltas)
 
         for oi in range(n_order):
             o = torder[:, oi]
-            self.pwakes.evaluate_results(algo, mdata, fdata, wdeltas, states_turbine=o)
+            with algo.measure(f"{pname}.evaluate_results", mdata):
+                self.pwakes.evaluate_results(
+                    algo, mdata, fdata, wdeltas, states_turbine=o
+                )
 
             trbs = np.zeros((n_states, algo.n_turbines), dtype=bool)
             np.put_along_axis(trbs, o[:, None], True, axis=1)
 
-            res = algo.farm_controller.calculate(
-                algo, mdata, fdata, pre_rotor=False, st_sel=trbs
-            )
+            with algo.measure(algo.farm_controller.name, mdata):
+                res = algo.farm_controller.calculate(
+                    algo, mdata, fdata, pre_rotor=False, st_sel=trbs
+                )
             fdata.update(res)
 
         return {v: fdata[v] for v in self.output_farm_vars(algo)}
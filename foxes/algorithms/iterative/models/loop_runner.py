@@ -1,6 +1,9 @@
+import numpy as np
 from copy import deepcopy
 
-from foxes.core import FarmDataModelList
+from foxes.core import FarmDataModelList, Data
+import foxes.variables as FV
+import foxes.constants as FC
 
 
 class LoopRunner(FarmDataModelList):
@@ -12,7 +15,7 @@ class LoopRunner(FarmDataModelList):
     ----------
     mlist : foxes.core.FarmDataModelList
         The models to be iterated
-    conv : foxes.algorithm.iterative.models.ConvCrit
+    conv : foxes.algorithms.iterative.models.ConvCrit
         The convergence criteria
     model_wflag : list of bool, optional
         True for models that should be run during wake iteration
@@ -21,12 +24,22 @@ class LoopRunner(FarmDataModelList):
         number of turbines + 1
     conv_error : bool
         Throw error if not converging
+    state_masking : bool
+        Only iterate states that have not yet converged
+    accel : foxes.algorithms.iterative.models.ConvAccel, optional
+        The convergence accelerator
+    init_results : xarray.Dataset, optional
+        Farm results of a previous run, the initial
+        iterate of the seeded variables
+    init_vars : list of str
+        The seeded variables, i.e., the wake coupled
+        variables that are fed back between sweeps
     verbosity : int
         The verbosity level, 0 = silent
 
     Attributes
     ----------
-    conv : foxes.algorithm.iterative.models.ConvCrit
+    conv : foxes.algorithms.iterative.models.ConvCrit
         The convergence criteria
     models : list of foxes.core.FarmDataModel
         The model list
@@ -37,6 +50,16 @@ class LoopRunner(FarmDataModelList):
         number of turbines + 1
     conv_error : bool
         Throw error if not converging
+    state_masking : bool
+        Only iterate states that have not yet converged
+    accel : foxes.algorithms.iterative.models.ConvAccel
+        The convergence accelerator, or None
+    init_results : xarray.Dataset
+        Farm results of a previous run, the initial
+        iterate of the seeded variables, or None
+    init_vars : list of str
+        The seeded variables, i.e., the wake coupled
+        variables that are fed back between sweeps
     verbosity : int
         The verbosity level, 0 = silent
 
@@ -49,6 +72,10 @@ class LoopRunner(FarmDataModelList):
         model_wflag=None,
         max_its=None,
         conv_error=True,
+        state_masking=True,
+        accel=None,
+        init_results=None,
+        init_vars=[FV.REWS, FV.TI],
         verbosity=0,
     ):
         super().__init__(models=models)
@@ -59,6 +86,10 @@ class LoopRunner(FarmDataModelList):
         )
         self.max_its = max_its
         self.conv_error = conv_error
+        self.state_masking = state_masking
+        self.accel = accel
+        self.init_results = init_results
+        self.init_vars = init_vars
 
     def append(self, model, wflag=False):
         """
@@ -75,6 +106,123 @@ class LoopRunner(FarmDataModelList):
         super().append(model)
         self.model_wflag.append(wflag)
 
+    def initialize(self, algo, verbosity=0):
+        """
+        Initializes the model.
+
+        This includes loading all required data from files. The model
+        should return all array type data as part of the idata return
+        dictionary (and not store it under self, for memory reasons). This
+        data will then be chunked and provided as part of the mdata object
+        during calculations.
+
+        Parameters
+        ----------
+        algo : foxes.core.Algorithm
+            The calculation algorithm
+        verbosity : int
+            The verbosity level, 0 = silent
+
+        Returns
+        -------
+        idata : dict
+            The dict has exactly two entries: `data_vars`,
+            a dict with entries `name_str -> (dim_tuple, data_ndarray)`;
+            and `coords`, a dict with entries `dim_name_str -> dim_array`
+
+        """
+        idata = super().initialize(algo, verbosity)
+
+        if self.init_results is not None:
+            ires = algo.states.reduce_results(self.init_results)
+            shp = (algo.n_states, algo.n_turbines)
+            for v in self.init_vars:
+                if v in ires.data_vars:
+                    d = ires[v].transpose(FC.STATE, FC.TURBINE).values
+                    if d.shape != shp:
+                        raise ValueError(
+                            f"{self.name}: Wrong shape of initial results for '{v}', expecting {shp}, got {d.shape}"
+                        )
+                    idata["data_vars"][self.var(v)] = (
+                        (FC.STATE, FC.TURBINE),
+                        d.astype(FC.DTYPE),
+                    )
+
+        return idata
+
+    @classmethod
+    def _get_states_subset(cls, data, ssel):
+        """
+        Helper function that extracts a subset of states
+
+        Entries without dimensions are dropped, except for
+        ambient rotor point results. Model specific caches
+        are thereby re-created for the subset.
+        """
+        hdata = {}
+        hdims = {}
+        for v, d in data.items():
+            if v in data.dims:
+                dms = data.dims[v]
+                if FC.STATE in dms:
+                    hdata[v] = np.compress(ssel, d, axis=dms.index(FC.STATE))
+                else:
+                    hdata[v] = d
+                hdims[v] = dms
+
+        sub = Data(hdata, hdims, loop_dims=data.loop_dims)
+
+        if FV.TXYH in data and FV.TXYH not in sub:
+            sub[FV.TXYH] = data[FV.TXYH][ssel]
+            for i, v in enumerate([FV.X, FV.Y, FV.H]):
+                if v in sub:
+                    sub[v] = sub[FV.TXYH][..., i]
+
+        if FC.AMB_RPOINT_RESULTS in data:
+            sub[FC.AMB_RPOINT_RESULTS] = {
+                v: d[ssel] for v, d in data[FC.AMB_RPOINT_RESULTS].items()
+            }
+
+        return sub
+
+    @classmethod
+    def _set_states_subset(cls, mdata, fdata, msub, fsub, sinds):
+        """
+        Helper function that writes subset results back
+        """
+        for v, d in fsub.items():
+            if v in fdata.dims and fdata.dims[v][0] == FC.STATE:
+                fdata[v][sinds] = d
+
+        if FC.AMB_RPOINT_RESULTS in msub:
+            for v, d in msub[FC.AMB_RPOINT_RESULTS].items():
+                mdata[FC.AMB_RPOINT_RESULTS][v][sinds] = d
+
+    def _seed(self, algo, mdata, fdata, ivars):
+        """
+        Helper function that writes the initial iterate into
+        the farm data of the first sweep.
+
+        Only waked turbines are seeded, all other results
+        are based on the current inputs. Post-rotor turbine
+        models are re-run for the seeded turbines.
+        """
+        waked = np.zeros((fdata.n_states, fdata.n_turbines), dtype=bool)
+        for v in ivars:
+            amb = FV.var2amb.get(v, None)
+            if amb in fdata:
+                waked |= fdata[v] != fdata[amb]
+            else:
+                waked[:] = True
+        if np.any(waked):
+            for v in ivars:
+                fdata[v][waked] = mdata[self.var(v)][waked]
+            with algo.measure(algo.farm_controller.name, mdata):
+                res = algo.farm_controller.calculate(
+                    algo, mdata, fdata, pre_rotor=False, st_sel=waked
+                )
+            fdata.update(res)
+
     def calculate(self, algo, mdata, fdata, parameters=[]):
         """ "
         The main model calculation.
@@ -103,28 +251,84 @@ class LoopRunner(FarmDataModelList):
         fdata0 = None
         it = 0
         max_its = algo.n_turbines + 1 if self.max_its is None else self.max_its
+
+        # the iterated states, as indices and data:
+        sinds = np.arange(fdata.n_states)
+        mdata_it = mdata
+        fdata_it = fdata
+
+        # warm start, seeding the fed-back variables:
+        ivars = [v for v in self.init_vars if self.var(v) in mdata]
+
         while it < max_its:
             if self.verbosity > 0:
-                print(f"\n{self.name}: Running iteration {it} (max_its = {max_its})\n")
+                print(
+                    f"\n{self.name}: Running iteration {it} (max_its = {max_its}), {len(sinds)} states\n"
+                )
 
             # run all models at first iteration:
             if fdata0 is None:
                 results = super().calculate(algo, mdata, fdata, parameters)
                 fdata.update(results)
 
+                # seed the waked turbines and continue from there:
+                if len(ivars):
+                    self._seed(algo, mdata, fdata, ivars)
+                    fdata0 = deepcopy(fdata)
+                    it += 1
+                    continue
+
             # only run wake relevant models after first iteration:
             else:
                 for mi, m in enumerate(self.models):
                     if self.model_wflag[mi]:
-                        results = m.calculate(algo, mdata, fdata, **parameters[mi])
-                        fdata.update(results)
+                        with algo.measure(m.name, mdata):
+                            results = m.calculate(
+                                algo, mdata_it, fdata_it, **parameters[mi]
+                            )
+                        fdata_it.update(results)
             del results
 
-            if self.conv.check_converged(self, fdata0, fdata, verbosity=self.verbosity):
+            # check convergence of each state:
+            if self.state_masking:
+                with algo.measure(self.conv.name, mdata):
+                    conv = self.conv.check_converged_states(
+                        algo, fdata0, fdata_it, verbosity=self.verbosity
+                    )
+                if np.all(conv):
+                    break
+
+                # remove converged states from iteration:
+                elif np.any(conv):
+                    if fdata_it is not fdata:
+                        self._set_states_subset(
+                            mdata, fdata, mdata_it, fdata_it, sinds
+                        )
+                    ssel = ~conv
+                    sinds = sinds[ssel]
+                    mdata_it = self._get_states_subset(mdata_it, ssel)
+                    fdata_it = self._get_states_subset(fdata_it, ssel)
+                    fdata0 = self._get_states_subset(fdata0, ssel)
+                    del ssel
+                del conv
+
+            elif self.conv.check_converged(
+                self, fdata0, fdata, verbosity=self.verbosity
+            ):
                 break
-            else:
-                fdata0 = deepcopy(fdata)
-                it += 1
+
+            # accelerate convergence:
+            if self.accel is not None and fdata0 is not None:
+                with algo.measure(self.accel.name, mdata):
+                    self.accel.accelerate(
+                        algo, mdata_it, fdata0, fdata_it, verbosity=self.verbosity
+                    )
+
+            fdata0 = deepcopy(fdata_it)
+            it += 1
+
+        if fdata_it is not fdata:
+            self._set_states_subset(mdata, fdata, mdata_it, fdata_it, sinds)
 
         if it >= max_its and self.conv_error:
             raise ValueError(
@@ -31,6 +31,14 @@ TMODELS : str
     Turbine models identifier
 TMODELS_SELS : str
     Selected turbine models identifier
+TMODEL_SSELS : str
+    Explicit state selections of turbine models identifier
+TMODEL_SSEL_TURBINES : str
+    Turbine indices of explicit state selections identifier
+TMODEL_SSEL_MODELS : str
+    Model indices of explicit state selections identifier
+SSEL : str
+    Explicit state selections dimension identifier
 DTYPE : alias
     Default data type for floats
 ITYPE : alias
@@ -72,6 +80,10 @@ VARS = "vars"
 VALID = "valid"
 TMODELS = "tmodels"
 TMODEL_SELS = "tmodel_sels"
+TMODEL_SSELS = "tmodel_ssels"
+TMODEL_SSEL_TURBINES = "tmodel_ssel_turbines"
+TMODEL_SSEL_MODELS = "tmodel_ssel_models"
+SSEL = "ssel"
 
 DTYPE = np.float64
 ITYPE = np.int64
@@ -1,12 +1,17 @@
+import os
+import sys
 import numpy as np
 import xarray as xr
+from pathlib import Path
+from contextlib import nullcontext
+from dask.utils import parse_bytes
 
 from .model import Model
 from .farm_data_model import FarmDataModelList
 from .point_data_model import PointDataModelList
 from .farm_controller import FarmController
 from foxes.data import StaticData
-from foxes.utils import Dict, all_subclasses
+from foxes.utils import Dict, ResultsCache, all_subclasses
 import foxes.variables as FV
 import foxes.constants as FC
 
@@ -27,7 +32,25 @@ class Algorithm(Model):
         The wind farm
     chunks: dict
         The chunks choice for running in parallel with dask,
-        e.g. `{"state": 1000}` for chunks of 1000 states
+        e.g. `{"state": 1000}` for chunks of 1000 states,
+        or `{"state": 100, "point": 5000}` for point calculations
+    auto_chunks: bool
+        Flag for chunk sizes derived from the memory budget
+    mem_budget: int
+        The memory budget per chunk in bytes, for automatic
+        chunk sizes
+    cache: foxes.utils.ResultsCache
+        The results cache, or None
+    engine: str
+        The calculation engine, "dask", "numpy",
+        "process" or "thread"
+    n_workers: int
+        The number of workers of the process and
+        thread engines
+    profiler: foxes.utils.Profiler
+        The profiler of model calculations, or None
+    dtype: numpy.dtype
+        The data type of working arrays and results
     verbosity: int
         The verbosity level, 0 means silent
     dbook: foxes.DataBook
@@ -39,7 +62,21 @@ class Algorithm(Model):
 
     """
 
-    def __init__(self, mbook, farm, chunks, verbosity, dbook=None, keep_models=[]):
+    def __init__(
+        self,
+        mbook,
+        farm,
+        chunks,
+        verbosity,
+        dbook=None,
+        keep_models=[],
+        mem_budget="1GB",
+        cache=None,
+        engine="dask",
+        n_workers=None,
+        profiler=None,
+        precision="float64",
+    ):
         """
         Constructor.
 
@@ -49,15 +86,45 @@ class Algorithm(Model):
             The model book
         farm: foxes.WindFarm
             The wind farm
-        chunks: dict
+        chunks: dict or str
             The chunks choice for running in parallel with dask,
-            e.g. `{"state": 1000}` for chunks of 1000 states
+            e.g. `{"state": 1000}` for chunks of 1000 states.
+            Point calculations can also be chunked along points,
+            e.g. `{"state": 100, "point": 5000}`. Choose "auto" for
+            chunks that fit the memory budget, not supported by
+            the numpy engine
         verbosity: int
             The verbosity level, 0 means silent
         dbook: foxes.DataBook, optional
             The data book, or None for default
         keep_models: list of str
             Keep these models data in memory and do not finalize them
+        mem_budget: int or str
+            The memory budget per chunk, in bytes or as
+            string with units, e.g. "500MB". Only used
+            for `chunks="auto"`
+        cache: foxes.utils.ResultsCache or str, optional
+            The results cache, or the path to its
+            directory
+        engine: str
+            The calculation engine: "dask" for chunked
+            calculations via xarray's `apply_ufunc`, or
+            "numpy" for in-memory calculations of all
+            states at once, without dask overhead,
+            "process" for state chunks in a process pool
+            with shared memory data (Python >= 3.8), or
+            "thread" for state chunks in a thread pool
+        n_workers: int, optional
+            The number of workers of the process and thread
+            engines, None for the number of CPUs
+        profiler: foxes.utils.Profiler, optional
+            The profiler of model calculations. Memory
+            measurements are not supported by the
+            thread engine
+        precision: str
+            The precision of working arrays and results,
+            "float64" or "float32". Input data, point
+            coordinates and accumulations always use float64
 
         """
         super().__init__()
@@ -65,12 +132,47 @@ class Algorithm(Model):
         self.name = type(self).__name__
         self.mbook = mbook
         self.farm = farm
-        self.chunks = chunks
+        self.auto_chunks = isinstance(chunks, str)
+        if self.auto_chunks and chunks != "auto":
+            raise ValueError(
+                f"Algorithm '{self.name}': Unknown chunks choice '{chunks}', expecting dict, None or 'auto'"
+            )
+        self.chunks = None if self.auto_chunks else chunks
+        self.engine = engine
+        if engine not in ["dask", "numpy", "process", "thread"]:
+            raise ValueError(
+                f"Algorithm '{self.name}': Unknown engine '{engine}', expecting 'dask', 'numpy', 'process' or 'thread'"
+            )
+        if self.auto_chunks and engine == "numpy":
+            raise ValueError(
+                f"Algorithm '{self.name}': The 'numpy' engine calculates all states at once and does not support chunks='auto'"
+            )
+        if engine == "process" and sys.version_info < (3, 8):
+            raise ValueError(
+                f"Algorithm '{self.name}': The 'process' engine requires shared memory support, available from Python 3.8"
+            )
+        self.n_workers = os.cpu_count() if n_workers is None else n_workers
+        self.profiler = profiler
+        if profiler is not None and profiler.memory and engine == "thread":
+            raise ValueError(
+                f"Algorithm '{self.name}': Profiler memory measurements are process wide and not supported by the 'thread' engine, please use Profiler(memory=False)"
+            )
+        self.dtype = np.dtype(precision)
+        if self.dtype not in [np.float32, np.float64]:
+            raise ValueError(
+                f"Algorithm '{self.name}': Unsupported precision '{precision}', expecting 'float64' or 'float32'"
+            )
+        self.mem_budget = parse_bytes(mem_budget)
         self.verbosity = verbosity
         self.n_states = None
         self.n_turbines = farm.n_turbines
         self.dbook = StaticData() if dbook is None else dbook
         self.keep_models = keep_models
+        self.cache = (
+            ResultsCache(cache)
+            if cache is not None and not isinstance(cache, ResultsCache)
+            else cache
+        )
 
         self._idata_mem = Dict()
 
@@ -81,6 +183,122 @@ class Algorithm(Model):
         if self.verbosity > 0:
             print(*args, **kwargs)
 
+    def measure(self, name, mdata=None):
+        """
+        Measures the execution of a code block
+        by the profiler, if any.
+
+        Parameters
+        ----------
+        name: str
+            The name of the measured model or function
+        mdata: foxes.core.Data, optional
+            The model data, for labelling the chunk
+            by its first state
+
+        Returns
+        -------
+        context: contextlib.AbstractContextManager
+            The measuring context
+
+        """
+        if self.profiler is None:
+            return nullcontext()
+
+        chunk = None
+        if mdata is not None and FC.STATE in mdata and len(mdata[FC.STATE]):
+            chunk = str(mdata[FC.STATE][0])
+
+        return self.profiler.measure(name, chunk)
+
+    def estimate_state_bytes(self, n_points=None, point_vars=None):
+        """
+        Estimates the memory requirement of a single state
+        during calculations.
+
+        Parameters
+        ----------
+        n_points: int, optional
+            The number of evaluation points, for point
+            calculations
+        point_vars: list of str, optional
+            The point variables, for point calculations
+
+        Returns
+        -------
+        n_bytes: int or None
+            The estimated memory per state in bytes,
+            or None if no estimate is available
+
+        """
+        return None
+
+    def uses_state_indices(self, algo=None):
+        """
+        Flag for algorithms whose models depend on the
+        state index, beyond the state variables.
+
+        Algorithms that cannot confirm that none of
+        their models do return True.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm, optional
+            The calculation algorithm, defaults to self
+
+        Returns
+        -------
+        flag: bool
+            True if the models depend on the state indices
+
+        """
+        return True
+
+    def set_auto_chunks(self, n_points=None, point_vars=None):
+        """
+        Updates the chunk sizes, in case of
+        automatic chunks.
+
+        For the pool engines, the chunk size is the
+        number of states per slice. If a single state
+        exceeds the memory budget in point calculations
+        of the dask engine, also the point dimension is
+        chunked. Algorithms without an estimate from
+        `estimate_state_bytes` reject automatic chunks.
+
+        Parameters
+        ----------
+        n_points: int, optional
+            The number of evaluation points, for point
+            calculations
+        point_vars: list of str, optional
+            The point variables, for point calculations
+
+        """
+        if self.auto_chunks:
+            n_bytes = self.estimate_state_bytes(n_points, point_vars)
+            if n_bytes is None:
+                raise ValueError(
+                    f"Algorithm '{self.name}': Automatic chunk sizes require a memory estimate per state, which this algorithm does not provide. Please specify chunks explicitly, e.g. chunks={{'{FC.STATE}': 1000}}"
+                )
+
+            n_states = int(max(min(self.mem_budget // n_bytes, self.n_states), 1))
+            self.chunks = {FC.STATE: n_states}
+
+            if (
+                self.engine == "dask"
+                and n_points is not None
+                and n_bytes > self.mem_budget
+            ):
+                n_bytes0 = self.estimate_state_bytes(0, point_vars)
+                n_pbytes = max((n_bytes - n_bytes0) / n_points, 1)
+                n_pts = int((self.mem_budget - n_bytes0) // n_pbytes)
+                self.chunks[FC.POINT] = max(min(n_pts, n_points), 1)
+
+            self.print(
+                f"Algorithm '{self.name}': Estimated {n_bytes} bytes per state, chunks = {self.chunks}"
+            )
+
     def __get_sizes(self, idata, mtype):
         """
         Private helper function
@@ -131,7 +349,10 @@ class Algorithm(Model):
                         f"Input {mtype} data entry '{v}': Dimension '{d}' has wrong size, expecting {sizes[d]}, got {s}"
                     )
         for v, c in idata["coords"].items():
-            if v not in sizes:
+            if v == FC.STATE and v not in sizes:
+                # states of state-invariant data, broadcast in chunks:
+                sizes[v] = len(c)
+            elif v not in sizes:
                 raise KeyError(
                     f"Input coords entry '{v}': Not used in farm data, found {sorted(list(sizes.keys()))}"
                 )
@@ -147,7 +368,7 @@ class Algorithm(Model):
         Private helper function
         """
         xrdata = xr.Dataset(**idata)
-        if self.chunks is not None:
+        if self.chunks is not None and self.engine == "dask":
             if FC.TURBINE in self.chunks.keys():
                 raise ValueError(
                     f"Dimension '{FC.TURBINE}' cannot be chunked, got chunks {self.chunks}"
@@ -264,7 +485,7 @@ class Algorithm(Model):
                         ok = None
                         if FC.TURBINE in d[0]:
                             i = d[0].index(FC.TURBINE)
-                            ok = np.unique(d[1], axis=1).shape[i] == 1
+                            ok = np.unique(d[1], axis=i).shape[i] == 1
                         newk[k] = ok
                     if ok is not None:
                         if not ok:
@@ -338,10 +559,14 @@ class Algorithm(Model):
         """
         Creates a point data xarray object, containing only points.
 
+        State-invariant points are stored without the states
+        dimension, and broadcast lazily within each chunk.
+
         Parameters
         ----------
         points: numpy.ndarray
             The points, shape: (n_states, n_points, 3)
+            or (n_points, 3)
         states_indices: array_like, optional
             The indices of the states dimension
 
@@ -352,24 +577,73 @@ class Algorithm(Model):
 
         """
 
-        if states_indices is None:
-            idata = {"coords": {}, "data_vars": {}}
-        else:
+        if len(points.shape) == 2 and points.shape[1] == 3:
+            if states_indices is None:
+                states_indices = np.arange(self.n_states)
             idata = {"coords": {FC.STATE: states_indices}, "data_vars": {}}
+            idata["data_vars"][FC.POINTS] = ((FC.POINT, FV.XYH), points)
 
-        if (
-            len(points.shape) != 3
-            or points.shape[0] != self.n_states
-            or points.shape[2] != 3
-        ):
-            raise ValueError(
-                f"points have wrong dimensions, expecting ({self.n_states}, n_points, 3), got {points.shape}"
-            )
-        idata["data_vars"][FC.POINTS] = ((FC.STATE, FC.POINT, FV.XYH), points)
+        else:
+            if states_indices is None:
+                idata = {"coords": {}, "data_vars": {}}
+            else:
+                idata = {"coords": {FC.STATE: states_indices}, "data_vars": {}}
+
+            if (
+                len(points.shape) != 3
+                or points.shape[0] != self.n_states
+                or points.shape[2] != 3
+            ):
+                raise ValueError(
+                    f"points have wrong dimensions, expecting ({self.n_states}, n_points, 3) or (n_points, 3), got {points.shape}"
+                )
+            idata["data_vars"][FC.POINTS] = ((FC.STATE, FC.POINT, FV.XYH), points)
 
         sizes = self.__get_sizes(idata, "point")
         return self.__get_xrdata(idata, sizes)
 
+    def write_results(self, results, out_file):
+        """
+        Writes lazy results chunk by chunk to file,
+        and opens them lazily from there.
+
+        Parameters
+        ----------
+        results: xarray.Dataset
+            The results, typically backed by dask arrays
+        out_file: str
+            Path to the output file, ending on
+            '.nc' for NetCDF or '.zarr' for Zarr
+
+        Returns
+        -------
+        results: xarray.Dataset
+            The results, lazily opened from file
+
+        """
+        fpath = Path(out_file)
+        if fpath.suffix not in [".nc", ".zarr"]:
+            raise ValueError(
+                f"Algorithm '{self.name}': Unsupported results file '{fpath}', expecting suffix '.nc' or '.zarr'"
+            )
+
+        chunks = {}
+        if (
+            self.chunks is not None
+            and FC.STATE in self.chunks
+            and FC.STATE in results.dims
+        ):
+            chunks = {FC.STATE: self.chunks[FC.STATE]}
+            results = results.chunk(chunks=chunks)
+
+        self.print(f"Writing results to file '{fpath}'")
+        if fpath.suffix == ".zarr":
+            results.to_zarr(fpath, mode="w")
+            return xr.open_zarr(fpath)
+        else:
+            results.to_netcdf(fpath)
+            return xr.open_dataset(fpath, chunks=chunks)
+
     def finalize_model(self, model, verbosity=None):
         """
         Call the finalization routine of the model,
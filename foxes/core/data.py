@@ -71,6 +71,14 @@ class Data(Dict):
 
         if FC.STATE in self.sizes:
             self.n_states = self.sizes[FC.STATE]
+
+            # broadcast state-invariant points, without copies:
+            if FC.POINTS in data and self.dims[FC.POINTS] == (FC.POINT, FV.XYH):
+                self[FC.POINTS] = np.broadcast_to(
+                    self[FC.POINTS][None], (self.n_states,) + self[FC.POINTS].shape
+                )
+                self.dims[FC.POINTS] = (FC.STATE, FC.POINT, FV.XYH)
+
         if FC.TURBINE in self.sizes:
             self.n_turbines = self.sizes[FC.TURBINE]
         if FC.POINT in self.sizes:
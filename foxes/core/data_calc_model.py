@@ -1,15 +1,78 @@
 import numpy as np
 import xarray as xr
+import threading
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dask.distributed import progress
 from dask.diagnostics import ProgressBar
 
 from .model import Model
 from .data import Data
 from foxes.utils.runners import DaskRunner
+from foxes.utils.profiler import pop_events
 import foxes.constants as FC
 
 
+_worker = {}
+_thread_data = threading.local()
+
+
+def _to_shm(a, shms):
+    """
+    Helper function that places an array in shared memory
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    if a.dtype == object or a.nbytes == 0:
+        return a
+    shm = SharedMemory(create=True, size=a.nbytes)
+    shms.append(shm)
+    b = np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf)
+    b[:] = a
+    return (shm.name, a.shape, a.dtype.str)
+
+
+def _from_shm(spec, shms):
+    """
+    Helper function that attaches to an array in shared memory
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    if isinstance(spec, np.ndarray):
+        return spec
+    name, shape, dtype = spec
+    shm = SharedMemory(name=name)
+    shms.append(shm)
+    return np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _init_process_worker(model, lspecs, ssel, especs, ospec, wargs):
+    """
+    Initializes a process pool worker
+    """
+    shms = []
+    _worker["model"] = model
+    _worker["ldata"] = [_from_shm(spec, shms) for spec in lspecs]
+    _worker["ssel"] = ssel
+    _worker["out"] = _from_shm(ospec, shms)
+    _worker["wargs"] = dict(wargs)
+    _worker["wargs"]["edata"] = [_from_shm(spec, shms) for spec in especs]
+    _worker["shms"] = shms
+
+
+def _run_process_worker(i0, i1):
+    """
+    Runs the calculation of a states slice in a
+    process pool worker
+    """
+    w = _worker
+    ldata = [d[i0:i1] if s else d for d, s in zip(w["ldata"], w["ssel"])]
+    w["out"][i0:i1] = w["model"]._wrap_calc(*ldata, **w["wargs"])
+
+    profiler = w["wargs"]["algo"].profiler
+    return None if profiler is None else pop_events(profiler.pid)
+
+
 class DataCalcModel(Model):
     """
     Abstract base class for models with
@@ -19,6 +82,11 @@ class DataCalcModel(Model):
     The calculations are run via xarray's
     `apply_ufunc` function, i.e., they run in
     parallel depending on the dask settings.
+    Alternatively, the numpy engine of the
+    algorithm calls `calculate` directly on
+    the in-memory data, and the process and
+    thread engines run state slices in a
+    process or thread pool, respectively.
 
     For each individual data chunk the `calculate`
     function is called.
@@ -67,9 +135,15 @@ class DataCalcModel(Model):
         out_vars,
         out_dims,
         calc_pars,
+        out=None,
+        scratch=None,
     ):
         """
         Wrapper that mitigates between apply_ufunc and `calculate`.
+
+        Optionally, the results are written into the given
+        output array, and the output data arrays are taken
+        from the scratch buffers dict, for reuse across chunks.
         """
 
         # reconstruct original data:
@@ -97,11 +171,21 @@ class DataCalcModel(Model):
 
         # add zero output data arrays:
         odims = {v: out_dims for v in out_vars}
-        odata = {
-            v: np.full(oshape, np.nan, dtype=FC.DTYPE)
-            for v in out_vars
-            if v not in data[-1]
-        }
+        if scratch is None:
+            odata = {
+                v: np.full(oshape, np.nan, dtype=algo.dtype)
+                for v in out_vars
+                if v not in data[-1]
+            }
+        else:
+            odata = {}
+            for v in out_vars:
+                if v not in data[-1]:
+                    k = (v, tuple(oshape))
+                    if k not in scratch:
+                        scratch[k] = np.empty(oshape, dtype=algo.dtype)
+                    odata[v] = scratch[k]
+                    odata[v].fill(np.nan)
         if len(data) == 1:
             data.append(Data(odata, odims, loop_dims))
         else:
@@ -132,18 +216,146 @@ class DataCalcModel(Model):
 
         # create output:
         n_vars = len(out_vars)
-        data = np.zeros(oshape + [n_vars], dtype=FC.DTYPE)
+        if out is None:
+            data = np.zeros(oshape + [n_vars], dtype=algo.dtype)
+        else:
+            data = out
         for v in out_vars:
             data[..., out_vars.index(v)] = results[v]
 
         return data
 
+    def _to_dataset(self, ldata, data, out_vars, out_dims):
+        """
+        Creates the results Dataset from the output array
+        of in-memory calculations
+        """
+        # collect coordinates along the output dimensions:
+        odims = set(out_dims)
+        coords = {}
+        for d in ldata:
+            for c, cd in d.coords.items():
+                if c not in coords and set(cd.dims) <= odims:
+                    coords[c] = cd.variable
+
+        return xr.Dataset(
+            {v: (out_dims, data[..., vi]) for vi, v in enumerate(out_vars)},
+            coords=coords,
+        )
+
+    def _run_numpy(self, ldata, out_vars, out_dims, wargs):
+        """
+        Runs the calculation directly on the in-memory data,
+        without xarray's `apply_ufunc` and dask.
+        """
+        data = self._wrap_calc(*[d.values for d in ldata], **wargs)
+        return self._to_dataset(ldata, data, out_vars, out_dims)
+
+    def _get_slices(self, algo, ldata, out_vars, out_dims):
+        """
+        Helper function that determines the output shape and
+        the states slices of the pool engines
+        """
+        # deduce output shape:
+        oshape = []
+        for l in out_dims:
+            for d in ldata:
+                if l in d.dims:
+                    oshape.append(d.sizes[l])
+                    break
+        oshape.append(len(out_vars))
+
+        # the states slices:
+        n_states = oshape[0]
+        if algo.chunks is not None and FC.STATE in algo.chunks:
+            csize = algo.chunks[FC.STATE]
+        else:
+            csize = max(int(np.ceil(n_states / algo.n_workers)), 1)
+        slices = [(i0, min(i0 + csize, n_states)) for i0 in range(0, n_states, csize)]
+
+        return oshape, slices
+
+    def _run_threads(self, algo, ldata, out_vars, out_dims, wargs):
+        """
+        Runs the calculation of state slices in a thread pool,
+        without copies of the input data.
+        """
+        oshape, slices = self._get_slices(algo, ldata, out_vars, out_dims)
+        ldata_np = [d.values for d in ldata]
+        ssel = [len(d.dims) > 0 and d.dims[0] == FC.STATE for d in ldata]
+        out = np.zeros(oshape, dtype=algo.dtype)
+
+        def _run(i0, i1):
+            if not hasattr(_thread_data, "scratch"):
+                _thread_data.scratch = {}
+            hldata = [d[i0:i1] if s else d for d, s in zip(ldata_np, ssel)]
+            self._wrap_calc(
+                *hldata, out=out[i0:i1], scratch=_thread_data.scratch, **wargs
+            )
+
+        n_workers = min(algo.n_workers, len(slices))
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            futures = [pool.submit(_run, *s) for s in slices]
+            for f in futures:
+                f.result()
+
+        return self._to_dataset(ldata, out, out_vars, out_dims)
+
+    def _run_processes(self, algo, ldata, out_vars, out_dims, wargs):
+        """
+        Runs the calculation of state slices in a process pool,
+        with input and output data in shared memory.
+        """
+        oshape, slices = self._get_slices(algo, ldata, out_vars, out_dims)
+        n_workers = algo.n_workers
+
+        # place read-only input data and the output buffer in shared memory:
+        shms = []
+        try:
+            lspecs = [_to_shm(d.values, shms) for d in ldata]
+            ssel = [len(d.dims) > 0 and d.dims[0] == FC.STATE for d in ldata]
+            especs = [_to_shm(np.asarray(d), shms) for d in wargs["edata"]]
+            ospec = _to_shm(np.zeros(oshape, dtype=algo.dtype), shms)
+            out = np.ndarray(oshape, dtype=algo.dtype, buffer=shms[-1].buf)
+            wargs = {k: d for k, d in wargs.items() if k != "edata"}
+
+            # run calculation:
+            with ProcessPoolExecutor(
+                max_workers=min(n_workers, len(slices)),
+                initializer=_init_process_worker,
+                initargs=(self, lspecs, ssel, especs, ospec, wargs),
+            ) as pool:
+                futures = [pool.submit(_run_process_worker, *s) for s in slices]
+                for f in futures:
+                    events = f.result()
+                    if events is not None:
+                        algo.profiler.collect(events)
+
+            data = out.copy()
+
+        finally:
+            out = None
+            for shm in shms:
+                shm.close()
+                shm.unlink()
+
+        return self._to_dataset(ldata, data, out_vars, out_dims)
+
     def run_calculation(
-        self, algo, *data, out_vars, loop_dims, out_core_vars, **calc_pars
+        self,
+        algo,
+        *data,
+        out_vars,
+        loop_dims,
+        out_core_vars,
+        compute=True,
+        **calc_pars,
     ):
         """
         Starts the model calculation in parallel, via
-        xarray's `apply_ufunc`.
+        xarray's `apply_ufunc`, or in-memory for
+        the numpy, process and thread engines of the
+        algorithm.
 
         Typically this function is called by algorithms.
 
@@ -161,6 +373,9 @@ class DataCalcModel(Model):
         out_core_vars: list of str
             The core dimensions of the output data, use
             `FC.VARS` for variables dimension (required)
+        compute: bool
+            Flag for computing the results, otherwise
+            the lazy dask-backed results are returned
         calc_pars: dict, optional
             Additional arguments for the `calculate` function
 
@@ -235,6 +450,14 @@ class DataCalcModel(Model):
             calc_pars=calc_pars,
         )
 
+        # run in-memory computation:
+        if algo.engine == "numpy":
+            return self._run_numpy(ldata, out_vars, out_dims, wargs)
+        elif algo.engine == "process":
+            return self._run_processes(algo, ldata, out_vars, out_dims, wargs)
+        elif algo.engine == "thread":
+            return self._run_threads(algo, ldata, out_vars, out_dims, wargs)
+
         # run parallel computation:
         icdims = [[c for c in d if c not in loopd] for d in ldims]
         results = xr.apply_ufunc(
@@ -242,7 +465,7 @@ class DataCalcModel(Model):
             *ldata,
             input_core_dims=icdims,
             output_core_dims=[out_core_vars],
-            output_dtypes=[FC.DTYPE],
+            output_dtypes=[algo.dtype],
             dask="parallelized",
             dask_gufunc_kwargs=dargs,
             kwargs=wargs,
@@ -251,8 +474,15 @@ class DataCalcModel(Model):
         # reorganize results Dataset:
         results = results.assign_coords({FC.VARS: out_vars}).to_dataset(dim=FC.VARS)
 
+        if not compute:
+            return results
+
         if DaskRunner.is_distributed() and len(ProgressBar.active):
             progress(results.persist())
 
         # update data by calculation results:
-        return results.compute()
+        results = results.compute()
+        if algo.profiler is not None:
+            algo.profiler.collect_dask()
+
+        return results
@@ -16,8 +16,12 @@ class FarmController(FarmDataModel):
     turbine_model_names: list of str
         Names of all turbine models found in the farm
     turbine_model_sels: numpy.ndarray of bool
-        Selection flags for all turbine models,
-        shape: (n_states, n_turbines, n_models)
+        Turbine selection flags for all turbine models,
+        shape: (n_turbines, n_models)
+    turbine_model_ssels: list of tuple
+        The explicit state selections, entries
+        (turbine index, model index, state selection
+        of shape (n_states,))
     pre_rotor_models: foxes.core.FarmDataModelList
         The turbine models with pre-rotor flag
     post_rotor_models: foxes.core.FarmDataModelList
@@ -46,6 +50,7 @@ class FarmController(FarmDataModel):
         self.turbine_types = None
         self.turbine_model_names = None
         self.turbine_model_sels = None
+        self.turbine_model_ssels = None
         self.pre_rotor_models = None
         self.post_rotor_models = None
 
@@ -73,70 +78,111 @@ class FarmController(FarmDataModel):
             "final": final_pars,
         }
 
-    def _analyze_models(self, algo, pre_rotor, models):
+    @classmethod
+    def _resolve_order(cls, mnames):
         """
-        Helper function for model analysis
+        Helper function that merges the model name lists
+        of turbine groups into a common order
         """
-        tmodels = []
-        tmsels = []
-        mnames = [[m.name for m in mlist] for mlist in models]
-        tmis = np.zeros(algo.n_turbines, dtype=FC.ITYPE)
+        order = []
+        gmis = np.zeros(len(mnames), dtype=FC.ITYPE)
         news = True
         while news:
             news = False
 
-            for ti, mlist in enumerate(models):
-                if tmis[ti] < len(mlist):
-                    mname = mnames[ti][tmis[ti]]
+            for gi, names in enumerate(mnames):
+                if gmis[gi] < len(names):
+                    mname = names[gmis[gi]]
                     isnext = True
-                    for tj, jnames in enumerate(mnames):
+                    for gj, jnames in enumerate(mnames):
                         if (
-                            tj != ti
+                            gj != gi
                             and mname in jnames
-                            and tmis[tj] < len(jnames)
-                            and jnames[tmis[tj]] != mname
+                            and gmis[gj] < len(jnames)
+                            and jnames[gmis[gj]] != mname
                         ):
                             isnext = False
                             break
 
                     if isnext:
-                        m = models[ti][tmis[ti]]
-                        tmodels.append(m)
-
-                        tsel = np.zeros((algo.n_states, algo.n_turbines), dtype=bool)
-                        for tj, jnames in enumerate(mnames):
-                            mi = tmis[tj]
+                        step = []
+                        for gj, jnames in enumerate(mnames):
+                            mi = gmis[gj]
                             if mi < len(jnames) and jnames[mi] == mname:
-                                ssel = algo.farm.turbines[tj].mstates_sel[mi]
-                                tsel[:, tj] = True if ssel is None else ssel
-                                tmis[tj] += 1
-                        tmsels.append(tsel)
+                                step.append((gj, mi))
+                                gmis[gj] += 1
+                        order.append(step)
 
                         news = True
                         break
 
+        return order, gmis
+
+    def _analyze_models(self, algo, pre_rotor, models, tgroups, gturbines):
+        """
+        Helper function for model analysis
+        """
+        mtype = "pre-rotor" if pre_rotor else "post-rotor"
+
+        # resolve the order once per group of turbines with
+        # identical model lists, cached by the wind farm:
+        mnames = tuple([tuple([m.name for m, __ in mlist]) for mlist in models])
+        key = (pre_rotor, mnames)
+        if key in algo.farm.model_orders:
+            order = algo.farm.model_orders[key]
+        else:
+            order, gmis = self._resolve_order(mnames)
+            for gi, names in enumerate(mnames):
+                if gmis[gi] != len(names):
+                    ti = gturbines[gi]
+                    t = algo.farm.turbines[ti]
+                    raise ValueError(
+                        f"Turbine {ti}, {t.name}: Could not find turbine model order that includes all {mtype} turbine models, missing {list(names[gmis[gi]:])}"
+                    )
+            algo.farm.model_orders[key] = order
+
+        # turbines with explicit state selections, by group:
+        sturbines = {}
+        for ti, t in enumerate(algo.farm.turbines):
+            if any([ssel is not None for ssel in t.mstates_sel]):
+                sturbines.setdefault(tgroups[ti], []).append(ti)
+
+        tmodels = []
+        tmsels = []
+        tmssels = []
+        for step in order:
+            gi, mi = step[0]
+            tmodels.append(models[gi][mi][0])
+
+            gsel = np.zeros(len(models), dtype=bool)
+            gsel[[gj for gj, __ in step]] = True
+            tmsels.append(gsel[tgroups])
+
+            for gj, mj in step:
+                si = models[gj][mj][1]
+                for tj in sturbines.get(gj, []):
+                    ssel = algo.farm.turbines[tj].mstates_sel[si]
+                    if ssel is not None:
+                        ssel = np.zeros(algo.n_states, dtype=bool) | ssel
+                        tmssels.append((tj, len(tmsels) - 1, ssel))
+
         if pre_rotor:
             self.pre_rotor_models = FarmDataModelList(tmodels)
             self.pre_rotor_models.name = f"{self.name}_prer"
-            mtype = "pre-rotor"
         else:
             self.post_rotor_models = FarmDataModelList(tmodels)
             self.post_rotor_models.name = f"{self.name}_postr"
-            mtype = "post-rotor"
-
-        for ti, t in enumerate(algo.farm.turbines):
-            if tmis[ti] != len(models[ti]):
-                raise ValueError(
-                    f"Turbine {ti}, {t.name}: Could not find turbine model order that includes all {mtype} turbine models, missing {t.models[tmis[ti]:]}"
-                )
 
-        return [m.name for m in tmodels], tmsels
+        return [m.name for m in tmodels], tmsels, tmssels
 
     def collect_models(self, algo):
         """
         Analyze and gather turbine models, based on the
         turbines of the wind farm.
 
+        Turbines with identical model lists are
+        analyzed together.
+
         Parameters
         ----------
         algo: foxes.core.Algorithm
@@ -144,11 +190,21 @@ class FarmController(FarmDataModel):
 
         """
 
+        # group turbines with identical model lists:
+        __, gturbines, tgroups = np.unique(
+            algo.farm.model_ids, return_index=True, return_inverse=True
+        )
+        order = np.argsort(gturbines)
+        gturbines = gturbines[order]
+        tgroups = np.argsort(order)[tgroups]
+
         # check turbine models, and find turbine types and pre/post-rotor models:
-        self.turbine_types = [None for t in algo.farm.turbines]
-        prer_models = [[] for t in algo.farm.turbines]
-        postr_models = [[] for t in algo.farm.turbines]
-        for ti, t in enumerate(algo.farm.turbines):
+        n_groups = len(gturbines)
+        gtypes = [None for gi in range(n_groups)]
+        prer_models = [[] for gi in range(n_groups)]
+        postr_models = [[] for gi in range(n_groups)]
+        for gi, ti in enumerate(gturbines):
+            t = algo.farm.turbines[ti]
             prer = None
             for mi, mname in enumerate(t.models):
                 istype = False
@@ -174,11 +230,11 @@ class FarmController(FarmDataModel):
                     )
 
                 if istype:
-                    if self.turbine_types[ti] is None:
-                        self.turbine_types[ti] = m
+                    if gtypes[gi] is None:
+                        gtypes[gi] = m
                     else:
                         raise ValueError(
-                            f"Turbine {ti}, {t.name}: Multiple turbine types found in self.turbine_models list, {self.turbine_types[ti].name} and {mname}"
+                            f"Turbine {ti}, {t.name}: Multiple turbine types found in self.turbine_models list, {gtypes[gi].name} and {mname}"
                         )
 
                 for m in models:
@@ -190,43 +246,70 @@ class FarmController(FarmDataModel):
                             f"Turbine {ti}, {t.name}: Model is classified as pre-rotor, but following the post-rotor model '{t.models[mi-1]}'"
                         )
                     if m.pre_rotor:
-                        prer_models[ti].append(m)
+                        prer_models[gi].append((m, mi))
                     else:
-                        postr_models[ti].append(m)
+                        postr_models[gi].append((m, mi))
 
-            if self.turbine_types[ti] is None:
+            if gtypes[gi] is None:
                 raise ValueError(
                     f"Turbine {ti}, {t.name}: Missing a turbine type model among models {t.models}"
                 )
 
+        self.turbine_types = [gtypes[gi] for gi in tgroups]
+
         # analyze models:
-        mnames_pre, tmsels_pre = self._analyze_models(
-            algo, pre_rotor=True, models=prer_models
+        mnames_pre, tmsels_pre, tmssels_pre = self._analyze_models(
+            algo,
+            pre_rotor=True,
+            models=prer_models,
+            tgroups=tgroups,
+            gturbines=gturbines,
         )
-        mnames_post, tmsels_post = self._analyze_models(
-            algo, pre_rotor=False, models=postr_models
+        mnames_post, tmsels_post, tmssels_post = self._analyze_models(
+            algo,
+            pre_rotor=False,
+            models=postr_models,
+            tgroups=tgroups,
+            gturbines=gturbines,
         )
         tmsels = tmsels_pre + tmsels_post
+        n_pre = len(mnames_pre)
+        self.turbine_model_ssels = tmssels_pre + [
+            (ti, mi + n_pre, ssel) for ti, mi, ssel in tmssels_post
+        ]
         self.turbine_model_names = mnames_pre + mnames_post
         if len(self.turbine_model_names):
-            self.turbine_model_sels = np.stack(tmsels, axis=2)
+            self.turbine_model_sels = np.stack(tmsels, axis=1)
         else:
             raise ValueError(f"Controller '{self.name}': No turbine model found.")
 
-    def __get_pars(self, algo, models, ptype, mdata=None, st_sel=None, from_data=True):
+    def _get_st_sel(self, mdata, mi):
+        """
+        Helper function that expands the state-turbine
+        selection of a model for the current chunk
+        """
+        n_states = mdata.n_states
+        tsel = mdata[FC.TMODEL_SELS][:, mi]
+        st_sel = np.repeat(tsel[None, :], n_states, axis=0)
+
+        if FC.TMODEL_SSELS in mdata:
+            sels = np.where(mdata[FC.TMODEL_SSEL_MODELS] == mi)[0]
+            tinds = mdata[FC.TMODEL_SSEL_TURBINES][sels]
+            st_sel[:, tinds] = mdata[FC.TMODEL_SSELS][:, sels]
+
+        return st_sel
+
+    def __get_pars(self, algo, models, ptype, mdata, st_sel=None):
         """
         Private helper function for gathering model parameters.
         """
-        if from_data:
-            s = mdata[FC.TMODEL_SELS]
-        else:
-            s = self.turbine_model_sels
-        if st_sel is not None:
-            s = s & st_sel[:, :, None]
+        pars = []
+        for m in models:
+            s = self._get_st_sel(mdata, self.turbine_model_names.index(m.name))
+            if st_sel is not None:
+                s &= st_sel
+            pars.append({"st_sel": s})
 
-        pars = [
-            {"st_sel": s[:, :, self.turbine_model_names.index(m.name)]} for m in models
-        ]
         for mi, m in enumerate(models):
             if m.name in self.pars:
                 pars[mi].update(self.pars[m.name][ptype])
@@ -268,10 +351,26 @@ class FarmController(FarmDataModel):
 
         idata["coords"][FC.TMODELS] = self.turbine_model_names
         idata["data_vars"][FC.TMODEL_SELS] = (
-            (FC.STATE, FC.TURBINE, FC.TMODELS),
+            (FC.TURBINE, FC.TMODELS),
             self.turbine_model_sels,
         )
 
+        # explicit state selections, only where given:
+        if len(self.turbine_model_ssels):
+            tinds, minds, ssels = zip(*self.turbine_model_ssels)
+            idata["data_vars"][FC.TMODEL_SSEL_TURBINES] = (
+                (FC.SSEL,),
+                np.array(tinds, dtype=FC.ITYPE),
+            )
+            idata["data_vars"][FC.TMODEL_SSEL_MODELS] = (
+                (FC.SSEL,),
+                np.array(minds, dtype=FC.ITYPE),
+            )
+            idata["data_vars"][FC.TMODEL_SSELS] = (
+                (FC.STATE, FC.SSEL),
+                np.stack(ssels, axis=1),
+            )
+
         return idata
 
     def output_farm_vars(self, algo):
@@ -326,10 +425,8 @@ class FarmController(FarmDataModel):
 
         """
         s = self.pre_rotor_models if pre_rotor else self.post_rotor_models
-        pars = self.__get_pars(algo, s.models, "calc", mdata, st_sel, from_data=True)
-        res = s.calculate(algo, mdata, fdata, parameters=pars)
-        self.turbine_model_sels = mdata[FC.TMODEL_SELS]
-        return res
+        pars = self.__get_pars(algo, s.models, "calc", mdata, st_sel)
+        return s.calculate(algo, mdata, fdata, parameters=pars)
 
     def finalize(self, algo, verbosity=0):
         """
@@ -349,5 +446,24 @@ class FarmController(FarmDataModel):
 
         self.turbine_model_names = None
         self.turbine_model_sels = None
+        self.turbine_model_ssels = None
 
         super().finalize(algo, verbosity)
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
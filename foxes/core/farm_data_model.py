@@ -250,7 +250,8 @@ class FarmDataModelList(FarmDataModel):
 
         for mi, m in enumerate(self.models):
             # print("MLIST VARS BEFORE",m.name,list(fdata.keys()),parameters[mi])
-            res = m.calculate(algo, mdata, fdata, **parameters[mi])
+            with algo.measure(m.name, mdata):
+                res = m.calculate(algo, mdata, fdata, **parameters[mi])
             fdata.update(res)
 
         return {v: fdata[v] for v in self.output_farm_vars(algo)}
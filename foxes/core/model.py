@@ -129,6 +129,30 @@ class Model(metaclass=ABCMeta):
             )
         self.__initialized = False
 
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        This is the case for models that store data
+        per state, e.g. turbine data time series. States
+        are only merged if no model of the algorithm
+        uses the state indices, hence models have to
+        confirm explicitly that they don't.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return True
+
     def get_data(
         self,
         variable,
@@ -73,6 +73,23 @@ class PartialWakesModel(Model):
 
         return idata
 
+    def n_wake_points(self, algo):
+        """
+        The number of wake evaluation points per turbine.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        n_wpoints: int
+            The number of wake evaluation points per turbine
+
+        """
+        return algo.rotor_model.n_rotor_points()
+
     @abstractmethod
     def new_wake_deltas(self, algo, mdata, fdata):
         """
@@ -181,3 +198,21 @@ class PartialWakesModel(Model):
                 pwake_type, sorted([i.__name__ for i in allc])
             )
             raise KeyError(estr)
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
@@ -232,7 +232,8 @@ class PointDataModelList(PointDataModel):
             )
 
         for mi, m in enumerate(self.models):
-            res = m.calculate(algo, mdata, fdata, pdata, **parameters[mi])
+            with algo.measure(m.name, mdata):
+                res = m.calculate(algo, mdata, fdata, pdata, **parameters[mi])
             pdata.update(res)
 
         return {v: pdata[v] for v in self.output_point_vars(algo)}
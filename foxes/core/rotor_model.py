@@ -228,7 +228,7 @@ class RotorModel(FarmDataModel):
         vdone = []
         for v in self.calc_vars:
             if v not in fdata:
-                fdata[v] = np.zeros((n_states, n_turbines), dtype=FC.DTYPE)
+                fdata[v] = np.zeros((n_states, n_turbines), dtype=algo.dtype)
 
             if v == FV.WD or v == FV.YAW:
                 if wd is None:
@@ -380,7 +380,7 @@ class RotorModel(FarmDataModel):
         pdata = {FC.POINTS: points}
         pdims = {FC.POINTS: (FC.STATE, FC.POINT, FV.XYH)}
         pdata.update(
-            {v: np.full((n_states, n_points), np.nan, dtype=FC.DTYPE) for v in svars}
+            {v: np.full((n_states, n_points), np.nan, dtype=algo.dtype) for v in svars}
         )
         pdims.update({v: (FC.STATE, FC.POINT) for v in svars})
         pdata = Data(pdata, pdims, loop_dims=[FC.STATE, FC.POINT])
@@ -408,3 +408,21 @@ class RotorModel(FarmDataModel):
         )
 
         return {v: fdata[v] for v in self.output_farm_vars(algo)}
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
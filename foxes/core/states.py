@@ -1,4 +1,5 @@
 from abc import abstractmethod
+import numpy as np
 
 from .point_data_model import PointDataModel, PointDataModelList
 import foxes.variables as FV
@@ -41,6 +42,130 @@ class States(PointDataModel):
         """
         return list(range(self.size()))
 
+    def dedup_data(self):
+        """
+        Information on the deduplication of states.
+
+        Returns
+        -------
+        dedup: dict or None
+            None for no deduplication. Otherwise a dict
+            with entries `index` (the original states index),
+            `sel` (the positions of the representative states
+            within the original states), `inverse` (the
+            representative state of each original state)
+            and `weights` (the original weights)
+
+        """
+        return None
+
+    def storage_chunk_size(self):
+        """
+        The number of states per chunk of the
+        underlying data storage.
+
+        Returns
+        -------
+        n_states: int or None
+            The states chunk size of the storage,
+            or None if not chunked
+
+        """
+        return None
+
+    def update_region(self, algo, points):
+        """
+        Extends the region of interest by
+        evaluation points.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        points: numpy.ndarray
+            The evaluation points, shape:
+            (n_states, n_points, 3) or (n_points, 3)
+
+        Returns
+        -------
+        reinit: bool
+            True if the model has to be re-initialized
+
+        """
+        return False
+
+    def expand_results(self, results):
+        """
+        Maps results of deduplicated states back
+        to the original states.
+
+        Parameters
+        ----------
+        results: xarray.Dataset
+            The results, with dimension state
+            of size `self.size()`
+
+        Returns
+        -------
+        results: xarray.Dataset
+            The results for the original states
+
+        """
+        dd = self.dedup_data()
+        if (
+            dd is None
+            or FC.STATE not in results.dims
+            or results.sizes[FC.STATE] != self.size()
+        ):
+            return results
+
+        results = results.isel({FC.STATE: dd["inverse"]})
+        results = results.assign_coords({FC.STATE: dd["index"]})
+        if FV.WEIGHT in results.data_vars:
+            results[FV.WEIGHT] = ((FC.STATE, FC.TURBINE), dd["weights"])
+
+        return results
+
+    def reduce_results(self, results):
+        """
+        Selects the deduplicated states from
+        results for the original states.
+
+        Parameters
+        ----------
+        results: xarray.Dataset
+            The results, with dimension state of
+            the size of the original states
+
+        Returns
+        -------
+        results: xarray.Dataset
+            The results for the deduplicated states
+
+        """
+        dd = self.dedup_data()
+        if (
+            dd is None
+            or FC.STATE not in results.dims
+            or results.sizes[FC.STATE] != len(dd["inverse"])
+        ):
+            return results
+
+        results = results.isel({FC.STATE: dd["sel"]})
+        if FV.WEIGHT in results.data_vars:
+            results[FV.WEIGHT] = ((FC.STATE, FC.TURBINE), self._dedup_weights(dd))
+
+        return results
+
+    def _dedup_weights(self, dedup):
+        """
+        Helper function that sums up the original weights
+        """
+        w = dedup["weights"]
+        weights = np.zeros((len(dedup["sel"]), w.shape[1]), dtype=FC.DTYPE)
+        np.add.at(weights, dedup["inverse"], w)
+        return weights
+
     @abstractmethod
     def weights(self, algo):
         """
@@ -190,6 +315,58 @@ class ExtendedStates(States):
         """
         return self.states.index()
 
+    def dedup_data(self):
+        """
+        Information on the deduplication of states.
+
+        Returns
+        -------
+        dedup: dict or None
+            None for no deduplication. Otherwise a dict
+            with entries `index` (the original states index),
+            `sel` (the positions of the representative states
+            within the original states), `inverse` (the
+            representative state of each original state)
+            and `weights` (the original weights)
+
+        """
+        return self.states.dedup_data()
+
+    def storage_chunk_size(self):
+        """
+        The number of states per chunk of the
+        underlying data storage.
+
+        Returns
+        -------
+        n_states: int or None
+            The states chunk size of the storage,
+            or None if not chunked
+
+        """
+        return self.states.storage_chunk_size()
+
+    def update_region(self, algo, points):
+        """
+        Extends the region of interest by
+        evaluation points.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        points: numpy.ndarray
+            The evaluation points, shape:
+            (n_states, n_points, 3) or (n_points, 3)
+
+        Returns
+        -------
+        reinit: bool
+            True if the model has to be re-initialized
+
+        """
+        return self.states.update_region(algo, points)
+
     def weights(self, algo):
         """
         The statistical weights of all states.
@@ -8,9 +8,15 @@ class Turbine:
     The turbine is merely a defined by basic data
     entries and a choice of turbine models.
 
+    Turbines that have been added to a wind farm are
+    views of the farm's data columns, such that changes
+    of their data are reflected by the wind farm. Modify
+    the model list by assignment or via `add_model` and
+    `insert_model`, since the returned list is a copy.
+
     Attributes
     ----------
-    xy: array_like
+    xy: numpy.ndarray
         The turbine ground position, shape: (2,)
     models: list of str
         The turbine model names, as they appear
@@ -30,7 +36,7 @@ class Turbine:
         settings if given
 
     :group: foxes
-    
+
     """
 
     def __init__(
@@ -70,14 +76,147 @@ class Turbine:
         """
         self.index = index
         self.name = name
-        self.xy = np.array(xy)
-        self.models = turbine_models
-        self.D = D
-        self.H = H
+        self._farm = None
+        self._ti = None
+        self._xy = np.array(xy)
+        self._models = list(turbine_models)
+        self._D = D
+        self._H = H
 
         self.mstates_sel = models_state_sel
         if self.mstates_sel is None:
-            self.mstates_sel = [None] * len(self.models)
+            self.mstates_sel = [None] * len(self._models)
+
+    @classmethod
+    def _view(cls, farm, ti, index, name, models_state_sel):
+        """
+        Helper function that creates a view of
+        wind farm data, without data copies
+        """
+        t = cls.__new__(cls)
+        t.index = index
+        t.name = name
+        t.mstates_sel = models_state_sel
+        t._attach(farm, ti)
+        return t
+
+    def _attach(self, farm, ti):
+        """
+        Helper function that turns the turbine
+        into a view of wind farm data
+        """
+        self._farm = farm
+        self._ti = ti
+        self._xy = None
+        self._models = None
+        self._D = None
+        self._H = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self._farm is not None:
+            state.update(
+                _farm=None,
+                _ti=None,
+                _xy=self.xy.copy(),
+                _models=self.models,
+                _D=self.D,
+                _H=self.H,
+            )
+        return state
+
+    @property
+    def xy(self):
+        """
+        The turbine ground position
+
+        Returns
+        -------
+        xy: numpy.ndarray
+            The position, shape: (2,)
+
+        """
+        if self._farm is None:
+            return self._xy
+        return self._farm.xy[self._ti]
+
+    @xy.setter
+    def xy(self, xy):
+        if self._farm is None:
+            self._xy = np.array(xy)
+        else:
+            self._farm.xy[self._ti] = xy
+
+    @property
+    def D(self):
+        """
+        The rotor diameter
+
+        Returns
+        -------
+        D: float
+            The rotor diameter, or None
+            for turbine type settings
+
+        """
+        if self._farm is None:
+            return self._D
+        D = self._farm.D[self._ti]
+        return None if np.isnan(D) else D
+
+    @D.setter
+    def D(self, D):
+        if self._farm is None:
+            self._D = D
+        else:
+            self._farm.D[self._ti] = np.nan if D is None else D
+
+    @property
+    def H(self):
+        """
+        The hub height
+
+        Returns
+        -------
+        H: float
+            The hub height, or None
+            for turbine type settings
+
+        """
+        if self._farm is None:
+            return self._H
+        H = self._farm.H[self._ti]
+        return None if np.isnan(H) else H
+
+    @H.setter
+    def H(self, H):
+        if self._farm is None:
+            self._H = H
+        else:
+            self._farm.H[self._ti] = np.nan if H is None else H
+
+    @property
+    def models(self):
+        """
+        The turbine model names
+
+        Returns
+        -------
+        models: list of str
+            The turbine model names, as they appear
+            in the model book
+
+        """
+        if self._farm is None:
+            return self._models
+        return list(self._farm.model_lists[self._farm.model_ids[self._ti]])
+
+    @models.setter
+    def models(self, models):
+        if self._farm is None:
+            self._models = list(models)
+        else:
+            self._farm.model_ids[self._ti] = self._farm.get_model_id(models)
 
     def add_model(self, model, states_sel=None):
         """
@@ -85,13 +224,13 @@ class Turbine:
 
         Parameters
         ----------
-        model: foxes.core.TurbineModel
-            The model
+        model: str
+            The model name
         states_sel: numpy.ndarray of bool, optional
             The states selection for the model, shape: (n_states,)
 
         """
-        self.models.append(model)
+        self.models = self.models + [model]
         self.mstates_sel.append(states_sel)
 
     def insert_model(self, index, model, states_sel=None):
@@ -102,11 +241,13 @@ class Turbine:
         ----------
         index: int
             The position in the model list
-        model: foxes.core.TurbineModel
-            The model
+        model: str
+            The model name
         states_sel: numpy.ndarray of bool, optional
             The states selection for the model, shape: (n_states,)
 
         """
-        self.models.insert(index, model)
+        models = self.models
+        models.insert(index, model)
+        self.models = models
         self.mstates_sel.insert(index, states_sel)
@@ -57,3 +57,21 @@ class TurbineType(TurbineModel):
             raise KeyError(
                 f"Turbine type '{self.name}': Unkown P_unit '{P_unit}', expecting {list(FC.P_UNITS.keys())}"
             )
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
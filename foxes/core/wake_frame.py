@@ -168,7 +168,7 @@ class WakeFrame(Model):
         pdata = {FC.POINTS: pts}
         pdims = {FC.POINTS: (FC.STATE, FC.POINT, FV.XYH)}
         pdata.update(
-            {v: np.full((n_states, n_steps), np.nan, dtype=FC.DTYPE) for v in vrs}
+            {v: np.full((n_states, n_steps), np.nan, dtype=algo.dtype) for v in vrs}
         )
         pdims.update({v: (FC.STATE, FC.POINT) for v in vrs})
         pdata = Data(pdata, pdims, loop_dims=[FC.STATE, FC.POINT])
@@ -1,3 +1,4 @@
+import numpy as np
 from abc import abstractmethod
 
 from .model import Model
@@ -70,6 +71,202 @@ class WakeModel(Model):
         """
         pass
 
+    def wake_reach(self, algo, mdata, fdata, states_source_turbine, x):
+        """
+        Calculate a conservative lateral reach of the wake.
+
+        Points with a distance to the wake centreline that
+        is not smaller than the reach are guaranteed to receive
+        no (or a negligible) wake contribution. The default
+        returns None, which disables culling.
+
+        Culling applies to the wake evaluations via
+        `contribute_to_wake_deltas_in_reach`, i.e., to the
+        rotor_points and grid partial wakes models and to
+        point wakes. The axiwake, distsliced and top_hat
+        partial wakes models evaluate whole rotors through
+        their own wake model interfaces, without culling.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        x: numpy.ndarray
+            The x values, shape: (n_states, n_points)
+
+        Returns
+        -------
+        reach: numpy.ndarray
+            The maximal lateral wake radius, shape:
+            (n_states, n_points), or None for unlimited
+
+        """
+        return None
+
+    def calc_reach(self, algo, mdata, fdata, states_source_turbine, x):
+        """
+        Calculate the wake reach, together with model
+        specific data that can be reused for evaluating
+        the state-points within reach.
+
+        The default returns the result of `wake_reach`
+        and no reach data.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        x: numpy.ndarray
+            The x values, shape: (n_states, n_points)
+
+        Returns
+        -------
+        reach: numpy.ndarray
+            The maximal lateral wake radius, shape:
+            (n_states, n_points), or None for unlimited
+        rdata: object
+            The reach data, passed on to
+            `contribute_to_wake_deltas_spsel`
+
+        """
+        return self.wake_reach(algo, mdata, fdata, states_source_turbine, x), None
+
+    def contribute_to_wake_deltas_spsel(
+        self,
+        algo,
+        mdata,
+        fdata,
+        states_source_turbine,
+        wake_coos,
+        wake_deltas,
+        sp_sel,
+        rdata,
+    ):
+        """
+        Calculate the contribution to the wake deltas
+        of the state-points within the wake reach.
+
+        The default evaluates all states of the points
+        that are within reach for any state, by
+        `contribute_to_wake_deltas`.
+
+        Modifies wake_deltas on the fly.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        wake_coos: numpy.ndarray
+            The wake frame coordinates of the evaluation
+            points, shape: (n_states, n_points, 3)
+        wake_deltas: dict
+            The wake deltas, are being modified ob the fly.
+            Key: Variable name str, for which the
+            wake delta applies, values: numpy.ndarray with
+            shape (n_states, n_points, ...)
+        sp_sel: numpy.ndarray of bool
+            The state-point selection of points within
+            reach, shape: (n_states, n_points)
+        rdata: object
+            The reach data, as returned by `calc_reach`
+
+        """
+        psel = np.any(sp_sel, axis=0)
+        if np.all(psel):
+            self.contribute_to_wake_deltas(
+                algo, mdata, fdata, states_source_turbine, wake_coos, wake_deltas
+            )
+        else:
+            hdeltas = {v: d[:, psel] for v, d in wake_deltas.items()}
+            self.contribute_to_wake_deltas(
+                algo,
+                mdata,
+                fdata,
+                states_source_turbine,
+                wake_coos[:, psel],
+                hdeltas,
+            )
+            for v, d in hdeltas.items():
+                wake_deltas[v][:, psel] = d
+
+    def contribute_to_wake_deltas_in_reach(
+        self, algo, mdata, fdata, states_source_turbine, wake_coos, wake_deltas
+    ):
+        """
+        Calculate the contribution to the wake deltas,
+        considering only points within the wake reach.
+
+        The reach is obtained from `calc_reach`, and the
+        state-points within reach are evaluated by
+        `contribute_to_wake_deltas_spsel`.
+
+        Modifies wake_deltas on the fly.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        wake_coos: numpy.ndarray
+            The wake frame coordinates of the evaluation
+            points, shape: (n_states, n_points, 3)
+        wake_deltas: dict
+            The wake deltas, are being modified ob the fly.
+            Key: Variable name str, for which the
+            wake delta applies, values: numpy.ndarray with
+            shape (n_states, n_points, ...)
+
+        """
+        reach, rdata = self.calc_reach(
+            algo, mdata, fdata, states_source_turbine, wake_coos[:, :, 0]
+        )
+
+        if reach is None:
+            self.contribute_to_wake_deltas(
+                algo, mdata, fdata, states_source_turbine, wake_coos, wake_deltas
+            )
+        else:
+            sp_sel = np.linalg.norm(wake_coos[:, :, 1:3], axis=-1) < reach
+            del reach
+            if np.any(sp_sel):
+                self.contribute_to_wake_deltas_spsel(
+                    algo,
+                    mdata,
+                    fdata,
+                    states_source_turbine,
+                    wake_coos,
+                    wake_deltas,
+                    sp_sel,
+                    rdata,
+                )
+
     def finalize_wake_deltas(self, algo, mdata, fdata, amb_results, wake_deltas):
         """
         Finalize the wake calculation.
@@ -96,3 +293,21 @@ class WakeModel(Model):
 
         """
         pass
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
@@ -1,16 +1,29 @@
+import numpy as np
+from copy import deepcopy
+
+from .turbine import Turbine
+import foxes.constants as FC
+
+
 class WindFarm:
     """
     The wind farm.
 
+    The turbine data are stored in array columns,
+    and the turbines are views of these columns.
+    The columns grow geometrically. Turbines that
+    are appended to the turbine list directly are
+    added to the columns on the next data access.
+
     Attributes
     ----------
     name: str
         The wind farm name
-    turbines: list of foxes.core.Turbine
-        The wind turbines
+    model_lists: list of tuple
+        The distinct turbine model lists
     boundary: foxes.utils.geom2d.AreaGeometry, optional
         The wind farm boundary
-    
+
     :group: foxes
 
     """
@@ -23,11 +36,123 @@ class WindFarm:
         ----------
         name: str
             The wind farm name
+        boundary: foxes.utils.geom2d.AreaGeometry, optional
+            The wind farm boundary
 
         """
         self.name = name
-        self.turbines = []
         self.boundary = boundary
+        self.model_lists = []
+
+        self._mids = {}
+        self._turbines = []
+        self._model_orders = {}
+
+        self._n = 0
+        self._xy = np.zeros((0, 2), dtype=FC.DTYPE)
+        self._H = np.zeros(0, dtype=FC.DTYPE)
+        self._D = np.zeros(0, dtype=FC.DTYPE)
+        self._model_ids = np.zeros(0, dtype=FC.ITYPE)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for ti, t in enumerate(self._turbines[: self._n]):
+            t._attach(self, ti)
+
+    def get_model_id(self, models):
+        """
+        Gets the index of a turbine model list,
+        adds the list if not yet known.
+
+        Parameters
+        ----------
+        models: list of str
+            The turbine model names
+
+        Returns
+        -------
+        mid: int
+            The index in model_lists
+
+        """
+        key = tuple(models)
+        if key not in self._mids:
+            self._mids[key] = len(self.model_lists)
+            self.model_lists.append(key)
+        return self._mids[key]
+
+    def _reserve(self, n):
+        """
+        Helper function that grows the data columns
+        geometrically, such that they hold n turbines
+        """
+        n_cap = self._H.shape[0]
+        if n > n_cap:
+            n_cap = max(n, 2 * n_cap)
+            for a in ["_xy", "_H", "_D", "_model_ids"]:
+                data = getattr(self, a)
+                cdata = np.zeros((n_cap,) + data.shape[1:], dtype=data.dtype)
+                cdata[: self._n] = data[: self._n]
+                setattr(self, a, cdata)
+
+    def _append(self, turbines, xy, H, D, model_ids, verbosity):
+        """
+        Helper function that appends turbine data
+        """
+        self._sync()
+        n0 = self._n
+        n1 = n0 + len(turbines)
+        self._reserve(n1)
+        self._xy[n0:n1] = xy
+        self._H[n0:n1] = H
+        self._D[n0:n1] = D
+        self._model_ids[n0:n1] = model_ids
+        self._n = n1
+        for i, t in enumerate(turbines):
+            t._attach(self, n0 + i)
+        self._turbines += turbines
+
+        if verbosity > 0:
+            for t in turbines:
+                print(f"Turbine {t.index}, {t.name}: {', '.join(t.models)}")
+
+    def _sync(self):
+        """
+        Helper function that adds turbines which were
+        appended to the turbine list directly to the
+        data columns, or rebuilds the columns if the
+        list was shortened
+        """
+        n = len(self._turbines)
+        if n == self._n:
+            return
+        i0 = self._n if n > self._n else 0
+
+        rows = []
+        turbines = []
+        for t in self._turbines[i0:]:
+            if t._farm is self:
+                ti = t._ti
+                if i0 > 0:
+                    t = Turbine._view(self, ti, t.index, t.name, list(t.mstates_sel))
+                rows.append(
+                    (self._xy[ti], self._H[ti], self._D[ti], self._model_ids[ti])
+                )
+            else:
+                if t._farm is not None:
+                    t = deepcopy(t)
+                rows.append((t.xy, t.H, t.D, self.get_model_id(t.models)))
+            turbines.append(t)
+
+        n = len(turbines)
+        xy = np.array([r[0] for r in rows], dtype=FC.DTYPE).reshape(n, 2)
+        H = np.array([np.nan if r[1] is None else r[1] for r in rows], dtype=FC.DTYPE)
+        D = np.array([np.nan if r[2] is None else r[2] for r in rows], dtype=FC.DTYPE)
+        model_ids = np.array([r[3] for r in rows], dtype=FC.ITYPE)
+
+        del self._turbines[i0:]
+        self._n = i0
+        self._append(turbines, xy=xy, H=H, D=D, model_ids=model_ids, verbosity=0)
 
     def add_turbine(self, turbine, verbosity=1):
         """
@@ -41,16 +166,199 @@ class WindFarm:
             The output verbosity, 0 = silent
 
         """
+        if turbine._farm is not None:
+            turbine = deepcopy(turbine)
         if turbine.index is None:
-            turbine.index = len(self.turbines)
+            turbine.index = self.n_turbines
         if turbine.name is None:
             turbine.name = f"T{turbine.index}"
-        self.turbines.append(turbine)
-        if verbosity > 0:
-            print(
-                f"Turbine {turbine.index}, {turbine.name}: {', '.join(turbine.models)}"
+
+        self._append(
+            [turbine],
+            xy=np.asarray(turbine.xy, dtype=FC.DTYPE).reshape(1, 2),
+            H=np.nan if turbine.H is None else turbine.H,
+            D=np.nan if turbine.D is None else turbine.D,
+            model_ids=self.get_model_id(turbine.models),
+            verbosity=verbosity,
+        )
+
+    def add_turbines(
+        self,
+        xy,
+        turbine_models=[],
+        indices=None,
+        names=None,
+        H=None,
+        D=None,
+        models_state_sel=None,
+        verbosity=0,
+    ):
+        """
+        Add wind turbines in bulk, from arrays.
+
+        Parameters
+        ----------
+        xy: array_like
+            The turbine ground positions, shape: (n, 2)
+        turbine_models: list of str or list of list of str
+            The turbine model names, either for all
+            turbines or one list per turbine
+        indices: list of int, optional
+            The turbine indices
+        names: list of str, optional
+            The turbine names
+        H: float or array_like, optional
+            The hub heights, NaN or None for turbine
+            type settings, shape: (n,)
+        D: float or array_like, optional
+            The rotor diameters, NaN or None for turbine
+            type settings, shape: (n,)
+        models_state_sel: list of numpy.ndarray, optional
+            For each turbine model, the state selection
+            boolean array with shape (n_states,). Applies
+            to all turbines
+        verbosity: int
+            The output verbosity, 0 = silent
+
+        """
+        xy = np.asarray(xy, dtype=FC.DTYPE)
+        n = xy.shape[0]
+        if xy.shape != (n, 2):
+            raise ValueError(f"Expecting xy of shape ({n}, 2), got {xy.shape}")
+
+        def _col(v):
+            if v is None:
+                return np.full(n, np.nan, dtype=FC.DTYPE)
+            v = [np.nan if x is None else x for x in np.atleast_1d(v)]
+            return np.broadcast_to(np.array(v, dtype=FC.DTYPE), (n,))
+
+        if len(turbine_models) and not isinstance(turbine_models[0], str):
+            if len(turbine_models) != n:
+                raise ValueError(
+                    f"Expecting {n} turbine model lists, got {len(turbine_models)}"
+                )
+            model_ids = np.array(
+                [self.get_model_id(m) for m in turbine_models], dtype=FC.ITYPE
+            )
+        else:
+            model_ids = np.full(n, self.get_model_id(turbine_models), dtype=FC.ITYPE)
+
+        n0 = self.n_turbines
+        if indices is None:
+            indices = range(n0, n0 + n)
+        if names is None:
+            names = [f"T{i}" for i in indices]
+        if len(indices) != n or len(names) != n:
+            raise ValueError(
+                f"Expecting {n} turbine indices and names, got {len(indices)} and {len(names)}"
             )
 
+        nmodels = [len(self.model_lists[mid]) for mid in model_ids]
+        turbines = [
+            Turbine._view(
+                self,
+                n0 + i,
+                index=indices[i],
+                name=names[i],
+                models_state_sel=(
+                    [None] * nmodels[i]
+                    if models_state_sel is None
+                    else list(models_state_sel)
+                ),
+            )
+            for i in range(n)
+        ]
+
+        self._append(
+            turbines,
+            xy=xy,
+            H=_col(H),
+            D=_col(D),
+            model_ids=model_ids,
+            verbosity=verbosity,
+        )
+
+    @property
+    def turbines(self):
+        """
+        The wind turbines. Turbines that are appended
+        directly, or via `add_turbine` or `add_turbines`,
+        become views of the wind farm data
+
+        Returns
+        -------
+        turbines: list of foxes.core.Turbine
+            The wind turbines
+
+        """
+        return self._turbines
+
+    @turbines.setter
+    def turbines(self, turbines):
+        self._turbines = list(turbines)
+        self._n = 0
+        self._sync()
+
+    @property
+    def xy(self):
+        """
+        The turbine ground positions
+
+        Returns
+        -------
+        xy: numpy.ndarray
+            The turbine ground positions,
+            shape: (n_turbines, 2)
+
+        """
+        self._sync()
+        return self._xy[: self._n]
+
+    @property
+    def H(self):
+        """
+        The hub heights
+
+        Returns
+        -------
+        H: numpy.ndarray
+            The hub heights, NaN for turbine type
+            settings, shape: (n_turbines,)
+
+        """
+        self._sync()
+        return self._H[: self._n]
+
+    @property
+    def D(self):
+        """
+        The rotor diameters
+
+        Returns
+        -------
+        D: numpy.ndarray
+            The rotor diameters, NaN for turbine type
+            settings, shape: (n_turbines,)
+
+        """
+        self._sync()
+        return self._D[: self._n]
+
+    @property
+    def model_ids(self):
+        """
+        The turbine model list indices
+
+        Returns
+        -------
+        model_ids: numpy.ndarray
+            The index of the turbine model list of
+            each turbine, shape: (n_turbines,)
+
+        """
+        self._sync()
+        return self._model_ids[: self._n]
+
     @property
     def n_turbines(self):
         """
@@ -62,7 +370,7 @@ class WindFarm:
             The total number of turbines
 
         """
-        return len(self.turbines)
+        return len(self._turbines)
 
     @property
     def turbine_names(self):
@@ -75,4 +383,18 @@ class WindFarm:
             The names of all turbines
 
         """
-        return [t.name for t in self.turbines]
+        return [t.name for t in self._turbines]
+
+    @property
+    def model_orders(self):
+        """
+        The cache of resolved turbine model orders
+
+        Returns
+        -------
+        orders: dict
+            The model orders, key: (pre_rotor flag,
+            model name lists of turbine groups)
+
+        """
+        return self._model_orders
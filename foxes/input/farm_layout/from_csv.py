@@ -1,6 +1,6 @@
 import pandas as pd
 
-from foxes.core import Turbine
+import foxes.constants as FC
 
 
 def add_from_csv(
@@ -61,7 +61,7 @@ def add_from_csv(
     verbosity: int
         The verbosity level, 0 = silent
     turbine_parameters: dict, optional
-        Additional parameters are forwarded to the WindFarm.add_turbine().
+        Additional parameters are forwarded to the WindFarm.add_turbines().
     
     :group: input.farm_layout
 
@@ -78,37 +78,41 @@ def add_from_csv(
     H = turbine_parameters.pop("H", None)
     D = turbine_parameters.pop("D", None)
 
-    for i in data.index:
-        s = 1 if turbine_base_name_count_shift else 0
-        tname = (
-            f"{turbine_base_name}{i+s}" if col_name is None else data.loc[i, col_name]
-        )
-        txy = data.loc[i, [col_x, col_y]].values
+    s = 1 if turbine_base_name_count_shift else 0
+    if col_name is None:
+        names = [f"{turbine_base_name}{i+s}" for i in data.index]
+    else:
+        names = data[col_name].tolist()
 
-        if turbine_ids is not None:
-            tid = turbine_ids[i]
-        elif col_id is not None:
-            tid = data.loc[i, col_id]
-        else:
-            tid = None
+    if turbine_ids is not None:
+        ids = [turbine_ids[i] for i in data.index]
+    elif col_id is not None:
+        ids = data[col_id].tolist()
+    else:
+        ids = None
 
-        hmodels = (
-            [] if cols_models_pre is None else data.loc[i, cols_models_pre].tolist()
+    if cols_models_pre is None and cols_models_post is None:
+        models = tmodels
+    else:
+        pre = (
+            [[]] * len(data.index)
+            if cols_models_pre is None
+            else data[cols_models_pre].values.tolist()
         )
-        hmodels += tmodels
-        hmodels += (
-            [] if cols_models_post is None else data.loc[i, cols_models_post].tolist()
+        post = (
+            [[]] * len(data.index)
+            if cols_models_post is None
+            else data[cols_models_post].values.tolist()
         )
+        models = [hpre + tmodels + hpost for hpre, hpost in zip(pre, post)]
 
-        farm.add_turbine(
-            Turbine(
-                name=tname,
-                index=tid,
-                xy=txy,
-                H=H if col_H not in data.columns else data.loc[i, col_H],
-                D=D if col_D not in data.columns else data.loc[i, col_D],
-                turbine_models=hmodels,
-                **turbine_parameters,
-            ),
-            verbosity=verbosity,
-        )
+    farm.add_turbines(
+        data[[col_x, col_y]].to_numpy(FC.DTYPE),
+        turbine_models=models,
+        indices=ids,
+        names=names,
+        H=H if col_H not in data.columns else data[col_H].to_numpy(FC.DTYPE),
+        D=D if col_D not in data.columns else data[col_D].to_numpy(FC.DTYPE),
+        verbosity=verbosity,
+        **turbine_parameters,
+    )
@@ -1,6 +1,5 @@
 import numpy as np
 
-from foxes.core import Turbine
 import foxes.constants as FC
 
 
@@ -35,26 +34,22 @@ def add_grid(
     verbosity: int
         The verbosity level, 0 = silent
     turbine_parameters: dict, optional
-        Parameters forwarded to `foxes.core.Turbine`
+        Parameters forwarded to `foxes.WindFarm.add_turbines`
     
     :group: input.farm_layout
 
     """
 
-    inds = list(np.ndindex(*steps))
-    n_turbines = len(inds)
+    inds = np.array(list(np.ndindex(*steps)), dtype=FC.DTYPE).reshape(-1, 2)
 
     xy_base = np.array(xy_base, dtype=FC.DTYPE)
     step_vectors = np.array(step_vectors, dtype=FC.DTYPE)
-
-    for i in range(n_turbines):
-        xi, yi = inds[i]
-        farm.add_turbine(
-            Turbine(
-                xy=xy_base + xi * step_vectors[0] + yi * step_vectors[1],
-                index=None if indices is None else indices[i],
-                name=None if names is None else names[i],
-                **turbine_parameters
-            ),
-            verbosity=verbosity,
-        )
+    xy = xy_base[None, :] + inds @ step_vectors
+
+    farm.add_turbines(
+        xy,
+        indices=indices,
+        names=names,
+        verbosity=verbosity,
+        **turbine_parameters
+    )
@@ -1,6 +1,6 @@
 import numpy as np
 
-from foxes.core import Turbine
+import foxes.constants as FC
 
 
 def add_row(
@@ -33,21 +33,18 @@ def add_row(
     verbosity: int
         The verbosity level, 0 = silent
     turbine_parameters: dict, optional
-        Parameters forwarded to `foxes.core.Turbine`
+        Parameters forwarded to `foxes.WindFarm.add_turbines`
 
     :group: input.farm_layout
 
     """
-    p0 = np.array(xy_base)
-    delta = np.array(xy_step)
+    p0 = np.array(xy_base, dtype=FC.DTYPE)
+    delta = np.array(xy_step, dtype=FC.DTYPE)
 
-    for i in range(n_turbines):
-        farm.add_turbine(
-            Turbine(
-                xy=p0 + i * delta,
-                index=None if indices is None else indices[i],
-                name=None if names is None else names[i],
-                **turbine_parameters
-            ),
-            verbosity=verbosity,
-        )
+    farm.add_turbines(
+        p0[None, :] + np.arange(n_turbines)[:, None] * delta[None, :],
+        indices=indices,
+        names=names,
+        verbosity=verbosity,
+        **turbine_parameters
+    )
@@ -5,6 +5,7 @@ from .single import SingleStateStates
 from .scan_ws import ScanWS
 from .states_table import StatesTable, Timeseries
 from .field_data_nc import FieldDataNC
+from .field_data_zarr import FieldDataZarr
 from .multi_height import MultiHeightStates, MultiHeightTimeseries
 
 from .create import create_random_abl_states
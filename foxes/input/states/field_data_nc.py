@@ -1,12 +1,10 @@
 import numpy as np
 import pandas as pd
 import xarray as xr
-from pathlib import Path
-from scipy.interpolate import RegularGridInterpolator
-from copy import deepcopy
+from dask.distributed import get_worker
 
 from foxes.core import States
-from foxes.utils import wd2uv, uv2wd
+from foxes.utils import wd2uv, uv2wd, Prefetcher, StencilCache
 from foxes.data import STATES, StaticData
 import foxes.variables as FV
 import foxes.constants as FC
@@ -17,6 +15,19 @@ class FieldDataNC(States):
     Heterogeneous ambient states on a regular
     horizontal grid in NetCDF format.
 
+    The trilinear interpolation stencils, i.e., the grid
+    cell indices and weights of the evaluation points, are
+    cached for state-invariant point sets, which are located
+    only once for all states. Point sets that vary between
+    states are located per chunk.
+
+    If margins are given, the grid is cropped during
+    initialization to the region of interest, i.e., the
+    bounding box of the turbine rotors and of the points
+    of `calc_points` calls, plus the margins. Pre-loading
+    then reads the cropped data during initialization,
+    otherwise all data is read by the constructor.
+
     Attributes
     ----------
     data_source: str or xarray.Dataset
@@ -39,8 +50,14 @@ class FieldDataNC(States):
     h_coord: str
         The height coordinate name in the data
     pre_load: bool
-        Flag for loading all data into memory during
-        initialization
+        Flag for loading all data into memory, or
+        the data of the region of interest when
+        cropping
+    prefetch: int
+        The number of state slices per calculating thread
+        that are buffered by the background reader if not
+        pre-loading, at least 2, or 0 for reading synchronously
+        within the calculation. Not used by distributed workers
     weight_ncvar: str
         Name of the weight data variable in the nc file(s)
     bounds_error: bool
@@ -51,11 +68,21 @@ class FieldDataNC(States):
         The datetime parsing format string
     sel: dict
         Subset selection via xr.Dataset.sel()
+    xy_margin: float
+        The horizontal margin around the region of
+        interest, or None for no horizontal cropping
+    h_margin: float
+        The vertical margin around the region of
+        interest, or None for no vertical cropping
+    MAX_STENCILS: int
+        The maximal number of cached interpolation stencils
 
     :group: input.states
 
     """
 
+    MAX_STENCILS = 16
+
     def __init__(
         self,
         data_source,
@@ -67,11 +94,14 @@ class FieldDataNC(States):
         y_coord="UTMY",
         h_coord="height",
         pre_load=True,
+        prefetch=2,
         weight_ncvar=None,
         bounds_error=True,
         fill_value=None,
         time_format="%Y-%m-%d_%H:%M:%S",
         sel=None,
+        xy_margin=None,
+        h_margin=None,
         verbosity=1,
     ):
         """
@@ -99,8 +129,14 @@ class FieldDataNC(States):
         h_coord: str
             The height coordinate name in the data
         pre_load: bool
-            Flag for loading all data into memory during
-            initialization
+            Flag for loading all data into memory, or
+            the data of the region of interest when
+            cropping
+        prefetch: int
+            The number of state slices per calculating thread
+            that are buffered by the background reader if not
+            pre-loading, at least 2, or 0 for reading synchronously
+            within the calculation. Not used by distributed workers
         weight_ncvar: str, optional
             Name of the weight data variable in the nc file(s)
         bounds_error: bool
@@ -111,8 +147,14 @@ class FieldDataNC(States):
             The datetime parsing format string
         sel: dict, optional
             Subset selection via xr.Dataset.sel()
+        xy_margin: float, optional
+            The horizontal margin around the region of
+            interest, or None for no horizontal cropping
+        h_margin: float, optional
+            The vertical margin around the region of
+            interest, or None for no vertical cropping
         verbosity: int
-            Verbosity level for pre_load file reading
+            Verbosity level for file reading
 
         """
         super().__init__()
@@ -126,29 +168,34 @@ class FieldDataNC(States):
         self.h_coord = h_coord
         self.weight_ncvar = weight_ncvar
         self.pre_load = pre_load
+        self.prefetch = prefetch
         self.bounds_error = bounds_error
         self.fill_value = fill_value
         self.time_format = time_format
         self.sel = sel
+        self.xy_margin = xy_margin
+        self.h_margin = h_margin
 
         self.var2ncvar = {
             v: var2ncvar.get(v, v) for v in output_vars if v not in fixed_vars
         }
 
         self._inds = None
+        self._ipos = None
         self._N = None
         self._weights = None
-
-        # pre-load file reading, usually prior to DaskRunner:
+        self._stencils = StencilCache(self.MAX_STENCILS)
+        self._prefetcher = None
+        self._data = None
+        self._bounds = None
+        self._points_roi = None
+
+        # index reading, and pre-load file reading if not
+        # cropping, usually prior to DaskRunner:
         if not isinstance(self.data_source, xr.Dataset):
-            if "*" in str(self.data_source):
-                pass
-            else:
-                self.data_source = StaticData().get_file_path(
-                    STATES, self.data_source, check_raw=True
-                )
+            self.data_source = self._get_path(self.data_source)
             if verbosity:
-                if pre_load:
+                if pre_load and not self._cropping():
                     print(
                         f"States '{self.name}': Reading data from '{self.data_source}'"
                     )
@@ -157,21 +204,168 @@ class FieldDataNC(States):
                         f"States '{self.name}': Reading index from '{self.data_source}'"
                     )
 
-            with xr.open_mfdataset(
-                str(self.data_source),
-                parallel=False,
-                concat_dim=self.states_coord,
-                combine="nested",
-                data_vars="minimal",
-                coords="minimal",
-                compat="override",
-            ) as ds:
-                dss = ds if self.sel is None else ds.sel(self.sel)
-                if pre_load:
-                    self.data_source = dss.load()
-                else:
-                    self.data_source = dss
-                self._get_inds(dss)
+            with self._open_dataset(self.data_source) as ds:
+                self.data_source = self._select_data(ds)
+        else:
+            self.data_source = self._select_data(self.data_source)
+
+    def _get_path(self, data_source):
+        """
+        Helper function that resolves the file path
+        """
+        if "*" in str(data_source):
+            return data_source
+        return StaticData().get_file_path(STATES, data_source, check_raw=True)
+
+    def _open_dataset(self, path):
+        """
+        Helper function that lazily opens the data
+        """
+        return xr.open_mfdataset(
+            str(path),
+            parallel=False,
+            concat_dim=self.states_coord,
+            combine="nested",
+            data_vars="minimal",
+            coords="minimal",
+            compat="override",
+        )
+
+    def _load(self, ds):
+        """
+        Helper function that reads lazy data into memory
+        """
+        return ds.load()
+
+    def _select_data(self, ds):
+        """
+        Helper function that selects the required
+        variables, and reads the index and weights
+        """
+        dss = ds if self.sel is None else ds.sel(self.sel)
+        self._get_inds(dss)
+
+        vrs = [self.states_coord, self.x_coord, self.y_coord, self.h_coord]
+        vrs += list(self.var2ncvar.values())
+        if self.weight_ncvar is not None:
+            vrs.append(self.weight_ncvar)
+        dss = dss[list(dict.fromkeys(vrs))]
+
+        return self._load(dss) if self.pre_load and not self._cropping() else dss
+
+    def _cropping(self):
+        """
+        Helper function that checks if the grid
+        is cropped to the region of interest
+        """
+        return self.xy_margin is not None or self.h_margin is not None
+
+    def _get_roi(self, algo):
+        """
+        Helper function that computes the bounding box
+        of the turbine rotors and the evaluation points
+        """
+        rmin = []
+        rmax = []
+
+        farm = algo.farm
+        if farm.n_turbines > 0:
+            H = farm.H.copy()
+            D = farm.D.copy()
+            for mid, mnames in enumerate(farm.model_lists):
+                ttypes = [
+                    algo.mbook.turbine_types[m]
+                    for m in mnames
+                    if m in algo.mbook.turbine_types
+                ]
+                if len(ttypes):
+                    sel = farm.model_ids == mid
+                    for a, v in ((H, ttypes[-1].H), (D, ttypes[-1].D)):
+                        a[sel & np.isnan(a)] = np.nan if v is None else v
+            rmin.append(np.append(np.min(farm.xy, axis=0), np.min(H - D / 2)))
+            rmax.append(np.append(np.max(farm.xy, axis=0), np.max(H + D / 2)))
+
+        if self._points_roi is not None:
+            rmin.append(self._points_roi[0])
+            rmax.append(self._points_roi[1])
+
+        if not len(rmin):
+            return None
+        return np.stack([np.min(rmin, axis=0), np.max(rmax, axis=0)])
+
+    def _crop(self, ds, algo):
+        """
+        Helper function that selects the grid
+        region of interest, plus the margins
+        """
+        self._bounds = np.full((2, 3), np.inf, dtype=FC.DTYPE)
+        self._bounds[0] = -np.inf
+
+        roi = self._get_roi(algo)
+        if roi is None:
+            return ds
+
+        isel = {}
+        for i, (c, m) in enumerate(
+            (
+                (self.x_coord, self.xy_margin),
+                (self.y_coord, self.xy_margin),
+                (self.h_coord, self.h_margin),
+            )
+        ):
+            if m is None or not np.all(np.isfinite(roi[:, i])):
+                continue
+
+            g = ds[c].to_numpy()
+            n = len(g)
+            i0 = np.searchsorted(g, roi[0, i] - m, side="right") - 1
+            i1 = np.searchsorted(g, roi[1, i] + m, side="left") + 1
+            i0 = min(max(i0, 0), n - 1)
+            i1 = max(min(i1, n), i0 + 1)
+            if i0 > 0:
+                self._bounds[0, i] = g[i0]
+            if i1 < n:
+                self._bounds[1, i] = g[i1 - 1]
+            isel[c] = slice(i0, i1)
+
+        return ds.isel(isel)
+
+    def update_region(self, algo, points):
+        """
+        Extends the region of interest by
+        evaluation points.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        points: numpy.ndarray
+            The evaluation points, shape:
+            (n_states, n_points, 3) or (n_points, 3)
+
+        Returns
+        -------
+        reinit: bool
+            True if the model has to be re-initialized
+
+        """
+        axes = tuple(range(len(points.shape) - 1))
+        pmin = np.min(points, axis=axes)
+        pmax = np.max(points, axis=axes)
+        if (
+            self._bounds is not None
+            and np.all(pmin >= self._bounds[0])
+            and np.all(pmax <= self._bounds[1])
+        ):
+            return False
+
+        if self._points_roi is None:
+            self._points_roi = np.stack([pmin, pmax])
+        else:
+            self._points_roi[0] = np.minimum(self._points_roi[0], pmin)
+            self._points_roi[1] = np.maximum(self._points_roi[1], pmax)
+
+        return self.initialized
 
     def _get_inds(self, ds):
         """
@@ -188,6 +382,7 @@ class FieldDataNC(States):
         if self.time_format is not None:
             self._inds = pd.to_datetime(self._inds, format=self.time_format).to_numpy()
         self._N = len(self._inds)
+        self._ipos = pd.Index(self._inds)
 
         if self.weight_ncvar is not None:
             self._weights = ds[self.weight_ncvar].to_numpy()
@@ -264,6 +459,100 @@ class FieldDataNC(States):
 
         return data
 
+    def _load_slice(self, i0, i1):
+        """
+        Helper function that reads the data of a states slice
+        """
+        ds = self._load(self._data.isel({self.states_coord: slice(i0, i1)}))
+
+        x = ds[self.x_coord].to_numpy()
+        y = ds[self.y_coord].to_numpy()
+        h = ds[self.h_coord].to_numpy()
+        data = self._get_data(ds, verbosity=0)
+
+        return x, y, h, data
+
+    def _get_stencil(self, grid, points):
+        """
+        Helper function that locates points in the grid,
+        returning the flat indices and trilinear weights
+        of the surrounding grid nodes
+        """
+        h, y, x = grid
+        shp = points.shape[:-1]
+        inds = np.zeros(shp + (8,), dtype=FC.ITYPE)
+        weights = np.ones(shp + (8,), dtype=FC.DTYPE)
+        outside = np.zeros(shp, dtype=bool)
+        for gi, (g, q) in enumerate(
+            zip((h, y, x), (points[..., 2], points[..., 1], points[..., 0]))
+        ):
+            n = len(g)
+            if n > 1:
+                i0 = np.searchsorted(g, q, side="right") - 1
+                i0 = np.minimum(np.maximum(i0, 0), n - 2)
+                i1 = i0 + 1
+                t = (q - g[i0]) / (g[i1] - g[i0])
+            else:
+                i0 = np.zeros(shp, dtype=FC.ITYPE)
+                i1 = i0
+                t = np.zeros(shp, dtype=FC.DTYPE)
+            outside |= (q < g[0]) | (q > g[-1])
+
+            for k in range(8):
+                upper = (k >> (2 - gi)) & 1
+                inds[..., k] = inds[..., k] * n + (i1 if upper else i0)
+                weights[..., k] *= t if upper else 1 - t
+
+        if np.any(outside):
+            if self.bounds_error:
+                qmin = np.min(points.reshape(-1, 3), axis=0)
+                qmax = np.max(points.reshape(-1, 3), axis=0)
+                raise ValueError(
+                    f"States '{self.name}': {np.sum(outside)} points out of bounds. DATA BOUNDS (x, y, h): {[x[0], y[0], h[0]]} --> {[x[-1], y[-1], h[-1]]}, EVAL BOUNDS: {list(qmin)} --> {list(qmax)}"
+                )
+            elif self.fill_value is None:
+                outside = None
+        else:
+            outside = None
+
+        return inds, weights, outside
+
+    def _interpolate(self, data, stencil):
+        """
+        Helper function that evaluates all states by
+        a gather and weighted sum over a stencil
+        """
+        inds, weights, outside = stencil
+        n_states = data.shape[0]
+        data = data.reshape(n_states, -1, data.shape[-1])
+
+        if len(inds.shape) == 2:
+            out = np.einsum("spkv,pk->spv", data[:, inds], weights)
+            if outside is not None:
+                out[:, outside] = self.fill_value
+        else:
+            sts = np.arange(n_states)[:, None, None]
+            out = np.einsum("spkv,spk->spv", data[sts, inds], weights)
+            if outside is not None:
+                out[outside] = self.fill_value
+
+        return out
+
+    def _prefetching(self):
+        """
+        Helper function that checks if state slices are
+        prefetched in this process. Not in distributed
+        workers, which receive a fresh copy of the states
+        with each task
+        """
+        if self._prefetcher is None:
+            return False
+        try:
+            get_worker()
+            return False
+        except ValueError:
+            return True
+
     def initialize(self, algo, verbosity=0):
         """
         Initializes the model.
@@ -313,6 +602,11 @@ class FieldDataNC(States):
                 (self._N, algo.n_turbines), 1.0 / self._N, dtype=FC.DTYPE
             )
 
+        self._stencils = StencilCache(self.MAX_STENCILS)
+        self._data = self._crop(self.data_source, algo)
+        if not self.pre_load and self.prefetch > 0:
+            self._prefetcher = Prefetcher(self._load_slice, n_buffer=self.prefetch)
+
         idata = super().initialize(algo, verbosity)
         self._update_idata(algo, idata)
 
@@ -323,7 +617,13 @@ class FieldDataNC(States):
             self.VARS = self.var("vars")
             self.DATA = self.var("data")
 
-            ds = self.data_source
+            if self._cropping():
+                if verbosity > 0:
+                    print(f"States '{self.name}': Reading data")
+                ds = self._load(self._data)
+            else:
+                ds = self._data
+            self._data = None
 
             h = ds[self.h_coord].to_numpy()
             y = ds[self.y_coord].to_numpy()
@@ -341,6 +641,25 @@ class FieldDataNC(States):
 
         return idata
 
+    def finalize(self, algo, verbosity=0):
+        """
+        Finalizes the model.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        verbosity: int
+            The verbosity level, 0 = silent
+
+        """
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+            self._prefetcher = None
+        self._data = None
+        self._bounds = None
+        super().finalize(algo, verbosity)
+
     def size(self):
         """
         The total number of states.
@@ -434,22 +753,20 @@ class FieldDataNC(States):
             x = mdata[self.X]
             y = mdata[self.Y]
             h = mdata[self.H]
-            data = mdata[self.DATA].copy()
+            data = mdata[self.DATA]
 
         # read data for this chunk:
         else:
-            i0 = np.where(self._inds == mdata[FC.STATE][0])[0][0]
-            s = slice(i0, i0 + n_states)
-            ds = self.data_source.isel({self.states_coord: s}).load()
-
-            x = ds[self.x_coord].to_numpy()
-            y = ds[self.y_coord].to_numpy()
-            h = ds[self.h_coord].to_numpy()
-            data = self._get_data(ds, verbosity=0)
-
-            del ds
+            i0 = self._ipos.get_loc(mdata[FC.STATE][0])
+            i1 = i0 + n_states
+            if self._prefetching():
+                x, y, h, data = self._prefetcher.get(i0, i1, self._N)
+            else:
+                x, y, h, data = self._load_slice(i0, i1)
 
-        # translate WS, WD into U, V:
+        # interpolate via the cached stencil of the points,
+        # with WS, WD translated into U, V, leaving the data as is:
+        stencil = self._stencils.get((h, y, x), points, self._get_stencil)
         if FV.WD in self.ovars and FV.WS in self.ovars:
             wd = data[..., self._dkys[FV.WD]]
             ws = (
@@ -457,34 +774,14 @@ class FieldDataNC(States):
                 if FV.WS in self._dkys
                 else self.fixed_vars[FV.WS]
             )
-            data[..., :2] = wd2uv(wd, ws, axis=-1)
-            del ws, wd
-
-        # prepare points:
-        sts = np.arange(n_states)
-        pts = np.append(points, np.zeros((n_states, n_pts, 1), dtype=FC.DTYPE), axis=2)
-        pts[:, :, 3] = sts[:, None]
-        pts = pts.reshape(n_states * n_pts, 4)
-        pts = np.flip(pts, axis=1)
-
-        # interpolate:
-        gvars = (sts, h, y, x)
-        iterp = RegularGridInterpolator(
-            gvars, data, bounds_error=self.bounds_error, fill_value=self.fill_value
-        )
-        try:
-            data = iterp(pts).reshape(n_states, n_pts, self._n_dvars)
-        except ValueError as e:
-            print(f"\n\nStates '{self.name}': Interpolation error")
-            print("INPUT VARS: (state, heights, y, x)")
-            print(
-                "DATA BOUNDS:", [np.min(d) for d in gvars], [np.max(d) for d in gvars]
-            )
-            print(
-                "EVAL BOUNDS:", [np.min(p) for p in pts.T], [np.max(p) for p in pts.T]
+            uv = self._interpolate(wd2uv(wd, ws, axis=-1), stencil)
+            data = np.concatenate(
+                [uv, self._interpolate(data[..., 2:], stencil)], axis=-1
             )
-            raise e
-        del pts, iterp, x, y, h, gvars
+            del ws, wd, uv
+        else:
+            data = self._interpolate(data, stencil)
+        del x, y, h, stencil
 
         # set output:
         out = {}
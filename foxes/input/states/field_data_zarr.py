@@ -0,0 +1,111 @@
+import numpy as np
+import xarray as xr
+from pathlib import Path
+
+from .field_data_nc import FieldDataNC
+
+
+class FieldDataZarr(FieldDataNC):
+    """
+    Heterogeneous ambient states on a regular
+    horizontal grid in Zarr format.
+
+    The store is opened lazily, with its storage chunking.
+    Only the required variables within the horizontal
+    region of interest plus a margin are read, and
+    compressed chunks are decoded in parallel. The states
+    chunks of the algorithm are aligned with the storage
+    chunks.
+
+    Attributes
+    ----------
+    n_threads: int
+        The number of threads for decoding chunks,
+        or None for the dask default
+
+    :group: input.states
+
+    """
+
+    def __init__(
+        self,
+        *args,
+        pre_load=False,
+        xy_margin=5000.0,
+        n_threads=None,
+        **kwargs,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        args: tuple, optional
+            Arguments for FieldDataNC, with data_source
+            being a Zarr store path or URL, a search pattern
+            for many stores, or an xarray.Dataset
+        pre_load: bool
+            Flag for loading all data into memory, or
+            the data of the region of interest when
+            cropping
+        xy_margin: float, optional
+            The horizontal margin around the region of
+            interest, or None for no horizontal cropping
+        n_threads: int, optional
+            The number of threads for decoding chunks,
+            or None for the dask default
+        kwargs: dict, optional
+            Additional parameters for FieldDataNC
+
+        """
+        self.n_threads = n_threads
+        super().__init__(*args, pre_load=pre_load, xy_margin=xy_margin, **kwargs)
+
+    def _get_path(self, data_source):
+        """
+        Helper function that resolves the store path
+        """
+        if "://" in str(data_source) or Path(data_source).exists():
+            return data_source
+        return super()._get_path(data_source)
+
+    def _open_dataset(self, path):
+        """
+        Helper function that lazily opens the data
+        """
+        return xr.open_mfdataset(
+            str(path),
+            engine="zarr",
+            parallel=False,
+            concat_dim=self.states_coord,
+            combine="nested",
+            data_vars="minimal",
+            coords="minimal",
+            compat="override",
+        )
+
+    def _load(self, ds):
+        """
+        Helper function that reads lazy data into memory
+        """
+        return ds.load(scheduler="threads", num_workers=self.n_threads)
+
+    def storage_chunk_size(self):
+        """
+        The number of states per chunk of the
+        underlying data storage.
+
+        Returns
+        -------
+        n_states: int or None
+            The states chunk size of the storage,
+            or None if not chunked
+
+        """
+        sizes = []
+        for ncv in self.var2ncvar.values():
+            d = self.data_source[ncv]
+            chunks = d.encoding.get("chunks", None)
+            if chunks is not None and self.states_coord in d.dims:
+                sizes.append(chunks[d.dims.index(self.states_coord)])
+        return int(np.lcm.reduce(sizes)) if len(sizes) else None
@@ -8,7 +8,7 @@ from foxes.utils import PandasFileHelper
 from foxes.data import STATES
 import foxes.variables as FV
 import foxes.constants as FC
-from foxes.utils import wd2uv, uv2wd
+from foxes.utils import wd2uv, uv2wd, StencilCache
 
 
 class MultiHeightStates(States):
@@ -22,6 +22,11 @@ class MultiHeightStates(States):
 
     WS-50, WS-60, WS-100, ...
 
+    Linear vertical interpolation is based on the two
+    bracketing heights of each point, the indices and
+    weights of which are cached for state-invariant
+    point sets.
+
     Attributes
     ----------
     data_source: str or pandas.DataFrame
@@ -41,14 +46,19 @@ class MultiHeightStates(States):
         States subset selection
     states_loc: list
         State index selection via pandas loc function
+    ipars: dict
+        Parameters for scipy.interpolate.interp1d
     RDICT: dict
         Default pandas file reading parameters
+    MAX_STENCILS: int
+        The maximal number of cached interpolation stencils
     
     :group: input.states
 
     """
 
     RDICT = {"index_col": 0}
+    MAX_STENCILS = 16
 
     def __init__(
         self,
@@ -104,6 +114,7 @@ class MultiHeightStates(States):
         self._solo = None
         self._weights = None
         self._N = None
+        self._stencils = StencilCache(self.MAX_STENCILS)
 
     def reset(self, algo=None, states_sel=None, states_loc=None, verbosity=0):
         """
@@ -253,6 +264,71 @@ class MultiHeightStates(States):
 
         return idata
 
+    def _get_stencil(self, grid, z):
+        """
+        Helper function that locates point heights,
+        returning the lower bracketing height indices,
+        the linear weights of the upper heights and
+        the fill values of points out of bounds
+        """
+        h = grid[0]
+        if len(h) < 2:
+            raise ValueError(
+                f"States '{self.name}': Linear interpolation requires at least two heights, got {list(h)}"
+            )
+
+        ipars = dict(bounds_error=True, fill_value=np.nan)
+        ipars.update(self.ipars)
+        fill_value = ipars["fill_value"]
+        extrapolate = isinstance(fill_value, str) and fill_value == "extrapolate"
+
+        n_h = len(h)
+        i0 = np.searchsorted(h, z, side="right") - 1
+        i0 = np.minimum(np.maximum(i0, 0), n_h - 2)
+        t = (z - h[i0]) / (h[i0 + 1] - h[i0])
+
+        below = z < h[0]
+        above = z > h[-1]
+        fill = None
+        if np.any(below) or np.any(above):
+            if ipars["bounds_error"]:
+                raise ValueError(
+                    f"States '{self.name}': Point heights out of bounds. DATA BOUNDS: {h[0]} --> {h[-1]}, EVAL BOUNDS: {np.min(z)} --> {np.max(z)}"
+                )
+            elif not extrapolate:
+                lo, hi = (
+                    fill_value if isinstance(fill_value, tuple) else (fill_value,) * 2
+                )
+                fill = (below, lo, above, hi)
+
+        return i0, t, fill
+
+    def _interpolate(self, data, stencil):
+        """
+        Helper function that interpolates data of shape
+        (n_states, n_vars, n_heights) between the two
+        bracketing heights, returns shape (n_states, n_vars, n_points)
+        """
+        i0, t, fill = stencil
+        if len(i0.shape) == 1:
+            i0 = i0[None, None]
+            t = t[None, None]
+        else:
+            i0 = i0[:, None]
+            t = t[:, None]
+
+        d0 = np.take_along_axis(data, i0, axis=2)
+        out = d0 + t * (np.take_along_axis(data, i0 + 1, axis=2) - d0)
+        del d0
+
+        if fill is not None:
+            below, lo, above, hi = fill
+            m = (slice(None), None) if len(below.shape) == 2 else (None, None)
+            out = np.where(below[m], lo, out)
+            out = np.where(above[m], hi, out)
+
+        return out
+
     def size(self):
         """
         The total number of states.
@@ -341,13 +417,25 @@ class MultiHeightStates(States):
         n_h = len(h)
         vrs = list(mdata[self.VARS])
 
-        coeffs = np.zeros((n_h, n_h), dtype=FC.DTYPE)
-        np.fill_diagonal(coeffs, 1.0)
-        ipars = dict(assume_sorted=True, bounds_error=True)
-        ipars.update(self.ipars)
-        intp = interp1d(h, coeffs, axis=0, **ipars)
-        ires = intp(z)
-        del coeffs, intp
+        # sparse two-point stencil for linear interpolation:
+        if self.ipars.get("kind", "linear") in ["linear", 1]:
+            stencil = self._stencils.get((h,), z, self._get_stencil)
+
+            def _interp(data):
+                return self._interpolate(data, stencil)
+
+        # dense interpolation weights otherwise:
+        else:
+            coeffs = np.zeros((n_h, n_h), dtype=FC.DTYPE)
+            np.fill_diagonal(coeffs, 1.0)
+            ipars = dict(assume_sorted=True, bounds_error=True)
+            ipars.update(self.ipars)
+            intp = interp1d(h, coeffs, axis=0, **ipars)
+            ires = intp(z)
+            del coeffs, intp
+
+            def _interp(data):
+                return np.einsum("svh,sph->svp", data, ires)
 
         has_wd = FV.WD in vrs
         if has_wd:
@@ -367,10 +455,10 @@ class MultiHeightStates(States):
                 raise KeyError(
                     f"States '{self.name}': Found variable '{FV.WD}', but missing variable '{FV.WS}'"
                 )
-            uv = np.einsum("shd,sph->spd", uvh, ires)
+            uv = np.swapaxes(_interp(np.swapaxes(uvh, 1, 2)), 1, 2)
             del uvh
 
-        ires = np.einsum("svh,sph->svp", mdata[self.DATA], ires)
+        ires = _interp(mdata[self.DATA])
 
         results = {}
         for v in self.ovars:
@@ -404,6 +492,7 @@ class MultiHeightStates(States):
         self._solo = None
         self._weights = None
         self._N = None
+        self._stencils = StencilCache(self.MAX_STENCILS)
         super().finalize(algo, verbosity)
 
 
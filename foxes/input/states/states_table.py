@@ -33,6 +33,14 @@ class StatesTable(States):
         States subset selection
     states_loc: list
         State index selection via pandas loc function
+    deduplicate: bool
+        Flag for merging identical states, summing
+        up their weights
+    dedup_tol: float or dict
+        Tolerances for identifying states as identical,
+        either for all variables or key: variable name
+        str, value: tolerance. Ignored variables are
+        compared exactly
     RDICT: dict
         Default pandas file reading parameters
     
@@ -52,6 +60,8 @@ class StatesTable(States):
         pd_read_pars={},
         states_sel=None,
         states_loc=None,
+        deduplicate=False,
+        dedup_tol={},
     ):
         """
         Constructor.
@@ -76,6 +86,17 @@ class StatesTable(States):
             States subset selection
         states_loc: list, optional
             State index selection via pandas loc function
+        deduplicate: bool
+            Flag for merging identical states, summing
+            up their weights. Results are mapped back
+            to the original states. Ignored unless the
+            algorithm confirms that no model depends on
+            the state indices
+        dedup_tol: float or dict
+            Tolerances for identifying states as identical,
+            either for all variables or key: variable name
+            str, value: tolerance. Ignored variables are
+            compared exactly
 
         """
         super().__init__()
@@ -88,6 +109,8 @@ class StatesTable(States):
         self.profdicts = profiles
         self.states_sel = states_sel
         self.states_loc = states_loc
+        self.deduplicate = deduplicate
+        self.dedup_tol = dedup_tol
 
         if self.states_loc is not None and self.states_sel is not None:
             raise ValueError(
@@ -97,6 +120,7 @@ class StatesTable(States):
         self._weights = None
         self._N = None
         self._tvars = None
+        self._dedup = None
 
     def reset(self, algo=None, states_sel=None, states_loc=None, verbosity=0):
         """
@@ -209,16 +233,27 @@ class StatesTable(States):
             data[col_w] = self._weights[:, 0]
 
         tcols = []
+        tvars = []
         for v in self._tvars:
             c = self.var2col.get(v, v)
             if c in data.columns:
                 tcols.append(c)
+                tvars.append(v)
             elif v not in self._profiles.keys():
                 raise KeyError(
                     f"States '{self.name}': Missing variable '{c}' in states table columns, profiles or fixed vars"
                 )
         data = data[tcols]
 
+        self._dedup = None
+        if self.deduplicate and algo.uses_state_indices():
+            if verbosity > 0:
+                print(
+                    f"States '{self.name}': Skipping deduplication, models may depend on the state indices"
+                )
+        elif self.deduplicate:
+            data = self._deduplicate(data, tvars, verbosity)
+
         idata = super().initialize(algo, verbosity)
         self._update_idata(algo, idata)
         idata["coords"][self.VARS] = self._tvars
@@ -230,6 +265,65 @@ class StatesTable(States):
 
         return idata
 
+    def _deduplicate(self, data, tvars, verbosity):
+        """
+        Helper function that merges identical states
+        """
+        qdata = data.to_numpy(dtype=FC.DTYPE, copy=True)
+        for i, v in enumerate(tvars):
+            if isinstance(self.dedup_tol, dict):
+                tol = self.dedup_tol.get(v, None)
+            else:
+                tol = self.dedup_tol
+            if v == FV.WD:
+                qdata[:, i] = np.mod(qdata[:, i], 360.0)
+            if tol is not None and tol > 0:
+                qdata[:, i] = np.round(qdata[:, i] / tol)
+                if v == FV.WD:
+                    qdata[:, i] = np.mod(qdata[:, i], np.round(360.0 / tol))
+
+        # find representatives, keeping the original order:
+        __, sel, inverse = np.unique(
+            qdata, axis=0, return_index=True, return_inverse=True
+        )
+        inverse = inverse.reshape(-1)
+        order = np.argsort(sel)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        sel = sel[order]
+        inverse = rank[inverse]
+
+        self._dedup = dict(
+            index=self._inds, sel=sel, inverse=inverse, weights=self._weights
+        )
+        self._weights = self._dedup_weights(self._dedup)
+        self._inds = self._inds[sel]
+        self._N = len(sel)
+
+        if verbosity > 0:
+            print(
+                f"States '{self.name}': Merged {len(inverse)} states into {self._N} unique states"
+            )
+
+        return data.iloc[sel]
+
+    def dedup_data(self):
+        """
+        Information on the deduplication of states.
+
+        Returns
+        -------
+        dedup: dict or None
+            None for no deduplication. Otherwise a dict
+            with entries `index` (the original states index),
+            `sel` (the positions of the representative states
+            within the original states), `inverse` (the
+            representative state of each original state)
+            and `weights` (the original weights)
+
+        """
+        return self._dedup
+
     def size(self):
         """
         The total number of states.
@@ -342,6 +436,7 @@ class StatesTable(States):
         self._weights = None
         self._N = None
         self._tvars = None
+        self._dedup = None
 
         super().finalize(algo, verbosity)
 
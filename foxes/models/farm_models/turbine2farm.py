@@ -106,7 +106,7 @@ class Turbine2FarmModel(FarmModel):
             Values: numpy.ndarray with shape (n_states, n_turbines)
 
         """
-        s = np.ones((algo.n_states, algo.n_turbines), dtype=bool)
+        s = np.ones((mdata.n_states, algo.n_turbines), dtype=bool)
         return self.turbine_model.calculate(algo, mdata, fdata, st_sel=s, **parameters)
 
     def finalize(self, algo, verbosity=0):
@@ -93,6 +93,23 @@ class PartialAxiwake(PartialWakesModel):
 
         return idata
 
+    def n_wake_points(self, algo):
+        """
+        The number of wake evaluation points per turbine.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        n_wpoints: int
+            The number of wake evaluation points per turbine
+
+        """
+        return self.n
+
     def new_wake_deltas(self, algo, mdata, fdata):
         """
         Creates new initial wake deltas, filled
@@ -107,6 +107,23 @@ class PartialDistSlicedWake(PartialWakesModel):
 
         return idata
 
+    def n_wake_points(self, algo):
+        """
+        The number of wake evaluation points per turbine.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        n_wpoints: int
+            The number of wake evaluation points per turbine
+
+        """
+        return self.grotor.n_rotor_points()
+
     def new_wake_deltas(self, algo, mdata, fdata):
         """
         Creates new initial wake deltas, filled
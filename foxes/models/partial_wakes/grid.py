@@ -76,6 +76,6 @@ class PartialGrid(PartialDistSlicedWake):
 
         # evaluate wake models:
         for w in self.wake_models:
-            w.contribute_to_wake_deltas(
+            w.contribute_to_wake_deltas_in_reach(
                 algo, mdata, fdata, states_source_turbine, wcoos, wake_deltas
             )
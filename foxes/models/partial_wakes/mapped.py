@@ -130,6 +130,23 @@ class Mapped(PartialWakesModel):
 
         return idata
 
+    def n_wake_points(self, algo):
+        """
+        The number of wake evaluation points per turbine.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        n_wpoints: int
+            The number of wake evaluation points per turbine
+
+        """
+        return max([pw.n_wake_points(algo) for pw in self._pwakes])
+
     def new_wake_deltas(self, algo, mdata, fdata):
         """
         Creates new initial wake deltas, filled
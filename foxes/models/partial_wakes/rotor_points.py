@@ -140,7 +140,7 @@ class RotorPoints(PartialWakesModel):
         )
 
         for w in self.wake_models:
-            w.contribute_to_wake_deltas(
+            w.contribute_to_wake_deltas_in_reach(
                 algo, mdata, fdata, states_source_turbine, wcoos, wake_deltas
             )
 
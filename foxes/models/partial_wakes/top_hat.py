@@ -105,6 +105,23 @@ class PartialTopHat(PartialWakesModel):
         """
         return fdata[FV.TXYH]
 
+    def n_wake_points(self, algo):
+        """
+        The number of wake evaluation points per turbine.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        n_wpoints: int
+            The number of wake evaluation points per turbine
+
+        """
+        return 1
+
     def new_wake_deltas(self, algo, mdata, fdata):
         """
         Creates new initial wake deltas, filled
@@ -107,3 +107,21 @@ class kTI(TurbineModel):
         k[st_sel] = kTI * ti + kb
 
         return {self.k_var: k}
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
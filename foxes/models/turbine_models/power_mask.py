@@ -183,3 +183,21 @@ class PowerMask(TurbineModel):
         self.update_P_ct(fdata, max_P, rated_P, self.factor_P, var_ws=self.var_ws_P)
 
         return {FV.P: fdata[FV.P], FV.CT: fdata[FV.CT]}
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
@@ -157,4 +157,21 @@ class RotorCentreCalc(TurbineModel):
         """
         algo.finalize_model(self._wcalc, verbosity)
         super().finalize(algo, verbosity)
-        
\ No newline at end of file
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
@@ -243,3 +243,21 @@ class SectorManagement(TurbineModel):
                 fdata[v][sel[0], selt] = self._tdata[None, sel[1], vi]
 
         return {v: fdata[v] for v in self._tvars}
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
@@ -105,26 +105,48 @@ class SetXYHD(TurbineModel):
             if self.set_H:
                 fdata[FV.H] = fdata[FV.TXYH][..., 2]
 
-        for ti in range(n_turbines):
-            ssel = st_sel[:, ti]
-            if np.any(ssel):
-                if np.all(ssel):
-                    ssel = np.s_[:]
-
-                if self.set_XY:
-                    fdata[FV.X][ssel, ti] = algo.farm.turbines[ti].xy[0]
-                    fdata[FV.Y][ssel, ti] = algo.farm.turbines[ti].xy[1]
-
-                if self.set_H:
-                    H = algo.farm.turbines[ti].H
-                    if H is None:
-                        H = algo.farm_controller.turbine_types[ti].H
-                    fdata[FV.H][ssel, ti] = H
-
-                if self.set_D:
-                    D = algo.farm.turbines[ti].D
-                    if D is None:
-                        D = algo.farm_controller.turbine_types[ti].D
-                    fdata[FV.D][ssel, ti] = D
+        all_sel = np.all(st_sel)
+
+        def _set(v, data):
+            if all_sel:
+                fdata[v][:] = data[None, :]
+            else:
+                fdata[v][st_sel] = np.broadcast_to(data[None, :], st_sel.shape)[
+                    st_sel
+                ]
+
+        def _ttype_data(data, v):
+            data = data.copy()
+            for ti in np.where(np.isnan(data))[0]:
+                data[ti] = getattr(algo.farm_controller.turbine_types[ti], v)
+            return data
+
+        if self.set_XY:
+            _set(FV.X, algo.farm.xy[:, 0])
+            _set(FV.Y, algo.farm.xy[:, 1])
+
+        if self.set_H:
+            _set(FV.H, _ttype_data(algo.farm.H, "H"))
+
+        if self.set_D:
+            _set(FV.D, _ttype_data(algo.farm.D, "D"))
 
         return {v: fdata[v] for v in self.output_farm_vars(algo)}
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
@@ -163,3 +163,21 @@ class SetFarmVars(TurbineModel):
                 fdata[v][tsel] = data[tsel]
 
         return {v: fdata[v] for v in self.vars}
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return len(self.vars) > 0
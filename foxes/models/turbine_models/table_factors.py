@@ -178,3 +178,21 @@ class TableFactors(TurbineModel):
             fdata[v][st_sel] *= factors
 
         return {v: fdata[v] for v in self.output_farm_vars(algo)}
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
@@ -88,3 +88,21 @@ class Thrust2Ct(TurbineModel):
         ct[st_sel] = 2 * T / (rho * A * ws**2)
 
         return {FV.CT: ct}
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
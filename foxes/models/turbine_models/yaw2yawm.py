@@ -64,3 +64,21 @@ class YAW2YAWM(TurbineModel):
         yawm[st_sel] = delta_wd(wd, yaw)
 
         return {FV.YAWM: yawm}
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
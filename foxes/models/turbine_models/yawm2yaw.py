@@ -63,3 +63,21 @@ class YAWM2YAW(TurbineModel):
         yaw[st_sel] = np.mod(wd + yawm, 360.0)
 
         return {FV.YAW: yaw}
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
@@ -165,3 +165,21 @@ class FarmOrder(WakeFrame):
         if self.base_frame.initialized:
             self.base_frame.finalize(algo, verbosity)
         super().finalize(algo, verbosity)
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return self.base_frame.uses_state_indices(algo)
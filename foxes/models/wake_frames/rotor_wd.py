@@ -140,3 +140,21 @@ class RotorWD(WakeFrame):
 
         xyz = fdata[FV.TXYH][stsel]
         return xyz[:, None, :] + x[:, :, None] * n[:, None, :]
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
@@ -374,3 +374,21 @@ class Streamlines(WakeFrame):
         results = interpn((np.arange(n_states), xs), spts, qts, **ipars)
 
         return results.reshape(n_states, n_points, 3)
+
+    def uses_state_indices(self, algo):
+        """
+        Flag for models whose results depend on the
+        state index, beyond the state variables.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+
+        Returns
+        -------
+        flag: bool
+            True if the model depends on the state indices
+
+        """
+        return False
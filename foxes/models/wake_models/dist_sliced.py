@@ -146,6 +146,49 @@ class DistSlicedWakeModel(WakeModel):
             algo, mdata, fdata, states_source_turbine, x, yz
         )
 
+        self.superpose_wdeltas(
+            algo,
+            mdata,
+            fdata,
+            states_source_turbine,
+            sp_sel,
+            {v: hdel[:, 0] for v, hdel in wdeltas.items()},
+            wake_deltas,
+        )
+
+    def superpose_wdeltas(
+        self, algo, mdata, fdata, states_source_turbine, sp_sel, wdeltas, wake_deltas
+    ):
+        """
+        Add the wake deltas of selected state-points
+        to the wake deltas, by the superposition models.
+
+        Modifies wake_deltas on the fly.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        sp_sel: numpy.ndarray of bool
+            The state-point selection, shape: (n_states, n_points)
+        wdeltas: dict
+            The wake deltas of the selected state-points.
+            Key: variable name str, value: numpy.ndarray,
+            shape: (n_sp_sel,)
+        wake_deltas: dict
+            The wake deltas, are being modified ob the fly.
+            Key: Variable name str, for which the
+            wake delta applies, values: numpy.ndarray with
+            shape (n_states, n_points, ...)
+
+        """
         for v, hdel in wdeltas.items():
             try:
                 superp = self.superp[v]
@@ -162,7 +205,7 @@ class DistSlicedWakeModel(WakeModel):
                 sp_sel,
                 v,
                 wake_deltas[v],
-                hdel[:, 0],
+                hdel,
             )
 
     def finalize_wake_deltas(self, algo, mdata, fdata, amb_results, wake_deltas):
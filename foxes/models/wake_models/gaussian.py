@@ -8,10 +8,34 @@ class GaussianWakeModel(AxisymmetricWakeModel):
     """
     Abstract base class for Gaussian wake models.
 
+    Attributes
+    ----------
+    reach_sigmas: float
+        The wake reach in multiples of sigma, beyond which
+        wake contributions are culled, or None for no culling
+
     :group: models.wake_models
     
     """
 
+    def __init__(self, superpositions, reach_sigmas=None):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        superpositions: dict
+            The superpositions. Key: variable name str,
+            value: The wake superposition model name,
+            will be looked up in model book
+        reach_sigmas: float, optional
+            The wake reach in multiples of sigma, beyond which
+            wake contributions are culled, or None for no culling
+
+        """
+        super().__init__(superpositions)
+        self.reach_sigmas = reach_sigmas
+
     @abstractmethod
     def calc_amplitude_sigma_spsel(self, algo, mdata, fdata, states_source_turbine, x):
         """
@@ -44,6 +68,142 @@ class GaussianWakeModel(AxisymmetricWakeModel):
         """
         pass
 
+    def calc_reach(self, algo, mdata, fdata, states_source_turbine, x):
+        """
+        Calculate the wake reach, together with model
+        specific data that can be reused for evaluating
+        the state-points within reach.
+
+        The reach is `reach_sigmas` times the largest sigma
+        of all wake variables, the neglected relative wake
+        contribution is thus below exp(-0.5 * reach_sigmas**2).
+        The amplitudes and sigmas are returned as reach data.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        x: numpy.ndarray
+            The x values, shape: (n_states, n_points)
+
+        Returns
+        -------
+        reach: numpy.ndarray
+            The maximal lateral wake radius, shape:
+            (n_states, n_points), or None for unlimited
+        rdata: tuple
+            The amplitudes and sigmas, and the
+            state-point selection of non-zero wakes
+
+        """
+        if self.reach_sigmas is None:
+            return None, None
+
+        amsi, sp_sel = self.calc_amplitude_sigma_spsel(
+            algo, mdata, fdata, states_source_turbine, x
+        )
+
+        reach = np.zeros_like(x)
+        if np.any(sp_sel):
+            sigma = np.max(np.stack([s for __, s in amsi.values()], axis=0), axis=0)
+            reach[sp_sel] = self.reach_sigmas * sigma
+
+        return reach, (amsi, sp_sel)
+
+    def wake_reach(self, algo, mdata, fdata, states_source_turbine, x):
+        """
+        Calculate a conservative lateral reach of the wake.
+
+        See `calc_reach`.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        x: numpy.ndarray
+            The x values, shape: (n_states, n_points)
+
+        Returns
+        -------
+        reach: numpy.ndarray
+            The maximal lateral wake radius, shape:
+            (n_states, n_points), or None for unlimited
+
+        """
+        return self.calc_reach(algo, mdata, fdata, states_source_turbine, x)[0]
+
+    def contribute_to_wake_deltas_spsel(
+        self,
+        algo,
+        mdata,
+        fdata,
+        states_source_turbine,
+        wake_coos,
+        wake_deltas,
+        sp_sel,
+        rdata,
+    ):
+        """
+        Calculate the contribution to the wake deltas
+        of the state-points within the wake reach.
+
+        Only the selected state-points are evaluated,
+        based on the amplitudes and sigmas of `calc_reach`.
+
+        Modifies wake_deltas on the fly.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        wake_coos: numpy.ndarray
+            The wake frame coordinates of the evaluation
+            points, shape: (n_states, n_points, 3)
+        wake_deltas: dict
+            The wake deltas, are being modified ob the fly.
+            Key: Variable name str, for which the
+            wake delta applies, values: numpy.ndarray with
+            shape (n_states, n_points, ...)
+        sp_sel: numpy.ndarray of bool
+            The state-point selection of points within
+            reach, shape: (n_states, n_points)
+        rdata: tuple
+            The reach data, as returned by `calc_reach`
+
+        """
+        amsi, a_sel = rdata
+        rsel = sp_sel[a_sel]
+        r = np.linalg.norm(wake_coos[:, :, 1:3], axis=-1)[sp_sel]
+
+        wdeltas = {}
+        for v, (ampld, sigma) in amsi.items():
+            wdeltas[v] = ampld[rsel] * np.exp(-0.5 * (r / sigma[rsel]) ** 2)
+
+        self.superpose_wdeltas(
+            algo, mdata, fdata, states_source_turbine, sp_sel, wdeltas, wake_deltas
+        )
+
     def calc_wakes_spsel_x_r(self, algo, mdata, fdata, states_source_turbine, x, r):
         """
         Calculate wake deltas.
@@ -140,7 +140,7 @@ class CrespoHernandezTIWake(TopHatWakeModel):
 
         """
         n_states = mdata.n_states
-        wake_deltas[FV.TI] = np.zeros((n_states, n_points), dtype=FC.DTYPE)
+        wake_deltas[FV.TI] = np.zeros((n_states, n_points), dtype=algo.dtype)
 
     def calc_wake_radius(self, algo, mdata, fdata, states_source_turbine, x, ct):
         """
@@ -103,6 +103,47 @@ class TopHatWakeModel(AxisymmetricWakeModel):
         """
         pass
 
+    def wake_reach(self, algo, mdata, fdata, states_source_turbine, x):
+        """
+        Calculate a conservative lateral reach of the wake.
+
+        For top-hat wakes this is the wake radius, such
+        that culling does not modify the results.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        x: numpy.ndarray
+            The x values, shape: (n_states, n_points)
+
+        Returns
+        -------
+        reach: numpy.ndarray
+            The maximal lateral wake radius, shape:
+            (n_states, n_points), or None for unlimited
+
+        """
+        n_states = mdata.n_states
+        n_points = x.shape[1]
+        st_sel = (np.arange(n_states), states_source_turbine)
+
+        ct = np.zeros((n_states, n_points), dtype=FC.DTYPE)
+        ct[:] = fdata[FV.CT][st_sel][:, None]
+        ct[ct > self.ct_max] = self.ct_max
+
+        reach = self.calc_wake_radius(algo, mdata, fdata, states_source_turbine, x, ct)
+        reach[(ct <= 0.0) | (x <= 1e-5)] = 0.0
+
+        return reach
+
     def calc_wakes_spsel_x_r(self, algo, mdata, fdata, states_source_turbine, x, r):
         """
         Calculate wake deltas.
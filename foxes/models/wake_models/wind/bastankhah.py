@@ -31,7 +31,15 @@ class BastankhahWake(GaussianWakeModel):
 
     """
 
-    def __init__(self, superposition, k=None, sbeta_factor=0.25, ct_max=0.9999, k_var=FV.K):
+    def __init__(
+        self,
+        superposition,
+        k=None,
+        sbeta_factor=0.25,
+        ct_max=0.9999,
+        k_var=FV.K,
+        reach_sigmas=None,
+    ):
         """
         Constructor.
         
@@ -51,9 +59,14 @@ class BastankhahWake(GaussianWakeModel):
             to this number
         k_var: str
             The variable name for k
+        reach_sigmas: float, optional
+            The wake reach in multiples of sigma, beyond which
+            wake contributions are culled, or None for no culling
 
         """
-        super().__init__(superpositions={FV.WS: superposition})
+        super().__init__(
+            superpositions={FV.WS: superposition}, reach_sigmas=reach_sigmas
+        )
 
         self.ct_max = ct_max
         self.sbeta_factor = sbeta_factor
@@ -91,7 +104,7 @@ class BastankhahWake(GaussianWakeModel):
 
         """
         n_states = mdata.n_states
-        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=FC.DTYPE)
+        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=algo.dtype)
 
     def calc_amplitude_sigma_spsel(self, algo, mdata, fdata, states_source_turbine, x):
         """
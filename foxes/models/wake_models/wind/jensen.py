@@ -76,7 +76,7 @@ class JensenWake(TopHatWakeModel):
 
         """
         n_states = mdata.n_states
-        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=FC.DTYPE)
+        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=algo.dtype)
 
     def calc_wake_radius(self, algo, mdata, fdata, states_source_turbine, x, ct):
         """
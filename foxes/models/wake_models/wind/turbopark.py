@@ -30,7 +30,14 @@ class TurbOParkWake(GaussianWakeModel):
     """
 
     def __init__(
-        self, superposition, A, sbeta_factor=0.25, ct_max=0.9999, c1=1.5, c2=0.8
+        self,
+        superposition,
+        A,
+        sbeta_factor=0.25,
+        ct_max=0.9999,
+        c1=1.5,
+        c2=0.8,
+        reach_sigmas=None,
     ):
         """
         Constructor.
@@ -52,9 +59,14 @@ class TurbOParkWake(GaussianWakeModel):
             Factor from Frandsen turbulence model
         c2: float
             Factor from Frandsen turbulence model
+        reach_sigmas: float, optional
+            The wake reach in multiples of sigma, beyond which
+            wake contributions are culled, or None for no culling
 
         """
-        super().__init__(superpositions={FV.WS: superposition})
+        super().__init__(
+            superpositions={FV.WS: superposition}, reach_sigmas=reach_sigmas
+        )
 
         self.A = A
         self.ct_max = ct_max
@@ -91,7 +103,7 @@ class TurbOParkWake(GaussianWakeModel):
 
         """
         n_states = mdata.n_states
-        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=FC.DTYPE)
+        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=algo.dtype)
 
     def calc_amplitude_sigma_spsel(self, algo, mdata, fdata, states_source_turbine, x):
         """
@@ -237,6 +249,7 @@ class TurbOParkWakeIX(GaussianWakeModel):
         sbeta_factor=0.25,
         ct_max=0.9999,
         ti_var=FV.TI,
+        reach_sigmas=None,
         **ipars,
     ):
         """
@@ -259,11 +272,16 @@ class TurbOParkWakeIX(GaussianWakeModel):
             to this number
         ti_var:  str
             The TI variable
+        reach_sigmas: float, optional
+            The wake reach in multiples of sigma, beyond which
+            wake contributions are culled, or None for no culling
         ipars: dict, optional
             Additional parameters for centreline integration
 
         """
-        super().__init__(superpositions={FV.WS: superposition})
+        super().__init__(
+            superpositions={FV.WS: superposition}, reach_sigmas=reach_sigmas
+        )
 
         self.dx = dx
         self.A = A
@@ -301,7 +319,7 @@ class TurbOParkWakeIX(GaussianWakeModel):
 
         """
         n_states = mdata.n_states
-        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=FC.DTYPE)
+        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=algo.dtype)
 
     def calc_amplitude_sigma_spsel(self, algo, mdata, fdata, states_source_turbine, x):
         """
@@ -20,6 +20,7 @@ class FarmOptProblem(Problem):
         Additional parameters for algo.calc_farm()
     points : numpy.ndarray
         The probe points, shape: (n_states, n_points, 3)
+        or (n_points, 3)
 
     :group: opt.core
 
@@ -53,6 +54,7 @@ class FarmOptProblem(Problem):
             Additional parameters for algo.calc_farm()
         points : numpy.ndarray, optional
             The probe points, shape: (n_states, n_points, 3)
+            or (n_points, 3)
         kwargs: dict, optional
             Additional parameters for `iwopy.Problem`
 
@@ -357,11 +359,14 @@ class FarmOptProblem(Problem):
         if self.points is None:
             return farm_results
         else:
-            n_pop = farm_results["n_pop"].values
-            n_states, n_points = self.points.shape[:2]
-            pop_points = np.zeros((n_pop, n_states, n_points, 3), dtype=FC.DTYPE)
-            pop_points[:] = self.points[None, :, : , :]
-            pop_points = pop_points.reshape(n_pop*n_states, n_points, 3)
+            if len(self.points.shape) == 2:
+                pop_points = self.points
+            else:
+                n_pop = farm_results["n_pop"].values
+                n_states, n_points = self.points.shape[:2]
+                pop_points = np.zeros((n_pop, n_states, n_points, 3), dtype=FC.DTYPE)
+                pop_points[:] = self.points[None, :, : , :]
+                pop_points = pop_points.reshape(n_pop*n_states, n_points, 3)
             point_results = self.runner.run(self.algo.calc_points, args=(farm_results, pop_points))
             return farm_results, point_results
 
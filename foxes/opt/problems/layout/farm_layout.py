@@ -38,9 +38,7 @@ class FarmLayoutOptProblem(FarmVarsProblem):
             Initial float values, shape: (n_vars_float,)
 
         """
-        out = np.zeros((self.n_sel_turbines, 2), dtype=FC.DTYPE)
-        for i, ti in enumerate(self.sel_turbines):
-            out[i] = self.farm.turbines[ti].xy
+        out = self.farm.xy[self.sel_turbines].astype(FC.DTYPE)
         return out.reshape(self.n_sel_turbines * 2)
 
     def min_values_float(self):
@@ -190,7 +188,6 @@ class FarmLayoutOptProblem(FarmVarsProblem):
         res, objs, cons = super().finalize_individual(vars_int, vars_float, verbosity)
 
         xy = vars_float.reshape(self.n_sel_turbines, 2)
-        for i, ti in enumerate(self.sel_turbines):
-            self.farm.turbines[ti].xy = xy[i]
+        self.farm.xy[self.sel_turbines] = xy
 
         return res, objs, cons
@@ -96,7 +96,7 @@ class RegGridsLayoutOptProblem(FarmVarsProblem):
         self._mname = self.name + "_calc"
         for t in self.algo.farm.turbines:
             if self._mname not in t.models:
-                t.models.append(self._mname)
+                t.add_model(self._mname)
         self._turbine = deepcopy(self.farm.turbines[-1])
 
         self.algo.mbook.turbine_models[self._mname] = Calculator(
@@ -240,9 +240,10 @@ class RegGridsLayoutOptProblem(FarmVarsProblem):
             self.farm.turbines = self.farm.turbines[:n]
         elif n0 < n:
             for i in range(n0, n):
-                self.farm.turbines.append(deepcopy(self._turbine))
-                self.farm.turbines[-1].index = n0 + i
-                self.farm.turbines[-1].name = f"T{n0 + i}"
+                t = deepcopy(self._turbine)
+                t.index = n0 + i
+                t.name = f"T{n0 + i}"
+                self.farm.add_turbine(t, verbosity=0)
         if n != n0:
             self.algo.update_n_turbines()
 
@@ -272,9 +273,10 @@ class RegGridsLayoutOptProblem(FarmVarsProblem):
             self.farm.turbines = self.farm.turbines[:n]
         elif n0 < n:
             for i in range(n0, n):
-                self.farm.turbines.append(deepcopy(self._turbine))
-                self.farm.turbines[-1].index = n0 + i
-                self.farm.turbines[-1].name = f"T{n0 + i}"
+                t = deepcopy(self._turbine)
+                t.index = n0 + i
+                t.name = f"T{n0 + i}"
+                self.farm.add_turbine(t, verbosity=0)
         if n != n0:
             self.algo.update_n_turbines()
 
@@ -67,7 +67,7 @@ class RegularLayoutOptProblem(FarmVarsProblem):
         self._mname = self.name + "_calc"
         for t in self.algo.farm.turbines:
             if self._mname not in t.models:
-                t.models.append(self._mname)
+                t.add_model(self._mname)
         self._turbine = deepcopy(self.farm.turbines[-1])
 
         self.algo.mbook.turbine_models[self._mname] = Calculator(
@@ -104,10 +104,10 @@ class RegularLayoutOptProblem(FarmVarsProblem):
 
         if self.farm.n_turbines < self._nturb:
             for i in range(self._nturb - self.farm.n_turbines):
-                ti = len(self.farm.turbines)
-                self.farm.turbines.append(deepcopy(self._turbine))
-                self.farm.turbines[-1].index = ti
-                self.farm.turbines[-1].name = f"T{ti}"
+                t = deepcopy(self._turbine)
+                t.index = None
+                t.name = None
+                self.farm.add_turbine(t, verbosity=0)
         elif self.farm.n_turbines > self._nturb:
             self.farm.turbines = self.farm.turbines[: self._nturb]
         self.algo.n_turbines = self._nturb
@@ -83,9 +83,8 @@ class FarmLayoutOutput(Output):
             data[:, 2] = self.fres[FV.H][self.rstate]
 
         else:
-            for ti, t in enumerate(self.farm.turbines):
-                data[ti, :2] = t.xy
-                data[ti, 2] = t.H
+            data[:, :2] = self.farm.xy
+            data[:, 2] = self.farm.H
 
         return data
 
@@ -85,7 +85,7 @@ class FarmResultsEval(Output):
         else:
             fields.append(self.results[FV.WEIGHT].to_numpy())
 
-        return np.einsum(expr, *fields)
+        return np.einsum(expr, *fields, dtype=FC.DTYPE)
 
     def reduce_states(self, vars_op):
         """
@@ -112,7 +112,7 @@ class FarmResultsEval(Output):
                 rdata[v] = self.weinsum("t", v)
             elif op == "sum":
                 vdata = self.results[v].to_numpy()
-                rdata[v] = np.sum(vdata, axis=0)
+                rdata[v] = np.sum(vdata, axis=0, dtype=FC.DTYPE)
             elif op == "min":
                 vdata = self.results[v].to_numpy()
                 rdata[v] = np.min(vdata, axis=0)
@@ -157,7 +157,7 @@ class FarmResultsEval(Output):
                 rdata[v] = self.weinsum("s", v)
             elif op == "sum":
                 vdata = self.results[v].to_numpy()
-                rdata[v] = np.sum(vdata, axis=1)
+                rdata[v] = np.sum(vdata, axis=1, dtype=FC.DTYPE)
             elif op == "min":
                 vdata = self.results[v].to_numpy()
                 rdata[v] = np.min(vdata, axis=1)
@@ -210,7 +210,7 @@ class FarmResultsEval(Output):
                     rdata[v] = self.weinsum("", vdata[None, :])
             elif op == "sum":
                 vdata = sdata[v].to_numpy()
-                rdata[v] = np.sum(vdata)
+                rdata[v] = np.sum(vdata, dtype=FC.DTYPE)
             elif op == "min":
                 vdata = sdata[v].to_numpy()
                 rdata[v] = np.min(vdata)
@@ -238,9 +238,6 @@ class FlowPlots2D(Output):
 
         """
 
-        # prepare:
-        n_states = self.algo.n_states
-
         # get base rectangle:
         x_min = xmin if xmin is not None else self.fres[FV.X].min().to_numpy() - xspace
         y_min = ymin if ymin is not None else self.fres[FV.Y].min().to_numpy() - yspace
@@ -268,11 +265,11 @@ class FlowPlots2D(Output):
         N_x, N_y = len(x_pos), len(y_pos)
         n_pts = len(x_pos) * len(y_pos)
         z_pos = 0.5 * (z_min + z_max)
-        g_pts = np.zeros((n_states, N_x, N_y, 3), dtype=FC.DTYPE)
-        g_pts[:, :, :, 0] = x_pos[None, :, None]
-        g_pts[:, :, :, 1] = y_pos[None, None, :]
-        g_pts[:, :, :, 2] = z_pos
-        g_pts = g_pts.reshape(n_states, n_pts, 3)
+        g_pts = np.zeros((N_x, N_y, 3), dtype=FC.DTYPE)
+        g_pts[:, :, 0] = x_pos[:, None]
+        g_pts[:, :, 1] = y_pos[None, :]
+        g_pts[:, :, 2] = z_pos
+        g_pts = g_pts.reshape(n_pts, 3)
 
         if verbosity > 0:
             print("\nFlowPlots2D plot grid:")
@@ -497,11 +494,11 @@ class FlowPlots2D(Output):
         N_x, N_z = len(x_pos), len(z_pos)
         n_pts = len(x_pos) * len(z_pos)
         y_pos = 0.5 * (y_min + y_max)
-        g_pts = np.zeros((n_states, N_x, N_z, 3), dtype=FC.DTYPE)
-        g_pts[:] += x_pos[None, :, None, None] * n_x[None, None, None, :]
-        g_pts[:] += y_pos * n_y[None, None, None, :]
-        g_pts[:] += z_pos[None, None, :, None] * n_z[None, None, None, :]
-        g_pts = g_pts.reshape(n_states, n_pts, 3)
+        g_pts = np.zeros((N_x, N_z, 3), dtype=FC.DTYPE)
+        g_pts[:] += x_pos[:, None, None] * n_x[None, None, :]
+        g_pts[:] += y_pos * n_y[None, None, :]
+        g_pts[:] += z_pos[None, :, None] * n_z[None, None, :]
+        g_pts = g_pts.reshape(n_pts, 3)
 
         if verbosity > 0:
             print("\nFlowPlots2D plot grid:")
@@ -727,11 +724,11 @@ class FlowPlots2D(Output):
         N_y, N_z = len(y_pos), len(z_pos)
         n_pts = len(y_pos) * len(z_pos)
         x_pos = 0.5 * (x_min + x_max)
-        g_pts = np.zeros((n_states, N_y, N_z, 3), dtype=FC.DTYPE)
-        g_pts[:] += x_pos * n_x[None, None, None, :]
-        g_pts[:] += y_pos[None, :, None, None] * n_y[None, None, None, :]
-        g_pts[:] += z_pos[None, None, :, None] * n_z[None, None, None, :]
-        g_pts = g_pts.reshape(n_states, n_pts, 3)
+        g_pts = np.zeros((N_y, N_z, 3), dtype=FC.DTYPE)
+        g_pts[:] += x_pos * n_x[None, None, :]
+        g_pts[:] += y_pos[:, None, None] * n_y[None, None, :]
+        g_pts[:] += z_pos[None, :, None] * n_z[None, None, :]
+        g_pts = g_pts.reshape(n_pts, 3)
 
         if verbosity > 0:
             print("\nFlowPlots2D plot grid:")
@@ -907,9 +904,6 @@ class FlowPlots2D(Output):
 
         """
 
-        # prepare:
-        n_states = self.algo.n_states
-
         # get base rectangle:
         x_min = xmin if xmin is not None else self.fres[FV.X].min().to_numpy() - xspace
         y_min = ymin if ymin is not None else self.fres[FV.Y].min().to_numpy() - yspace
@@ -937,11 +931,11 @@ class FlowPlots2D(Output):
         N_x, N_y = len(x_pos), len(y_pos)
         n_pts = len(x_pos) * len(y_pos)
         z_pos = 0.5 * (z_min + z_max)
-        g_pts = np.zeros((n_states, N_x, N_y, 3), dtype=FC.DTYPE)
-        g_pts[:, :, :, 0] = x_pos[None, :, None]
-        g_pts[:, :, :, 1] = y_pos[None, None, :]
-        g_pts[:, :, :, 2] = z_pos
-        g_pts = g_pts.reshape(n_states, n_pts, 3)
+        g_pts = np.zeros((N_x, N_y, 3), dtype=FC.DTYPE)
+        g_pts[:, :, 0] = x_pos[:, None]
+        g_pts[:, :, 1] = y_pos[None, :]
+        g_pts[:, :, 2] = z_pos
+        g_pts = g_pts.reshape(n_pts, 3)
 
         if verbosity > 0:
             print("\nFlowPlots2D plot grid:")
@@ -1177,11 +1171,11 @@ class FlowPlots2D(Output):
         N_x, N_z = len(x_pos), len(z_pos)
         n_pts = len(x_pos) * len(z_pos)
         y_pos = 0.5 * (y_min + y_max)
-        g_pts = np.zeros((n_states, N_x, N_z, 3), dtype=FC.DTYPE)
-        g_pts[:] += x_pos[None, :, None, None] * n_x[None, None, None, :]
-        g_pts[:] += y_pos * n_y[None, None, None, :]
-        g_pts[:] += z_pos[None, None, :, None] * n_z[None, None, None, :]
-        g_pts = g_pts.reshape(n_states, n_pts, 3)
+        g_pts = np.zeros((N_x, N_z, 3), dtype=FC.DTYPE)
+        g_pts[:] += x_pos[:, None, None] * n_x[None, None, :]
+        g_pts[:] += y_pos * n_y[None, None, :]
+        g_pts[:] += z_pos[None, :, None] * n_z[None, None, :]
+        g_pts = g_pts.reshape(n_pts, 3)
 
         if verbosity > 0:
             print("\nFlowPlots2D plot grid:")
@@ -1419,11 +1413,11 @@ class FlowPlots2D(Output):
         N_y, N_z = len(y_pos), len(z_pos)
         n_pts = len(y_pos) * len(z_pos)
         x_pos = 0.5 * (x_min + x_max)
-        g_pts = np.zeros((n_states, N_y, N_z, 3), dtype=FC.DTYPE)
-        g_pts[:] += x_pos * n_x[None, None, None, :]
-        g_pts[:] += y_pos[None, :, None, None] * n_y[None, None, None, :]
-        g_pts[:] += z_pos[None, None, :, None] * n_z[None, None, None, :]
-        g_pts = g_pts.reshape(n_states, n_pts, 3)
+        g_pts = np.zeros((N_y, N_z, 3), dtype=FC.DTYPE)
+        g_pts[:] += x_pos * n_x[None, None, :]
+        g_pts[:] += y_pos[:, None, None] * n_y[None, None, :]
+        g_pts[:] += z_pos[None, :, None] * n_z[None, None, :]
+        g_pts = g_pts.reshape(n_pts, 3)
 
         if verbosity > 0:
             print("\nFlowPlots2D plot grid:")
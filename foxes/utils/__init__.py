@@ -6,6 +6,10 @@ from .pandas_helpers import PandasFileHelper
 from .subclasses import all_subclasses
 from .dict import Dict
 from .data_book import DataBook
+from .results_cache import ResultsCache, hash_obj
+from .profiler import Profiler
+from .prefetcher import Prefetcher
+from .stencil_cache import StencilCache
 from .plotly_helpers import show_plotly_fig
 from .cubic_roots import cubic_roots
 from .geopandas_helpers import read_shp, shp2csv, read_shp_polygons, shp2geom2d
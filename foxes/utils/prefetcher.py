@@ -0,0 +1,149 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class Prefetcher:
+    """
+    Loads index slices of data in a background thread,
+    ahead of their use.
+
+    Each consumer thread has its own schedule: a request
+    also schedules the slice that this thread is expected
+    to request next, i.e., the slice at the stride of its
+    previous two distinct requests, or the directly
+    following slice at first. Hence reading overlaps with
+    calculations, also if several threads take turns in
+    consuming the slices, in any direction. The buffer of
+    scheduled slices is shared by all threads of the
+    process. The slice that was handed out last is kept
+    per thread for repeated requests, hence results are
+    shared and must not be modified.
+
+    Attributes
+    ----------
+    load: Callable
+        The loading function, parameters: (i0, i1)
+    n_buffer: int
+        The maximal number of buffered slices
+        per consumer thread
+
+    :group: utils
+
+    """
+
+    def __init__(self, load, n_buffer=2):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        load: Callable
+            The loading function, parameters: (i0, i1)
+        n_buffer: int
+            The maximal number of buffered slices
+            per consumer thread, at least 2
+
+        """
+        if n_buffer < 2:
+            raise ValueError(f"Prefetcher: Expecting n_buffer >= 2, got {n_buffer}")
+
+        self.load = load
+        self.n_buffer = n_buffer
+
+        self._pool = None
+        self._buffer = OrderedDict()
+        self._threads = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update(_pool=None, _buffer=OrderedDict(), _threads={}, _lock=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _schedule(self, i0, i1, i_max, step):
+        """
+        Helper function that schedules the next slice
+        of a thread
+        """
+        j0 = i0 + step
+        j1 = j0 + i1 - i0 if i_max is None else min(j0 + i1 - i0, i_max)
+        key = (j0, j1)
+        if j0 < 0 or j0 >= j1 or key in self._buffer:
+            return
+        if any(tdata["key"] == key for tdata in self._threads.values()):
+            return
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="Prefetcher"
+            )
+        self._buffer[key] = self._pool.submit(self.load, j0, j1)
+
+        while len(self._buffer) > self.n_buffer * len(self._threads):
+            __, future = self._buffer.popitem(last=False)
+            future.cancel()
+
+    def get(self, i0, i1, i_max=None):
+        """
+        Gets a slice, and schedules the next one
+        of the calling thread.
+
+        Parameters
+        ----------
+        i0: int
+            The start index
+        i1: int
+            The end index, exclusive
+        i_max: int, optional
+            The total number of indices
+
+        Returns
+        -------
+        data: Any
+            The result of the loading function,
+            not to be modified
+
+        """
+        key = (i0, i1)
+        with self._lock:
+            tdata = self._threads.setdefault(
+                threading.get_ident(), dict(key=None, future=None, step=i1 - i0)
+            )
+            if tdata["key"] == key:
+                future = tdata["future"]
+            else:
+                if tdata["key"] is not None:
+                    tdata["step"] = i0 - tdata["key"][0]
+                future = self._buffer.pop(key, None)
+                if future is not None and future.cancelled():
+                    future = None
+                tdata.update(key=key, future=future)
+                self._schedule(i0, i1, i_max, tdata["step"])
+
+        if future is None:
+            future = Future()
+            future.set_result(self.load(i0, i1))
+            with self._lock:
+                if tdata["key"] == key:
+                    tdata["future"] = future
+
+        return future.result()
+
+    def close(self):
+        """
+        Stops the background thread and
+        clears the buffer.
+        """
+        with self._lock:
+            if self._pool is not None:
+                for future in self._buffer.values():
+                    future.cancel()
+                self._pool.shutdown(wait=True)
+                self._pool = None
+            self._buffer = OrderedDict()
+            self._threads = {}
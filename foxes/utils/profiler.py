@@ -0,0 +1,288 @@
+import os
+import json
+import time
+import uuid
+import warnings
+import threading
+import tracemalloc
+import pandas as pd
+from contextlib import contextmanager
+
+_events = {}
+_lock = threading.Lock()
+_tdata = threading.local()
+_tracing = dict(count=0, owner=False)
+
+
+def pop_events(pid):
+    """
+    Removes and returns the events of a profiler
+    that were recorded in this process.
+
+    Parameters
+    ----------
+    pid: str
+        The profiler id
+
+    Returns
+    -------
+    events: list of dict
+        The recorded events
+
+    :group: utils
+
+    """
+    with _lock:
+        return _events.pop(pid, [])
+
+
+class Profiler:
+    """
+    Records wall times, call counts and peak allocated
+    bytes of model calculations, per model and chunk.
+
+    Events are stored per process, such that profilers
+    can be copied to parallel workers. The peak allocated
+    bytes are measured via `tracemalloc`, i.e., they include
+    all allocations of the process during the call. Hence
+    they are only meaningful if chunks run one at a time
+    per process, and memory measurements are not supported
+    by the thread engine. Tracing is started by the first
+    measurement and stopped when no measurement is active.
+    On Python versions older than 3.9 memory measurements
+    are disabled.
+
+    Attributes
+    ----------
+    pid: str
+        The profiler id
+    memory: bool
+        Flag for peak memory measurements
+    events: list of dict
+        The collected events
+
+    :group: utils
+
+    """
+
+    def __init__(self, memory=True):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        memory: bool
+            Flag for peak memory measurements,
+            slows down calculations. Requires
+            Python 3.9 or newer
+
+        """
+        self.pid = uuid.uuid4().hex
+        self.memory = memory
+        if memory and not hasattr(tracemalloc, "reset_peak"):
+            warnings.warn(
+                "Profiler: Peak memory measurements require Python 3.9 or newer, memory profiling is disabled"
+            )
+            self.memory = False
+        self.events = []
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["events"] = []
+        return state
+
+    @contextmanager
+    def measure(self, name, chunk=None):
+        """
+        Measures the execution of a code block.
+
+        Parameters
+        ----------
+        name: str
+            The name of the measured model or function
+        chunk: str, optional
+            The chunk label
+
+        """
+        stack = getattr(_tdata, "stack", None)
+        if stack is None:
+            stack = _tdata.stack = []
+
+        if self.memory:
+            with _lock:
+                if _tracing["count"] == 0 and not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    _tracing["owner"] = True
+                _tracing["count"] += 1
+            m0, peak = tracemalloc.get_traced_memory()
+            if len(stack):
+                stack[-1] = max(stack[-1], peak)
+            tracemalloc.reset_peak()
+            stack.append(m0)
+
+        start = time.time()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            t1 = time.perf_counter()
+
+            pbytes = None
+            if self.memory:
+                m1, peak = tracemalloc.get_traced_memory()
+                peak = max(stack.pop(), peak)
+                pbytes = max(peak - m0, 0)
+                if len(stack):
+                    stack[-1] = max(stack[-1], peak)
+                tracemalloc.reset_peak()
+
+                with _lock:
+                    _tracing["count"] -= 1
+                    if _tracing["count"] == 0 and _tracing["owner"]:
+                        tracemalloc.stop()
+                        _tracing["owner"] = False
+
+            event = dict(
+                name=name,
+                chunk=chunk,
+                start=start,
+                time=t1 - t0,
+                peak_bytes=pbytes,
+                process=os.getpid(),
+                thread=threading.get_ident(),
+            )
+            with _lock:
+                _events.setdefault(self.pid, []).append(event)
+
+    def collect(self, events=None):
+        """
+        Collects the events of this process,
+        and optionally external events.
+
+        Parameters
+        ----------
+        events: list of dict, optional
+            Events from other processes
+
+        """
+        self.events += pop_events(self.pid)
+        if events is not None:
+            self.events += events
+
+    def collect_dask(self):
+        """
+        Collects the events of this process and
+        of all workers of the dask client, if any.
+        """
+        try:
+            from dask.distributed import get_client
+
+            client = get_client()
+        except ValueError:
+            client = None
+
+        if client is not None:
+            for events in client.run(pop_events, self.pid).values():
+                self.collect(events)
+        else:
+            self.collect()
+
+    def to_dataframe(self):
+        """
+        Gets all collected events.
+
+        Returns
+        -------
+        events: pandas.DataFrame
+            The events, one row per measured call
+
+        """
+        self.collect()
+        return pd.DataFrame(
+            self.events,
+            columns=[
+                "name",
+                "chunk",
+                "start",
+                "time",
+                "peak_bytes",
+                "process",
+                "thread",
+            ],
+        )
+
+    def summary(self, per_chunk=False):
+        """
+        Aggregates the collected events.
+
+        Parameters
+        ----------
+        per_chunk: bool
+            Aggregate per model and chunk,
+            instead of per model only
+
+        Returns
+        -------
+        summary: pandas.DataFrame
+            The number of calls, the total and mean
+            wall time and the maximal peak allocated bytes
+
+        """
+        grp = ["name", "chunk"] if per_chunk else ["name"]
+        df = self.to_dataframe()
+        return df.groupby(grp, sort=False, dropna=False).agg(
+            calls=("time", "size"),
+            time=("time", "sum"),
+            mean_time=("time", "mean"),
+            peak_bytes=("peak_bytes", "max"),
+        )
+
+    def to_json(self, file_path):
+        """
+        Writes the collected events to a JSON file.
+
+        Parameters
+        ----------
+        file_path: str
+            The path to the output file
+
+        """
+        self.collect()
+        with open(file_path, "w") as f:
+            json.dump(self.events, f, indent=2)
+
+    def to_chrome_trace(self, file_path):
+        """
+        Writes the collected events in the Chrome
+        trace event format, e.g. for chrome://tracing
+        or Perfetto.
+
+        Parameters
+        ----------
+        file_path: str
+            The path to the output file
+
+        """
+        self.collect()
+        t0 = min([e["start"] for e in self.events], default=0)
+        trace = [
+            dict(
+                name=e["name"],
+                ph="X",
+                ts=(e["start"] - t0) * 1e6,
+                dur=e["time"] * 1e6,
+                pid=e["process"],
+                tid=e["thread"],
+                args=dict(chunk=e["chunk"], peak_bytes=e["peak_bytes"]),
+            )
+            for e in self.events
+        ]
+        with open(file_path, "w") as f:
+            json.dump({"traceEvents": trace}, f)
+
+    def reset(self):
+        """
+        Removes all collected events.
+        """
+        pop_events(self.pid)
+        self.events = []
@@ -0,0 +1,258 @@
+import os
+import hashlib
+import inspect
+import numpy as np
+import pandas as pd
+import xarray as xr
+from pathlib import Path
+from dask.utils import parse_bytes
+
+
+def hash_obj(*objs, skip_attrs=("name", "verbosity"), names=None):
+    """
+    Computes a hash of objects, based on their content.
+
+    Arrays, pandas and xarray objects are hashed via their
+    data, with times in nanoseconds, containers via their
+    entries and other objects via their type and public
+    attributes. Paths and strings that name existing files
+    also contribute the file size and modification time.
+    Skipped object names, e.g. counter-based model names,
+    are replaced within strings by placeholders, in the
+    order of their appearance.
+
+    Parameters
+    ----------
+    objs: tuple
+        The objects to be hashed
+    skip_attrs: tuple of str
+        Object attributes that are ignored
+    names: dict, optional
+        The placeholders of object names, key: name,
+        value: placeholder. Extended during hashing
+
+    Returns
+    -------
+    key: str
+        The hex digest
+
+    :group: utils
+
+    """
+    h = hashlib.sha256()
+    seen = set()
+    names = {} if names is None else names
+
+    def _sub(s):
+        for n in sorted(names.keys(), key=len, reverse=True):
+            s = s.replace(n, names[n])
+        return s
+
+    def _stat(p):
+        try:
+            if os.path.isfile(p):
+                st = os.stat(p)
+                h.update(f"file:{st.st_size}:{st.st_mtime_ns};".encode())
+        except (OSError, ValueError):
+            pass
+
+    def _upd(o):
+        if isinstance(o, str):
+            _stat(o)
+            o = _sub(o)
+
+        if o is None or isinstance(o, (bool, int, float, complex, str, bytes)):
+            h.update(f"{type(o).__name__}:{o!r};".encode())
+        elif isinstance(o, np.ndarray):
+            if o.dtype.kind in "mM":
+                o = o.astype(f"{o.dtype.kind}8[ns]")
+            if o.dtype == object or o.dtype.kind == "U":
+                h.update(f"ndarray:{o.dtype.kind}:{o.shape};".encode())
+                _upd(o.tolist())
+            else:
+                h.update(f"ndarray:{o.dtype}:{o.shape};".encode())
+                h.update(np.ascontiguousarray(o).tobytes())
+        elif isinstance(o, np.generic):
+            _upd(o.item())
+        elif isinstance(o, (pd.DataFrame, pd.Series)):
+            h.update(f"{type(o).__name__};".encode())
+            if isinstance(o, pd.DataFrame):
+                _upd(list(o.columns))
+            h.update(pd.util.hash_pandas_object(o).values.tobytes())
+        elif isinstance(o, (xr.Dataset, xr.DataArray)):
+            if isinstance(o, xr.DataArray):
+                o = o.to_dataset(name="data")
+            keys = [
+                hash_obj(d.dims, d.values, skip_attrs=skip_attrs, names=names)
+                for d in list(o.data_vars.values()) + list(o.coords.values())
+            ]
+            _upd(sorted(keys))
+        elif isinstance(o, (list, tuple)):
+            h.update(f"{type(o).__name__}:{len(o)};".encode())
+            for x in o:
+                _upd(x)
+        elif isinstance(o, (set, frozenset)):
+            _upd(
+                sorted(
+                    [hash_obj(x, skip_attrs=skip_attrs, names=names) for x in o]
+                )
+            )
+        elif isinstance(o, dict):
+            h.update(f"dict:{len(o)};".encode())
+            for k in sorted(o.keys(), key=lambda k: _sub(str(k))):
+                _upd(k)
+                _upd(o[k])
+        elif isinstance(o, Path):
+            _upd(str(o))
+        elif isinstance(o, type) or inspect.isroutine(o):
+            h.update(f"{o.__module__}.{o.__qualname__};".encode())
+        elif id(o) in seen:
+            h.update(f"ref:{type(o).__name__};".encode())
+        elif hasattr(o, "__dict__"):
+            seen.add(id(o))
+            n = getattr(o, "name", None) if "name" in skip_attrs else None
+            if isinstance(n, str) and len(n) and n not in names:
+                names[n] = f"<obj{len(names)}>"
+            h.update(f"{type(o).__module__}.{type(o).__qualname__};".encode())
+            _upd(
+                {
+                    k: v
+                    for k, v in vars(o).items()
+                    if k[0] != "_" and k not in skip_attrs
+                }
+            )
+        else:
+            h.update(f"{type(o).__name__}:{o!r};".encode())
+
+    for o in objs:
+        _upd(o)
+
+    return h.hexdigest()
+
+
+class ResultsCache:
+    """
+    A size bounded file cache for calculation results,
+    with least recently used eviction.
+
+    Attributes
+    ----------
+    cache_dir: pathlib.Path
+        The cache directory
+    max_size: int
+        The maximal size of all cached files in bytes
+
+    :group: utils
+
+    """
+
+    def __init__(self, cache_dir, max_size="10GB"):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        cache_dir: str
+            The cache directory
+        max_size: int or str
+            The maximal size of all cached files, in bytes
+            or as string with units, e.g. "500MB"
+
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size = parse_bytes(max_size)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.cache_dir}, max_size={self.max_size})"
+
+    def _fpath(self, key):
+        """
+        Helper function for the file path of a key
+        """
+        return self.cache_dir / f"{key}.nc"
+
+    def key(self, *objs):
+        """
+        Computes the cache key of objects.
+
+        Parameters
+        ----------
+        objs: tuple
+            The objects that determine the results
+
+        Returns
+        -------
+        key: str
+            The cache key
+
+        """
+        return hash_obj(*objs)
+
+    def load(self, key):
+        """
+        Loads cached results.
+
+        Parameters
+        ----------
+        key: str
+            The cache key
+
+        Returns
+        -------
+        results: xarray.Dataset or None
+            The cached results, or None if not found
+
+        """
+        fpath = self._fpath(key)
+        if not fpath.is_file():
+            return None
+        os.utime(fpath)
+        with xr.open_dataset(fpath) as ds:
+            return ds.load()
+
+    def store(self, key, results):
+        """
+        Stores results and evicts the least
+        recently used entries, if required.
+
+        Parameters
+        ----------
+        key: str
+            The cache key
+        results: xarray.Dataset
+            The results
+
+        """
+        fpath = self._fpath(key)
+        tpath = fpath.with_suffix(".tmp")
+        results.to_netcdf(tpath)
+        tpath.replace(fpath)
+        self.evict(keep=fpath)
+
+    def evict(self, keep=None):
+        """
+        Removes least recently used entries until
+        the cache size is within bounds.
+
+        Parameters
+        ----------
+        keep: pathlib.Path, optional
+            A file that is never removed
+
+        """
+        fpaths = sorted(self.cache_dir.glob("*.nc"), key=lambda f: f.stat().st_mtime)
+        size = sum([f.stat().st_size for f in fpaths])
+        for f in fpaths:
+            if size <= self.max_size:
+                break
+            if f != keep:
+                size -= f.stat().st_size
+                f.unlink()
+
+    def clear(self):
+        """
+        Removes all cached results.
+        """
+        for f in self.cache_dir.glob("*.nc"):
+            f.unlink()
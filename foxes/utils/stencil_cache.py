@@ -0,0 +1,125 @@
+import hashlib
+import threading
+import numpy as np
+from collections import OrderedDict
+
+
+class StencilCache:
+    """
+    A thread-safe cache of interpolation stencils
+    of state invariant point sets.
+
+    Stencils of point sets that differ between states
+    are calculated on every request, without hashing.
+    Invariant point sets are identified by the grid
+    coordinates and the points of the first state.
+
+    Attributes
+    ----------
+    max_size: int
+        The maximal number of cached stencils
+
+    :group: utils
+
+    """
+
+    def __init__(self, max_size=16):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        max_size: int
+            The maximal number of cached stencils
+
+        """
+        self.max_size = max_size
+
+        self._stencils = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update(_stencils=OrderedDict(), _lock=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_invariant(points):
+        """
+        Checks if points are identical for all states
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            The points, shape: (n_states, ...)
+
+        Returns
+        -------
+        invariant: bool
+            True if all states share the same points
+
+        """
+        if points.shape[0] < 2 or points.strides[0] == 0:
+            return True
+        if not np.array_equal(points[0], points[-1]):
+            return False
+        return np.array_equal(points[1:], points[:-1])
+
+    def get(self, grid, points, calc):
+        """
+        Gets the stencil of a point set
+
+        Parameters
+        ----------
+        grid: tuple of numpy.ndarray
+            The grid coordinates the stencil refers to
+        points: numpy.ndarray
+            The points, shape: (n_states, ...)
+        calc: Callable
+            The stencil calculation function, parameters:
+            (grid, points). Called either with the points
+            of the first state, if state invariant, or
+            with all points otherwise
+
+        Returns
+        -------
+        stencil: Any
+            The result of the calculation function
+
+        """
+        if not self.is_invariant(points):
+            return calc(grid, points)
+
+        pts = points[0]
+        sha = hashlib.sha1()
+        for a in grid + (pts,):
+            a = np.ascontiguousarray(a)
+            sha.update(str(a.shape).encode())
+            sha.update(a.tobytes())
+        key = sha.hexdigest()
+
+        with self._lock:
+            stencil = self._stencils.get(key, None)
+            if stencil is not None:
+                self._stencils.move_to_end(key)
+                return stencil
+
+        stencil = calc(grid, pts)
+
+        with self._lock:
+            self._stencils[key] = stencil
+            while len(self._stencils) > self.max_size:
+                self._stencils.popitem(last=False)
+
+        return stencil
+
+    def clear(self):
+        """
+        Removes all cached stencils
+        """
+        with self._lock:
+            self._stencils = OrderedDict()
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+class NoEstimate(foxes.algorithms.Downwind):
+    def estimate_state_bytes(self, n_points=None, point_vars=None):
+        return None
+
+
+def test(create_algo):
+    points = np.zeros((500, 3))
+    points[:, 0] = np.linspace(99500.0, 105500.0, 500)
+    points[:, 1] = 1002500.0
+    points[:, 2] = 90.0
+
+    algo = create_algo(rotor_model="grid9", chunks=None)
+    fres0 = algo.calc_farm()
+    pres0 = algo.calc_points(fres0, points)
+
+    algo = create_algo(rotor_model="grid9", chunks="auto", mem_budget="200KB")
+    fres = algo.calc_farm()
+    print("Farm chunks:", algo.chunks)
+    assert algo.chunks[FC.STATE] < 100
+    pres = algo.calc_points(fres, points)
+    print("Point chunks:", algo.chunks)
+    assert algo.chunks.get(FC.POINT, 500) < 500
+
+    for v in [FV.REWS, FV.TI, FV.P]:
+        delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+        print(f"Farm {v} max delta = {np.max(delta)}")
+        assert np.max(delta) < 1e-12
+    for v in [FV.WS, FV.TI]:
+        delta = np.abs(pres[v].to_numpy() - pres0[v].to_numpy())
+        print(f"Points {v} max delta = {np.max(delta)}")
+        assert np.max(delta) < 1e-12
+
+    algo = create_algo(
+        rotor_model="grid9", chunks="auto", mem_budget="200KB", engine="thread"
+    )
+    fres = algo.calc_farm()
+    print("Thread chunks:", algo.chunks)
+    assert algo.chunks[FC.STATE] < 100
+    for v in [FV.REWS, FV.TI, FV.P]:
+        delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+        print(f"Thread farm {v} max delta = {np.max(delta)}")
+        assert np.max(delta) < 1e-12
+
+    algo = create_algo(NoEstimate, rotor_model="grid9", chunks="auto")
+    with pytest.raises(ValueError):
+        algo.calc_farm()
+
+    with pytest.raises(ValueError):
+        create_algo(rotor_model="grid9", chunks="auto", engine="numpy")
@@ -0,0 +1,112 @@
+"""
+Shared setup of the consistency tests, based on the static data.
+"""
+import pandas as pd
+import pytest
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+TTYPE = "NREL-5MW"
+
+
+def _create_mbook():
+    mbook = foxes.models.ModelBook()
+    mbook.turbine_types[TTYPE] = foxes.models.turbine_types.PCtFile(
+        data_source="NREL-5MW-D126-H90.csv", var_ws_ct=FV.REWS, var_ws_P=FV.REWS
+    )
+    return mbook
+
+
+def _states_data(states_sel=slice(100)):
+    fpath = foxes.StaticData().get_file_path(foxes.STATES, "timeseries_3000.csv.gz")
+    return pd.read_csv(fpath, index_col=0, parse_dates=[0]).iloc[states_sel]
+
+
+def _create_states(states_sel=slice(100), **kwargs):
+    return foxes.input.states.StatesTable(
+        data_source=_states_data(states_sel),
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        **kwargs,
+    )
+
+
+def _farm_data(n_turbines=32):
+    fpath = foxes.StaticData().get_file_path(foxes.FARM, "test_farm_67.csv")
+    return pd.read_csv(fpath, index_col=0).iloc[:n_turbines]
+
+
+def _create_farm(turbine_models=["kTI_02", TTYPE], n_turbines=32, **kwargs):
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_from_df(
+        farm,
+        _farm_data(n_turbines),
+        turbine_models=turbine_models,
+        verbosity=0,
+        **kwargs,
+    )
+    return farm
+
+
+def _create_algo(
+    algo_type=foxes.algorithms.Downwind, mbook=None, farm=None, states=None, **kwargs
+):
+    pars = dict(
+        rotor_model="centre",
+        wake_models=["Bastankhah_linear"],
+        wake_frame="rotor_wd",
+        partial_wakes_model="rotor_points",
+        chunks={FC.STATE: 16},
+        verbosity=0,
+    )
+    pars.update(kwargs)
+
+    return algo_type(
+        _create_mbook() if mbook is None else mbook,
+        _create_farm() if farm is None else farm,
+        states=_create_states() if states is None else states,
+        **pars,
+    )
+
+
+@pytest.fixture
+def ttype():
+    """The name of the turbine type of the model books"""
+    return TTYPE
+
+
+@pytest.fixture
+def create_mbook():
+    """Creates model books with the NREL-5MW turbine type"""
+    return _create_mbook
+
+
+@pytest.fixture
+def states_data():
+    """Reads a selection of the timeseries_3000 states"""
+    return _states_data
+
+
+@pytest.fixture
+def create_states():
+    """Creates states from a selection of the timeseries_3000 states"""
+    return _create_states
+
+
+@pytest.fixture
+def farm_data():
+    """Reads the first test_farm_67 turbines"""
+    return _farm_data
+
+
+@pytest.fixture
+def create_farm():
+    """Creates a wind farm of the first test_farm_67 turbines"""
+    return _create_farm
+
+
+@pytest.fixture
+def create_algo():
+    """Creates algorithms, by default for the shared setup"""
+    return _create_algo
@@ -0,0 +1,108 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import numpy as np
+import xarray as xr
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def write_nc(fpath, n_states=30):
+    x = np.linspace(0.0, 10000.0, 21)
+    y = np.linspace(0.0, 8000.0, 17)
+    h = np.linspace(0.0, 500.0, 11)
+    s = np.arange(n_states)
+
+    rng = np.random.default_rng(42)
+    shp = (n_states, len(h), len(y), len(x))
+    ws = 6.0 + 4.0 * rng.random(shp)
+    wd = 250.0 + 40.0 * rng.random(shp)
+    ti = 0.04 + 0.06 * rng.random(shp)
+
+    dims = ("state", "h", "y", "x")
+    xr.Dataset(
+        data_vars=dict(ws=(dims, ws), wd=(dims, wd), ti=(dims, ti)),
+        coords=dict(state=s, h=h, y=y, x=x),
+    ).to_netcdf(fpath)
+
+
+def setup_algo(create_algo, ttype, fpath, pre_load, xy_margin, h_margin):
+    states = foxes.input.states.FieldDataNC(
+        data_source=fpath,
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2ncvar={FV.WS: "ws", FV.WD: "wd", FV.TI: "ti"},
+        fixed_vars={FV.RHO: 1.225},
+        states_coord="state",
+        x_coord="x",
+        y_coord="y",
+        h_coord="h",
+        time_format=None,
+        pre_load=pre_load,
+        xy_margin=xy_margin,
+        h_margin=h_margin,
+        verbosity=0,
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([4000.0, 3500.0]),
+        step_vectors=np.array([[500.0, 0.0], [0.0, 400.0]]),
+        steps=[3, 3],
+        turbine_models=["kTI_02", ttype],
+        verbosity=0,
+    )
+
+    algo = create_algo(
+        farm=farm,
+        states=states,
+        rotor_model="grid4",
+        chunks={FC.STATE: 8},
+    )
+
+    return algo, states
+
+
+def test(create_algo, ttype):
+    points = np.zeros((200, 3))
+    points[:, 0] = np.linspace(500.0, 9500.0, 200)
+    points[:, 1] = 6000.0
+    points[:, 2] = 120.0
+
+    with TemporaryDirectory() as tdir:
+        fpath = Path(tdir) / "data.nc"
+        write_nc(fpath)
+
+        algo, states = setup_algo(create_algo, ttype, fpath, True, None, None)
+        assert states.data_source["ws"].chunks is None
+        fres0 = algo.calc_farm()
+        pres0 = algo.calc_points(fres0, points)
+
+        for pre_load, xy_margin, h_margin in [
+            (True, 600.0, 50.0),
+            (False, 600.0, 50.0),
+            (False, None, None),
+        ]:
+            case = (pre_load, xy_margin, h_margin)
+            print(f"\nENTERING CASE {case}\n")
+
+            algo, states = setup_algo(
+                create_algo, ttype, fpath, pre_load, xy_margin, h_margin
+            )
+            if pre_load:
+                assert states.data_source["ws"].chunks is not None
+            algo.initialize()
+            assert np.all(np.isfinite(states._bounds[:, 0])) == (xy_margin is not None)
+
+            fres = algo.calc_farm()
+            pres = algo.calc_points(fres, points)
+
+            for v in [FV.REWS, FV.TI, FV.P]:
+                delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+                print(f"CASE {case}: farm {v} max delta = {np.max(delta)}")
+                assert np.max(delta) < 1e-12
+            for v in [FV.WS, FV.WD, FV.TI]:
+                delta = np.abs(pres[v].to_numpy() - pres0[v].to_numpy())
+                print(f"CASE {case}: points {v} max delta = {np.max(delta)}")
+                assert np.max(delta) < 1e-10
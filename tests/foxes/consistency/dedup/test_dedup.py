@@ -0,0 +1,62 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def calc(create_algo, create_mbook, create_farm, sdata, deduplicate, tmodel=None):
+    mbook = create_mbook()
+    tmodels = ["kTI_02", "NREL-5MW"]
+    if tmodel is not None:
+        mbook.turbine_models["tmodel"] = tmodel
+        tmodels.append("tmodel")
+
+    states = foxes.input.states.StatesTable(
+        data_source=sdata,
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        deduplicate=deduplicate,
+    )
+
+    algo = create_algo(
+        mbook=mbook, farm=create_farm(turbine_models=tmodels), states=states
+    )
+
+    algo.initialize()
+    n_states = algo.n_states
+    farm_results = algo.calc_farm()
+
+    return n_states, farm_results
+
+
+def test(create_algo, create_mbook, create_farm, states_data):
+    sdata = states_data(slice(50))
+    sdata = sdata.iloc[np.r_[0:50, 49:-1:-1]]
+    n_states = len(sdata.index)
+
+    ct = np.zeros((n_states, 32))
+    ct[:] = np.linspace(0.3, 0.8, n_states)[:, None]
+    set_ct = foxes.models.turbine_models.SetFarmVars()
+    set_ct.add_var(FV.CT, ct)
+
+    calc_ct = foxes.models.turbine_models.Calculator(
+        [FV.CT], [FV.CT], lambda ct, st_sel: (ct,)
+    )
+
+    for name, tmodel, n_dedup in [
+        ("none", None, n_states // 2),
+        ("set_ct", set_ct, n_states),
+        ("calc_ct", calc_ct, n_states),
+    ]:
+        n0, fres0 = calc(create_algo, create_mbook, create_farm, sdata, False, tmodel)
+        n1, fres1 = calc(create_algo, create_mbook, create_farm, sdata, True, tmodel)
+        print(f"CASE {name}: n_states = {n0}, {n1}")
+
+        assert n0 == n_states
+        assert n1 == n_dedup
+        assert fres1.sizes[FC.STATE] == n_states
+
+        for v in [FV.REWS, FV.TI, FV.CT, FV.P]:
+            delta = np.abs(fres1[v].to_numpy() - fres0[v].to_numpy())
+            print(f"CASE {name}: {v} max delta = {np.max(delta)}")
+            assert np.max(delta) < 1e-10
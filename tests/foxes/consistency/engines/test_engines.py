@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def calc(create_algo, algo_type, engine, chunks, points, **kwargs):
+    algo = create_algo(
+        algo_type,
+        rotor_model="grid4",
+        wake_models=["Bastankhah_linear", "CrespoHernandez_max"],
+        chunks=chunks,
+        engine=engine,
+        **kwargs,
+    )
+    fres = algo.calc_farm()
+    pres = algo.calc_points(fres, points)
+    return fres, pres
+
+
+@pytest.mark.parametrize(
+    "engine,n_workers,chunks",
+    [
+        ("numpy", None, None),
+        ("numpy", None, {FC.STATE: 16}),
+        ("thread", 3, None),
+        ("thread", 3, {FC.STATE: 16}),
+        ("thread", 3, {FC.STATE: 7}),
+        ("process", 2, None),
+        ("process", 2, {FC.STATE: 16}),
+    ],
+)
+@pytest.mark.parametrize(
+    "algo_type", [foxes.algorithms.Downwind, foxes.algorithms.Iterative]
+)
+def test(create_algo, algo_type, engine, n_workers, chunks):
+    points = np.zeros((200, 3))
+    points[:, 0] = np.linspace(100000.0, 105000.0, 200)
+    points[:, 1] = 1002500.0
+    points[:, 2] = 90.0
+
+    fres0, pres0 = calc(create_algo, algo_type, "dask", {FC.STATE: 16}, points)
+
+    pars = {} if n_workers is None else dict(n_workers=n_workers)
+    fres, pres = calc(create_algo, algo_type, engine, chunks, points, **pars)
+
+    for v in [FV.REWS, FV.TI, FV.CT, FV.P]:
+        delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+        print(f"farm {v} max delta = {np.max(delta)}")
+        assert np.max(delta) < 1e-10
+    for v in [FV.WS, FV.WD, FV.TI]:
+        delta = np.abs(pres[v].to_numpy() - pres0[v].to_numpy())
+        print(f"points {v} max delta = {np.max(delta)}")
+        assert np.max(delta) < 1e-10
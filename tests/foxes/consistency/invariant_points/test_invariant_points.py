@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+@pytest.mark.parametrize(
+    "stype, chunks",
+    [
+        ("single", None),
+        ("table", None),
+        ("table", {FC.STATE: 100}),
+        ("table", {FC.STATE: 100, FC.POINT: 70}),
+    ],
+)
+def test(create_algo, create_states, stype, chunks):
+    if stype == "single":
+        states = foxes.input.states.SingleStateStates(
+            ws=9.0, wd=270.0, ti=0.08, rho=1.225
+        )
+    else:
+        states = create_states(slice(500))
+
+    algo = create_algo(states=states, chunks=chunks)
+    farm_results = algo.calc_farm()
+
+    rng = np.random.default_rng(42)
+    pmin = np.min(algo.farm.xy, axis=0)
+    pmax = np.max(algo.farm.xy, axis=0)
+    points = np.zeros((200, 3), dtype=FC.DTYPE)
+    points[:, :2] = pmin[None, :] + rng.uniform(0, 1, (200, 2)) * (pmax - pmin)
+    points[:, 2] = 100.0
+
+    pres0 = algo.calc_points(farm_results, points)
+    pres1 = algo.calc_points(
+        farm_results,
+        np.broadcast_to(points[None], (algo.n_states, 200, 3)).copy(),
+    )
+
+    for v in [FV.WS, FV.WD, FV.TI]:
+        assert pres0[v].shape == (algo.n_states, 200)
+        delta = np.abs(pres0[v].to_numpy() - pres1[v].to_numpy())
+        print(f"CASE {(stype, chunks)}: {v} max delta = {np.max(delta)}")
+        assert np.max(delta) < 1e-10
@@ -0,0 +1,29 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+from foxes.algorithms.iterative.models import ConvVarDelta, Aitken, Anderson
+
+
+def calc(create_algo, create_states, accel):
+    algo = create_algo(
+        foxes.algorithms.Iterative,
+        states=create_states(slice(None, None, 50)),
+        wake_models=["Bastankhah_linear", "CrespoHernandez_max"],
+        conv=ConvVarDelta({FV.REWS: 1e-8, FV.TI: 1e-10, FV.CT: 1e-10}),
+        max_its=200,
+        accel=accel,
+    )
+
+    return algo.calc_farm()
+
+
+def test(create_algo, create_states):
+    fres0 = calc(create_algo, create_states, None)
+    for accel in [Aitken(), Anderson()]:
+        print(f"\nENTERING CASE {accel.name}\n")
+        fres = calc(create_algo, create_states, accel)
+        for v in [FV.REWS, FV.TI, FV.CT, FV.P]:
+            delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+            print(f"CASE {accel.name}: {v} max delta = {np.max(delta)}")
+            assert np.max(delta) < 1e-5
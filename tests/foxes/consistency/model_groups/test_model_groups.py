@@ -0,0 +1,56 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+
+
+def setup_algo(create_algo, create_mbook, create_states, farm):
+    mbook = create_mbook()
+    for tname in ["T1", "T2", "T3"]:
+        mbook.turbine_types[tname] = foxes.models.turbine_types.PCtFile(
+            data_source="NREL-5MW-D126-H90.csv",
+            var_ws_ct=FV.REWS,
+            var_ws_P=FV.REWS,
+        )
+
+    return create_algo(mbook=mbook, farm=farm, states=create_states(slice(60)))
+
+
+def setup_farm(ldata, mlists):
+    farm = foxes.WindFarm()
+    for i, r in ldata.iterrows():
+        farm.add_turbine(
+            foxes.Turbine(
+                xy=r[["x", "y"]].to_numpy(),
+                turbine_models=mlists[i % len(mlists)],
+                index=i,
+                name=r["label"],
+            ),
+            verbosity=0,
+        )
+    return farm
+
+
+def test(create_algo, create_mbook, create_states, farm_data):
+    ldata = farm_data()
+    pars = (create_algo, create_mbook, create_states)
+
+    farm = setup_farm(ldata, [["kTI_02", "T1"]])
+    fres0 = setup_algo(*pars, farm).calc_farm()
+
+    for mlists in [
+        [["kTI_02", "T1"], ["kTI_02", "T2"]],
+        [["kTI_02", "T3"], ["kTI_02", "T1"], ["kTI_02", "T2"], ["kTI_02", "T1"]],
+    ]:
+        print(f"\nENTERING CASE {mlists}\n")
+
+        farm = setup_farm(ldata, mlists)
+        for r in range(2):
+            fres = setup_algo(*pars, farm).calc_farm()
+            print(f"CASE {mlists}, run {r}: {len(farm.model_orders)} cached orders")
+            assert len(farm.model_orders) > 0
+
+            for v in [FV.REWS, FV.TI, FV.CT, FV.P]:
+                delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+                print(f"CASE {mlists}, run {r}: {v} max delta = {np.max(delta)}")
+                assert np.max(delta) < 1e-12
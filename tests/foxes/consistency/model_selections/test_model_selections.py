@@ -0,0 +1,58 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+
+
+def calc(create_algo, create_mbook, ttype, sdata, ldata, ssel, mode):
+    n_states = len(sdata.index)
+    n_turbines = len(ldata.index)
+
+    mbook = create_mbook()
+    mbook.turbine_models["set_ct"] = foxes.models.turbine_models.SetFarmVars()
+    mbook.turbine_models["set_ct"].add_var(FV.CT, np.full((n_states, n_turbines), 0.4))
+
+    states = foxes.input.states.StatesTable(
+        data_source=sdata, output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO]
+    )
+
+    farm = foxes.WindFarm()
+    for i, r in ldata.iterrows():
+        models = ["kTI_02", ttype]
+        msels = None
+        if i % 2 == 0 and mode != "never":
+            models.append("set_ct")
+            if mode == "selected":
+                msels = [None, None, ssel]
+        farm.add_turbine(
+            foxes.Turbine(
+                xy=r[["x", "y"]].to_numpy(),
+                turbine_models=models,
+                models_state_sel=msels,
+                index=i,
+                name=r["label"],
+            ),
+            verbosity=0,
+        )
+
+    return create_algo(mbook=mbook, farm=farm, states=states).calc_farm()
+
+
+def test(create_algo, create_mbook, ttype, states_data, farm_data):
+    sdata = states_data(slice(60))
+    ldata = farm_data()
+    ssel = np.arange(len(sdata.index)) % 3 == 0
+    pars = (create_algo, create_mbook, ttype, sdata, ldata, ssel)
+
+    fres_a = calc(*pars, "always")
+    fres_n = calc(*pars, "never")
+    fres = calc(*pars, "selected")
+
+    assert np.all(fres_a[FV.CT].to_numpy()[:, ::2] == 0.4)
+    assert np.any(fres_n[FV.CT].to_numpy()[:, ::2] != 0.4)
+
+    for v in [FV.REWS, FV.TI, FV.CT, FV.P]:
+        for case, fres0, sel in [("always", fres_a, ssel), ("never", fres_n, ~ssel)]:
+            delta = np.abs(fres[v].to_numpy()[sel] - fres0[v].to_numpy()[sel])
+            print(f"CASE {case}: {v} max delta = {np.max(delta)}")
+            assert np.max(delta) < 1e-12
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def setup_algo(create_algo, create_farm, ipars):
+    states = foxes.input.states.MultiHeightTimeseries(
+        data_source="WRF-Timeseries-4464.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        heights=[50, 75, 90, 100, 150, 200, 250, 500],
+        fixed_vars={FV.TI: 0.05},
+        states_sel=range(100),
+        ipars=ipars,
+    )
+
+    return create_algo(
+        farm=create_farm(H=170.0),
+        states=states,
+        rotor_model="grid9",
+        chunks={FC.STATE: 32},
+    )
+
+
+def calc(create_algo, create_farm, ipars, points):
+    algo = setup_algo(create_algo, create_farm, ipars)
+    fres = algo.calc_farm()
+    return fres, algo.calc_points(fres, points)
+
+
+def test(create_algo, create_farm):
+    rng = np.random.default_rng(42)
+    points = np.zeros((300, 3))
+    points[:, 0] = rng.uniform(99500.0, 105500.0, 300)
+    points[:, 1] = rng.uniform(999500.0, 1005500.0, 300)
+    points[:, 2] = rng.uniform(50.0, 500.0, 300)
+    xpoints = points.copy()
+    xpoints[:, 2] = rng.uniform(10.0, 700.0, 300)
+
+    for pts, pars in [
+        (points, {}),
+        (xpoints, dict(bounds_error=False, fill_value="extrapolate")),
+        (xpoints, dict(bounds_error=False, fill_value=np.nan)),
+    ]:
+        print(f"\nENTERING CASE {pars}\n")
+
+        fres0, pres0 = calc(create_algo, create_farm, dict(kind="slinear", **pars), pts)
+        fres, pres = calc(create_algo, create_farm, dict(kind="linear", **pars), pts)
+
+        for v in [FV.REWS, FV.P]:
+            delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+            print(f"CASE {pars}: farm {v} max delta = {np.max(delta)}")
+            assert np.max(delta) < 1e-8
+        for v in [FV.AMB_WS, FV.AMB_WD, FV.WS]:
+            res = pres[v].to_numpy()
+            res0 = pres0[v].to_numpy()
+            assert np.all(np.isnan(res) == np.isnan(res0))
+            delta = np.abs(res - res0)
+            if v == FV.AMB_WD:
+                delta = np.minimum(delta, 360.0 - delta)
+            print(f"CASE {pars}: points {v} max delta = {np.nanmax(delta)}")
+            assert np.nanmax(delta) < 1e-8
+
+
+def test_single_height(create_algo, create_farm):
+    states = setup_algo(create_algo, create_farm, dict(kind="linear")).states
+    z = np.full((3, 5), 90.0)
+    with pytest.raises(ValueError, match="at least two heights"):
+        states._get_stencil((np.array([90.0]),), z)
+
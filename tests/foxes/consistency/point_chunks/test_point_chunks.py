@@ -0,0 +1,38 @@
+import numpy as np
+
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def test(create_algo, create_states):
+    rng = np.random.default_rng(42)
+    points = np.zeros((300, 3))
+    points[:, 0] = rng.uniform(99500.0, 105500.0, 300)
+    points[:, 1] = rng.uniform(999500.0, 1005500.0, 300)
+    points[:, 2] = rng.uniform(30.0, 150.0, 300)
+    spoints = np.stack([points + 10.0 * si for si in range(50)])
+
+    def _create_algo(chunks):
+        return create_algo(
+            states=create_states(slice(50)),
+            wake_models=["Bastankhah_linear", "CrespoHernandez_max"],
+            chunks=chunks,
+        )
+
+    algo = _create_algo(None)
+    fres = algo.calc_farm()
+    pres0 = algo.calc_points(fres, points)
+    spres0 = algo.calc_points(fres, spoints)
+
+    for chunks in [{FC.STATE: 16}, {FC.STATE: 16, FC.POINT: 37}, {FC.POINT: 100}]:
+        print(f"\nENTERING CASE {chunks}\n")
+
+        algo = _create_algo(chunks)
+        fres = algo.calc_farm()
+        for pts, res0 in [(points, pres0), (spoints, spres0)]:
+            pres = algo.calc_points(fres, pts)
+            assert pres.sizes[FC.POINT] == pts.shape[-2]
+            for v in [FV.WS, FV.WD, FV.TI]:
+                delta = np.abs(pres[v].to_numpy() - res0[v].to_numpy())
+                print(f"CASE {chunks}: {pts.shape}, {v} max delta = {np.max(delta)}")
+                assert np.max(delta) < 1e-12
@@ -0,0 +1,49 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def test(create_algo, create_states):
+    cases = [
+        ("centre", "rotor_points", ["Bastankhah_linear_k002"]),
+        ("grid9", "rotor_points", ["Jensen_linear_k007", "CrespoHernandez_max"]),
+        ("centre", "axiwake6", ["Bastankhah_linear_k002"]),
+    ]
+
+    for rotor, pwake, wakes in cases:
+        print(f"\nENTERING CASE {(rotor, pwake, wakes)}\n")
+
+        results = {}
+        for precision in ["float64", "float32"]:
+            algo = create_algo(
+                states=create_states(slice(720)),
+                rotor_model=rotor,
+                wake_models=wakes,
+                partial_wakes_model=pwake,
+                chunks={FC.STATE: 1000},
+                precision=precision,
+            )
+
+            farm_results = algo.calc_farm()
+            assert farm_results[FV.REWS].dtype == np.dtype(precision)
+
+            o = foxes.output.FarmResultsEval(farm_results)
+            results[precision] = (farm_results, o.calc_mean_farm_power())
+
+        fres64, P64 = results["float64"]
+        fres32, P32 = results["float32"]
+
+        # rotor points at top-hat wake edges may flip between
+        # inside and outside, hence allow for rare outliers:
+        for v, lim in [(FV.REWS, 1e-3), (FV.TI, 1e-5), (FV.P, 1e-1)]:
+            delta = np.abs(fres32[v].to_numpy() - fres64[v].to_numpy())
+            n_out = np.sum(delta >= lim)
+            print(
+                f"CASE {(rotor, pwake, wakes)}: {v} max delta = {np.nanmax(delta)}, {n_out} outliers"
+            )
+            assert n_out <= 1e-3 * delta.size
+
+        print(f"CASE {(rotor, pwake, wakes)}: mean farm power {P64}, {P32}")
+        assert np.abs(P32 - P64) / P64 < 1e-5
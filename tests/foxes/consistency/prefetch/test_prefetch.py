@@ -0,0 +1,113 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import threading
+import dask
+import numpy as np
+import xarray as xr
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def write_nc(fpath, n_states=60):
+    x = np.linspace(0.0, 3000.0, 7)
+    y = np.linspace(0.0, 2000.0, 5)
+    h = np.array([0.0, 100.0, 200.0])
+    s = np.arange(n_states)
+
+    rng = np.random.default_rng(42)
+    shp = (n_states, len(h), len(y), len(x))
+    ws = 6.0 + 4.0 * rng.random(shp)
+    wd = 250.0 + 40.0 * rng.random(shp)
+    ti = 0.04 + 0.06 * rng.random(shp)
+
+    dims = ("state", "h", "y", "x")
+    xr.Dataset(
+        data_vars=dict(ws=(dims, ws), wd=(dims, wd), ti=(dims, ti)),
+        coords=dict(state=s, h=h, y=y, x=x),
+    ).to_netcdf(fpath)
+
+
+def setup_algo(create_algo, ttype, fpath, pre_load, prefetch, engine="dask"):
+    states = foxes.input.states.FieldDataNC(
+        data_source=fpath,
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2ncvar={FV.WS: "ws", FV.WD: "wd", FV.TI: "ti"},
+        fixed_vars={FV.RHO: 1.225},
+        states_coord="state",
+        x_coord="x",
+        y_coord="y",
+        h_coord="h",
+        time_format=None,
+        pre_load=pre_load,
+        prefetch=prefetch,
+        verbosity=0,
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([800.0, 600.0]),
+        step_vectors=np.array([[500.0, 0.0], [0.0, 400.0]]),
+        steps=[3, 3],
+        turbine_models=["kTI_02", ttype],
+        verbosity=0,
+    )
+
+    algo = create_algo(
+        farm=farm,
+        states=states,
+        rotor_model="grid4",
+        chunks={FC.STATE: 7},
+        engine=engine,
+        n_workers=3,
+    )
+
+    return algo, states
+
+
+def test(create_algo, ttype):
+    with TemporaryDirectory() as tdir:
+        fpath = Path(tdir) / "data.nc"
+        write_nc(fpath)
+
+        algo, __ = setup_algo(create_algo, ttype, fpath, True, 0)
+        fres0 = algo.calc_farm()
+
+        for scheduler, engine in [
+            ("synchronous", "dask"),
+            ("threads", "dask"),
+            ("synchronous", "thread"),
+        ]:
+            with dask.config.set(scheduler=scheduler):
+                for prefetch in [0, 2, 3]:
+                    case = (scheduler, engine, prefetch)
+                    print(f"\nENTERING CASE {case}\n")
+
+                    algo, states = setup_algo(
+                        create_algo, ttype, fpath, False, prefetch, engine
+                    )
+                    loads = []
+                    load_slice = states._load_slice
+
+                    def _load_slice(i0, i1):
+                        name = threading.current_thread().name
+                        loads.append(((i0, i1), name.startswith("Prefetcher")))
+                        return load_slice(i0, i1)
+
+                    states._load_slice = _load_slice
+
+                    fres = algo.calc_farm()
+                    for v in [FV.REWS, FV.TI, FV.P]:
+                        delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+                        print(f"CASE {case}: {v} max delta = {np.max(delta)}")
+                        assert np.max(delta) < 1e-12
+
+                    n_pre = sum(p for __, p in loads)
+                    print(f"CASE {case}: {len(loads)} loads, {n_pre} prefetched")
+                    if prefetch > 0:
+                        assert len(loads) == len(set(s for s, __ in loads))
+                        assert n_pre > 0
+                    else:
+                        assert n_pre == 0
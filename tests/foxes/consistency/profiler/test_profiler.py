@@ -0,0 +1,50 @@
+import tracemalloc
+import pytest
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def setup_algo(create_algo, engine, profiler=None):
+    return create_algo(chunks={FC.STATE: 25}, engine=engine, profiler=profiler)
+
+
+def test(create_algo):
+    fres0 = setup_algo(create_algo, "dask").calc_farm()
+
+    for engine, memory in [("dask", True), ("numpy", True), ("thread", False)]:
+        print(f"\nENTERING CASE {(engine, memory)}\n")
+
+        profiler = foxes.utils.Profiler(memory=memory)
+        fres = setup_algo(create_algo, engine, profiler).calc_farm()
+        assert not tracemalloc.is_tracing()
+
+        for v in [FV.REWS, FV.TI, FV.P]:
+            delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+            print(f"CASE {(engine, memory)}: {v} max delta = {np.max(delta)}")
+            assert np.max(delta) < 1e-12
+
+        summary = profiler.summary()
+        print(summary)
+        assert len(summary.index)
+        assert np.all(summary["calls"] > 0)
+        if memory:
+            assert np.all(summary["peak_bytes"] >= 0)
+        else:
+            assert np.all(summary["peak_bytes"].isna())
+
+    with pytest.raises(ValueError):
+        setup_algo(create_algo, "thread", foxes.utils.Profiler(memory=True))
+
+
+def test_no_reset_peak(create_algo, monkeypatch):
+    monkeypatch.delattr(tracemalloc, "reset_peak", raising=False)
+    with pytest.warns(UserWarning):
+        profiler = foxes.utils.Profiler(memory=True)
+    assert not profiler.memory
+
+    fres = setup_algo(create_algo, "thread", profiler).calc_farm()
+    assert len(fres[FV.P])
+    assert np.all(profiler.summary()["peak_bytes"].isna())
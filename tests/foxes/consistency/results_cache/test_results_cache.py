@@ -0,0 +1,75 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import os
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+
+
+def create_states(data_source):
+    return foxes.input.states.StatesTable(
+        data_source=data_source,
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+    )
+
+
+def calc(create_algo, sdata, points, cache=None):
+    algo = create_algo(states=create_states(sdata), cache=cache)
+    fres = algo.calc_farm()
+    pres = algo.calc_points(fres, points)
+    return fres.load(), pres.load()
+
+
+def check(res, res0, vrs, case):
+    for v in vrs:
+        delta = np.abs(res[v].to_numpy() - res0[v].to_numpy())
+        print(f"CASE {case}: {v} max delta = {np.max(delta)}")
+        assert np.max(delta) < 1e-12
+
+
+def test(create_algo, states_data):
+    sdata = states_data(slice(50))
+    sdata2 = sdata.copy()
+    sdata2[FV.WS] += 1.0
+
+    points = np.zeros((100, 3))
+    points[:, 0] = np.linspace(99500.0, 105500.0, 100)
+    points[:, 1] = 1002500.0
+    points[:, 2] = 90.0
+
+    with TemporaryDirectory() as tdir:
+        cache = foxes.utils.ResultsCache(tdir)
+
+        for case, sd, n_files in [
+            ("store", sdata, 2),
+            ("load", sdata, 2),
+            ("changed", sdata2, 4),
+        ]:
+            print(f"\nENTERING CASE {case}\n")
+
+            fres0, pres0 = calc(create_algo, sd, points)
+            fres, pres = calc(create_algo, sd, points, cache)
+            print(f"CASE {case}: {len(list(Path(tdir).iterdir()))} cached files")
+            assert len(list(Path(tdir).iterdir())) == n_files
+
+            check(fres, fres0, [FV.REWS, FV.TI, FV.P], case)
+            check(pres, pres0, [FV.WS, FV.TI], case)
+
+
+def test_file_source(states_data):
+    with TemporaryDirectory() as tdir:
+        fpath = Path(tdir) / "states.csv"
+        states_data(slice(50)).to_csv(fpath)
+        cache = foxes.utils.ResultsCache(Path(tdir) / "cache")
+
+        key0 = cache.key(create_states(fpath))
+        assert cache.key(create_states(fpath)) == key0
+        assert cache.key(create_states(str(fpath))) == cache.key(
+            create_states(str(fpath))
+        )
+
+        st = os.stat(fpath)
+        states_data(slice(1, 51)).to_csv(fpath)
+        os.utime(fpath, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert cache.key(create_states(fpath)) != key0
@@ -0,0 +1,28 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+from foxes.algorithms.iterative.models import ConvVarDelta
+
+
+def calc(create_algo, create_states, state_masking):
+    algo = create_algo(
+        foxes.algorithms.Iterative,
+        states=create_states(slice(None, None, 50)),
+        wake_models=["Bastankhah_linear", "CrespoHernandez_max"],
+        conv=ConvVarDelta({FV.REWS: 1e-8, FV.TI: 1e-10, FV.CT: 1e-10}),
+        max_its=200,
+        state_masking=state_masking,
+    )
+
+    return algo.calc_farm()
+
+
+def test(create_algo, create_states):
+    fres0 = calc(create_algo, create_states, False)
+    fres = calc(create_algo, create_states, True)
+
+    for v in [FV.REWS, FV.TI, FV.CT, FV.P]:
+        delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+        print(f"{v} max delta = {np.max(delta)}")
+        assert np.max(delta) < 1e-5
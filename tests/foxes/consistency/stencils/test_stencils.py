@@ -0,0 +1,143 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from concurrent.futures import ThreadPoolExecutor
+from scipy.interpolate import RegularGridInterpolator
+import numpy as np
+import xarray as xr
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+from foxes.utils import wd2uv, uv2wd
+
+
+def write_nc(fpath, n_states=20):
+    x = np.linspace(0.0, 3000.0, 7)
+    y = np.linspace(0.0, 2000.0, 5)
+    h = np.array([0.0, 100.0, 200.0])
+    s = np.arange(n_states)
+
+    rng = np.random.default_rng(42)
+    shp = (n_states, len(h), len(y), len(x))
+    ws = 6.0 + 4.0 * rng.random(shp)
+    wd = 250.0 + 40.0 * rng.random(shp)
+    ti = 0.04 + 0.06 * rng.random(shp)
+
+    dims = ("state", "h", "y", "x")
+    ds = xr.Dataset(
+        data_vars=dict(ws=(dims, ws), wd=(dims, wd), ti=(dims, ti)),
+        coords=dict(state=s, h=h, y=y, x=x),
+    )
+    ds.to_netcdf(fpath)
+
+    return ds
+
+
+def setup_algo(create_algo, ttype, fpath, pre_load):
+    states = foxes.input.states.FieldDataNC(
+        data_source=fpath,
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2ncvar={FV.WS: "ws", FV.WD: "wd", FV.TI: "ti"},
+        fixed_vars={FV.RHO: 1.225},
+        states_coord="state",
+        x_coord="x",
+        y_coord="y",
+        h_coord="h",
+        time_format=None,
+        pre_load=pre_load,
+        verbosity=0,
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([800.0, 600.0]),
+        step_vectors=np.array([[500.0, 0.0], [0.0, 400.0]]),
+        steps=[2, 2],
+        turbine_models=["kTI_02", ttype],
+        verbosity=0,
+    )
+
+    return create_algo(farm=farm, states=states, chunks={FC.STATE: 6})
+
+
+def reference(ds, points):
+    """Trilinear interpolation of ti and the wind vector"""
+    n_states = ds.sizes["state"]
+    if len(points.shape) == 2:
+        points = np.broadcast_to(points[None], (n_states,) + points.shape)
+    uv = wd2uv(ds["wd"].to_numpy(), ds["ws"].to_numpy(), axis=-1)
+    grid = (ds["h"].to_numpy(), ds["y"].to_numpy(), ds["x"].to_numpy())
+
+    ti = np.zeros(points.shape[:2])
+    ruv = np.zeros(points.shape[:2] + (2,))
+    for si in range(n_states):
+        qts = points[si][:, ::-1]
+        ti[si] = RegularGridInterpolator(grid, ds["ti"].to_numpy()[si])(qts)
+        ruv[si] = RegularGridInterpolator(grid, uv[si])(qts)
+
+    return np.linalg.norm(ruv, axis=-1), uv2wd(ruv, axis=-1), ti
+
+
+def test(create_algo, ttype):
+    rng = np.random.default_rng(7)
+    points = np.zeros((150, 3))
+    points[:, 0] = rng.uniform(0.0, 3000.0, 150)
+    points[:, 1] = rng.uniform(0.0, 2000.0, 150)
+    points[:, 2] = rng.uniform(0.0, 200.0, 150)
+    spoints = points[None] + rng.uniform(-5.0, 5.0, (20, 150, 3))
+    spoints = np.clip(spoints, 0.0, [3000.0, 2000.0, 200.0])
+
+    with TemporaryDirectory() as tdir:
+        fpath = Path(tdir) / "data.nc"
+        ds = write_nc(fpath)
+
+        for pre_load in [True, False]:
+            algo = setup_algo(create_algo, ttype, fpath, pre_load)
+            fres = algo.calc_farm()
+
+            for pts in [points, spoints, points]:
+                case = (pre_load, pts.shape)
+                print(f"\nENTERING CASE {case}\n")
+
+                pres = algo.calc_points(fres, pts)
+                for v, ref in zip(
+                    [FV.AMB_WS, FV.AMB_WD, FV.AMB_TI], reference(ds, pts)
+                ):
+                    delta = np.abs(pres[v].to_numpy() - ref)
+                    if v == FV.AMB_WD:
+                        delta = np.minimum(delta, 360.0 - delta)
+                    print(f"CASE {case}: {v} max delta = {np.max(delta)}")
+                    assert np.max(delta) < 1e-8
+
+
+def test_cache():
+    calls = []
+
+    def calc(grid, points):
+        calls.append(points.shape)
+        return grid[0][0] + points
+
+    cache = foxes.utils.StencilCache(max_size=2)
+    pts = np.broadcast_to(np.arange(3.0)[None], (5, 3))
+    g0 = (np.array([0.0, 1.0]),)
+    g1 = (np.array([10.0, 11.0]),)
+
+    assert np.all(cache.get(g0, pts, calc) == pts[0])
+    assert np.all(cache.get(g1, pts, calc) == 10.0 + pts[0])
+    assert np.all(cache.get(g0, pts.copy(), calc) == pts[0])
+    assert calls == [(3,), (3,)]
+
+    spts = pts + np.arange(5.0)[:, None]
+    assert np.all(cache.get(g0, spts, calc) == spts)
+    assert np.all(cache.get(g0, spts, calc) == spts)
+    assert calls == [(3,), (3,), (5, 3), (5, 3)]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(cache.get, (np.array([float(i % 3)]),), pts, calc)
+            for i in range(30)
+        ]
+        for i, f in enumerate(futures):
+            assert np.all(f.result() == i % 3 + pts[0])
+
@@ -0,0 +1,31 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from importlib.util import find_spec
+import numpy as np
+
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def test(create_algo):
+    fres0 = create_algo().calc_farm()
+
+    fnames = ["results.nc"]
+    if find_spec("zarr") is not None:
+        fnames.append("results.zarr")
+
+    with TemporaryDirectory() as tdir:
+        for fname in fnames:
+            print(f"\nENTERING CASE {fname}\n")
+
+            fpath = Path(tdir) / fname
+            fres = create_algo().calc_farm(out_file=fpath)
+            assert fpath.exists()
+            assert fres.sizes[FC.STATE] == fres0.sizes[FC.STATE]
+
+            for v in [FV.REWS, FV.TI, FV.CT, FV.P, FV.WEIGHT]:
+                delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+                print(f"CASE {fname}: {v} max delta = {np.max(delta)}")
+                assert np.max(delta) < 1e-12
+
+            fres.close()
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+import foxes
+import foxes.variables as FV
+
+
+def calc(create_algo, create_mbook, wake_model, pwake, points):
+    mbook = create_mbook()
+    mbook.wake_models["wake"] = wake_model
+
+    algo = create_algo(
+        mbook=mbook,
+        rotor_model="grid9",
+        wake_models=["wake", "CrespoHernandez_max"],
+        partial_wakes_model=pwake,
+    )
+    fres = algo.calc_farm()
+
+    return fres, algo.calc_points(fres, points)
+
+
+@pytest.mark.parametrize("pwake", ["rotor_points", "grid16"])
+@pytest.mark.parametrize(
+    "wake_type,wpars",
+    [
+        (foxes.models.wake_models.wind.BastankhahWake, {}),
+        (foxes.models.wake_models.wind.TurbOParkWake, dict(A=0.04)),
+    ],
+)
+def test(create_algo, create_mbook, wake_type, wpars, pwake):
+    rng = np.random.default_rng(42)
+    points = np.zeros((500, 3))
+    points[:, 0] = rng.uniform(101000.0, 109000.0, 500)
+    points[:, 1] = rng.uniform(1000000.0, 1008000.0, 500)
+    points[:, 2] = rng.uniform(20.0, 200.0, 500)
+
+    fres0, pres0 = calc(
+        create_algo,
+        create_mbook,
+        wake_type(superposition="linear", **wpars),
+        pwake,
+        points,
+    )
+
+    for reach_sigmas, lim in [(8.0, 1e-10), (1.0, None)]:
+        print(f"\nENTERING CASE {(wake_type.__name__, pwake, reach_sigmas)}\n")
+
+        fres, pres = calc(
+            create_algo,
+            create_mbook,
+            wake_type(superposition="linear", reach_sigmas=reach_sigmas, **wpars),
+            pwake,
+            points,
+        )
+
+        dfarm = np.max(np.abs(fres[FV.REWS].to_numpy() - fres0[FV.REWS].to_numpy()))
+        dpts = np.max(np.abs(pres[FV.WS].to_numpy() - pres0[FV.WS].to_numpy()))
+        print(f"REWS max delta = {dfarm}, WS max delta = {dpts}")
+
+        # culling at a single sigma has to change the results,
+        # as proof that culling is active:
+        if lim is None:
+            assert dfarm > 1e-3 and dpts > 1e-3
+        else:
+            assert dfarm < lim and dpts < lim
@@ -0,0 +1,94 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+from foxes.algorithms.iterative.models import ConvVarDelta
+
+
+def setup_algo(fixtures, algo_type, yawm=None):
+    create_algo, create_mbook, create_farm, create_states, ttype = fixtures
+
+    mbook = create_mbook()
+    tmodels = ["kTI_02", ttype]
+    wakes = ["Bastankhah_linear", "CrespoHernandez_max"]
+    frame = "rotor_wd"
+    if yawm is not None:
+        mbook.turbine_models["set_yawm"] = foxes.models.turbine_models.SetFarmVars()
+        mbook.turbine_models["set_yawm"].add_var(FV.YAWM, yawm)
+        tmodels = ["set_yawm", "yawm2yaw"] + tmodels
+        wakes = ["PorteAgel_linear", "CrespoHernandez_max"]
+        frame = "yawed"
+
+    pars = dict(
+        mbook=mbook,
+        farm=create_farm(tmodels),
+        states=create_states(slice(None, None, 50)),
+        wake_models=wakes,
+        wake_frame=frame,
+    )
+    if algo_type is foxes.algorithms.Iterative:
+        pars.update(
+            conv=ConvVarDelta({FV.REWS: 1e-8, FV.TI: 1e-10, FV.CT: 1e-10}),
+            max_its=200,
+        )
+
+    return create_algo(algo_type, **pars)
+
+
+def n_sweeps(algo):
+    return algo.profiler.summary().loc["calc_wakes", "calls"]
+
+
+def test(create_algo, create_mbook, create_farm, create_states, ttype):
+    fixtures = (create_algo, create_mbook, create_farm, create_states, ttype)
+
+    algo = setup_algo(fixtures, foxes.algorithms.Iterative)
+    algo.profiler = foxes.utils.Profiler(memory=False)
+    fres0 = algo.calc_farm()
+    n0 = n_sweeps(algo)
+    fres_dw = setup_algo(fixtures, foxes.algorithms.Downwind).calc_farm()
+
+    for case, init_results in [("converged", fres0), ("downwind", fres_dw)]:
+        print(f"\nENTERING CASE {case}\n")
+
+        algo = setup_algo(fixtures, foxes.algorithms.Iterative)
+        algo.profiler = foxes.utils.Profiler(memory=False)
+        fres = algo.calc_farm(init_results=init_results)
+        print(f"CASE {case}: {n_sweeps(algo)} sweeps, cold start {n0}")
+        assert n_sweeps(algo) < n0
+
+        for v in [FV.REWS, FV.TI, FV.CT, FV.P]:
+            delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+            print(f"CASE {case}: {v} max delta = {np.max(delta)}")
+            assert np.max(delta) < 1e-5
+
+
+def test_changed_settings(create_algo, create_mbook, create_farm, create_states, ttype):
+    fixtures = (create_algo, create_mbook, create_farm, create_states, ttype)
+
+    n_states = 60
+    n_turbines = 32
+    algos = {}
+    fres = {}
+    for yawm in [0.0, 30.0]:
+        yawms = np.full((n_states, n_turbines), yawm, dtype=FC.DTYPE)
+        algos[yawm] = setup_algo(fixtures, foxes.algorithms.Iterative, yawms)
+        algos[yawm].profiler = foxes.utils.Profiler(memory=False)
+        fres[yawm] = algos[yawm].calc_farm()
+    n0 = n_sweeps(algos[30.0])
+
+    yawms = np.full((n_states, n_turbines), 30.0, dtype=FC.DTYPE)
+    algo = setup_algo(fixtures, foxes.algorithms.Iterative, yawms)
+    algo.profiler = foxes.utils.Profiler(memory=False)
+    fres1 = algo.calc_farm(init_results=fres[0.0])
+    print(f"CHANGED: {n_sweeps(algo)} sweeps, cold start {n0}")
+
+    delta = np.abs(fres[30.0][FV.P].to_numpy() - fres[0.0][FV.P].to_numpy())
+    assert np.max(delta) > 1.0
+
+    for v in [FV.YAWM, FV.REWS, FV.TI, FV.CT, FV.P]:
+        delta = np.abs(fres1[v].to_numpy() - fres[30.0][v].to_numpy())
+        print(f"CHANGED: {v} max delta = {np.max(delta)}")
+        assert np.max(delta) < 1e-5
+
@@ -0,0 +1,78 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+
+
+def test(create_algo, create_farm, farm_data, ttype):
+    models = ["kTI_02", ttype]
+    ldata = farm_data()
+    ldata["H"] = np.linspace(80.0, 120.0, len(ldata.index))
+
+    # columnar farm, from vectorized layout input:
+    farm0 = foxes.WindFarm()
+    foxes.input.farm_layout.add_from_df(
+        farm0, ldata, col_name="label", col_H="H", turbine_models=models, verbosity=0
+    )
+
+    # farm from individual turbine objects:
+    farm1 = foxes.WindFarm()
+    for i, r in ldata.iterrows():
+        farm1.add_turbine(
+            foxes.Turbine(
+                xy=r[["x", "y"]].to_numpy(),
+                turbine_models=models,
+                index=i,
+                name=r["label"],
+                H=r["H"],
+            ),
+            verbosity=0,
+        )
+
+    assert isinstance(farm1.turbines, list)
+    assert farm0.n_turbines == farm1.n_turbines
+    assert np.all(farm0.xy == farm1.xy)
+    assert np.all(farm0.H == farm1.H)
+    assert np.all(farm0.model_ids == farm1.model_ids)
+    for t in farm0.turbines:
+        assert np.all(t.xy == farm0.xy[t.index])
+        assert t.models == models
+
+    # turbines are views of the farm data:
+    t = farm1.turbines[3]
+    t.H = 150.0
+    assert farm1.H[3] == 150.0
+    t.H = ldata["H"].iloc[3]
+
+    fres0 = create_algo(farm=farm0, rotor_model="grid9").calc_farm()
+    fres1 = create_algo(farm=farm1, rotor_model="grid9").calc_farm()
+
+    for v in [FV.H, FV.REWS, FV.TI, FV.P]:
+        delta = np.abs(fres0[v].to_numpy() - fres1[v].to_numpy())
+        print(f"{v}: max delta = {np.max(delta)}")
+        assert np.max(delta) < 1e-10
+
+
+def test_list(farm_data, ttype):
+    ldata = farm_data()
+    farm = foxes.WindFarm()
+    for i, r in ldata.iterrows():
+        farm.turbines.append(
+            foxes.Turbine(xy=r[["x", "y"]].to_numpy(), turbine_models=[ttype])
+        )
+    assert farm.n_turbines == len(ldata.index)
+    assert np.all(farm.xy == ldata[["x", "y"]].to_numpy())
+    assert np.all(np.isnan(farm.H))
+    assert np.all(farm.turbines[5].xy == farm.xy[5])
+
+    farm.turbines[5].H = 100.0
+    farm.turbines = farm.turbines[4:8]
+    assert farm.n_turbines == 4
+    assert np.all(farm.xy == ldata[["x", "y"]].to_numpy()[4:8])
+    assert farm.H[1] == 100.0
+    assert farm.turbines[1].H == 100.0
+
+    del farm.turbines[0]
+    assert farm.H[0] == 100.0
+    assert farm.turbines[0].H == 100.0
+    assert farm.n_turbines == 3
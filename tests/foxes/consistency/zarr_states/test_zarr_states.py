@@ -0,0 +1,148 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import pytest
+import numpy as np
+import xarray as xr
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def write_data(tdir, n_states=40):
+    x = np.linspace(0.0, 3000.0, 7)
+    y = np.linspace(0.0, 2000.0, 5)
+    h = np.array([0.0, 100.0, 200.0])
+    s = np.arange(n_states)
+
+    rng = np.random.default_rng(42)
+    shp = (n_states, len(h), len(y), len(x))
+    ws = 6.0 + 4.0 * rng.random(shp)
+    wd = 250.0 + 40.0 * rng.random(shp)
+    ti = 0.04 + 0.06 * rng.random(shp)
+
+    dims = ("state", "h", "y", "x")
+    ds = xr.Dataset(
+        data_vars=dict(ws=(dims, ws), wd=(dims, wd), ti=(dims, ti)),
+        coords=dict(state=s, h=h, y=y, x=x),
+    )
+
+    ncfile = Path(tdir) / "data.nc"
+    ds.to_netcdf(ncfile)
+
+    zfile = Path(tdir) / "data.zarr"
+    ds.chunk({"state": 8}).to_zarr(zfile)
+
+    return ncfile, zfile
+
+
+class FixedEstimate(foxes.algorithms.Downwind):
+    def estimate_state_bytes(self, n_points=None, point_vars=None):
+        return 1000
+
+
+def setup_algo(
+    create_algo,
+    ttype,
+    states_type,
+    fpath,
+    chunks,
+    algo_type=foxes.algorithms.Downwind,
+    **kwargs,
+):
+    states = states_type(
+        data_source=fpath,
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2ncvar={FV.WS: "ws", FV.WD: "wd", FV.TI: "ti"},
+        fixed_vars={FV.RHO: 1.225},
+        states_coord="state",
+        x_coord="x",
+        y_coord="y",
+        h_coord="h",
+        time_format=None,
+        verbosity=0,
+        **kwargs,
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([800.0, 600.0]),
+        step_vectors=np.array([[500.0, 0.0], [0.0, 400.0]]),
+        steps=[3, 3],
+        turbine_models=["kTI_02", ttype],
+        verbosity=0,
+    )
+
+    algo = create_algo(
+        algo_type,
+        farm=farm,
+        states=states,
+        rotor_model="grid4",
+        chunks=chunks,
+        mem_budget=13000,
+    )
+
+    return algo, states
+
+
+def test(create_algo, ttype):
+    pytest.importorskip("zarr")
+
+    points = np.zeros((100, 3))
+    points[:, 0] = np.linspace(0.0, 3000.0, 100)
+    points[:, 1] = 1000.0
+    points[:, 2] = 120.0
+
+    with TemporaryDirectory() as tdir:
+        ncfile, zfile = write_data(tdir)
+
+        algo, __ = setup_algo(
+            create_algo, ttype, foxes.input.states.FieldDataNC, ncfile, None
+        )
+        fres0 = algo.calc_farm()
+        pres0 = algo.calc_points(fres0, points)
+
+        for pre_load in [False, True]:
+            print(f"\nENTERING CASE {pre_load}\n")
+
+            algo, states = setup_algo(
+                create_algo,
+                ttype,
+                foxes.input.states.FieldDataZarr,
+                zfile,
+                "auto",
+                algo_type=FixedEstimate,
+                pre_load=pre_load,
+            )
+            assert states.storage_chunk_size() == 8
+
+            fres = algo.calc_farm()
+            print(f"CASE {pre_load}: chunks = {algo.chunks}")
+            assert algo.chunks[FC.STATE] == 8
+            pres = algo.calc_points(fres, points)
+
+            for v in [FV.REWS, FV.TI, FV.P]:
+                delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+                print(f"CASE {pre_load}: farm {v} max delta = {np.max(delta)}")
+                assert np.max(delta) < 1e-12
+            for v in [FV.WS, FV.WD, FV.TI]:
+                delta = np.abs(pres[v].to_numpy() - pres0[v].to_numpy())
+                print(f"CASE {pre_load}: points {v} max delta = {np.max(delta)}")
+                assert np.max(delta) < 1e-10
+
+        algo, __ = setup_algo(
+            create_algo,
+            ttype,
+            foxes.input.states.FieldDataZarr,
+            zfile,
+            {FC.STATE: 10},
+        )
+        with pytest.warns(UserWarning, match="storage chunk size 8"):
+            fres = algo.calc_farm()
+        assert algo.chunks[FC.STATE] == 10
+
+        for v in [FV.REWS, FV.TI, FV.P]:
+            delta = np.abs(fres[v].to_numpy() - fres0[v].to_numpy())
+            print(f"CASE unaligned: farm {v} max delta = {np.max(delta)}")
+            assert np.max(delta) < 1e-12